@@ -1,30 +1,122 @@
 """Entry point for the A-Maze-ing project."""
 from __future__ import annotations
 import argparse
+import asyncio
+import logging
 import random
+import sys
 from pathlib import Path
 from typing import cast
 from src.a_maze_ing.core.parsing import check_config_mandatory
+from src.a_maze_ing.core.parsing import check_pattern_overlap
 from src.a_maze_ing.core.parsing import parse_config
 from src.a_maze_ing.core.types import MazeConfig
-from src.a_maze_ing.algorithms.dfs import generate_dfs
-from src.a_maze_ing.algorithms.kruskal import generate_kruskal
-from src.a_maze_ing.algorithms.wilson import generate_wilson
-from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.eller import stream_eller_hex
+from src.a_maze_ing.algorithms.grid_utils import config_storage
+from src.a_maze_ing.algorithms.grid_utils import warn_pattern_skipped
+from src.a_maze_ing.io.http_server import serve_http
 from src.a_maze_ing.io.output import write_output_file
-from src.a_maze_ing.core.parsing import ParsingError
-from src.a_maze_ing.maze.flaw import flaw_maze
+from src.a_maze_ing.io.output import write_output_stream
+from src.a_maze_ing.io.stdio_server import serve_stdio
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.storage import allocate_grid, parse_storage_spec
+from src.a_maze_ing.maze.batch import MANIFEST_NAME, generate_maze
+from src.a_maze_ing.maze.batch import write_batch
+
+
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command line value.
+
+    Args:
+        value: Raw option value.
+
+    Returns:
+        Parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected a positive integer, got {value!r}"
+        )
+    return number
 
 
 def main() -> int:
     """Run the CLI entry point for the project."""
+    logging.basicConfig(format="%(levelname)s: %(message)s")
     parser = argparse.ArgumentParser(prog="a_maze_ing")
     parser.add_argument(
         "config",
         nargs="?",
         help="Path to the maze configuration file",
     )
+    parser.add_argument(
+        "--storage",
+        help="Grid storage backend, 'memory' or 'mmap:PATH' "
+             "(overrides the STORAGE config key)",
+    )
+    parser.add_argument(
+        "--serve-stdio",
+        action="store_true",
+        help="Answer JSON-lines maze requests from stdin on stdout "
+             "instead of reading a config file",
+    )
+    parser.add_argument(
+        "--serve-http",
+        type=int,
+        metavar="PORT",
+        help="Serve mazes over HTTP on PORT instead of reading a config "
+             "file",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address the HTTP service binds (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes in batch and service modes "
+             "(default: 1)",
+    )
+    batch = parser.add_argument_group(
+        "batch mode",
+        "Write one maze per seed, SEED_START to SEED_START + COUNT - 1, "
+        "into OUT_DIR, along with a manifest."
+    )
+    batch.add_argument(
+        "--count",
+        type=_positive_int,
+        help="Number of mazes to generate (enables batch mode)",
+    )
+    batch.add_argument(
+        "--seed-start",
+        type=int,
+        help="First seed (default: the SEED config key, or 0)",
+    )
+    batch.add_argument(
+        "--out-dir",
+        default=".",
+        help="Directory of the output files (default: current directory)",
+    )
     args = parser.parse_args()
+    if args.serve_stdio:
+        serve_stdio(sys.stdin, sys.stdout, args.jobs)
+        return 0
+    if args.serve_http is not None:
+        try:
+            asyncio.run(serve_http(args.host, args.serve_http, args.jobs))
+        except KeyboardInterrupt:
+            pass
+        return 0
     if not args.config:
         print("No config file provided. "
               "Usage: python a_maze_ing.py [CONFIG_FILE].")
@@ -36,33 +128,25 @@ def main() -> int:
     try:
         config = parse_config(str(config_path))
         check_config_mandatory(config)
+        if args.storage is not None:
+            parse_storage_spec(args.storage)
+            config["STORAGE"] = args.storage
         # After validation, we know all required values are present and valid.
         validated_config: MazeConfig = cast(MazeConfig, config)
 
         gui_enabled = bool(validated_config.get("GUI", False))
         animations_enabled = bool(validated_config.get("ANIMATIONS", True))
 
-        # Narrow SEED to int before passing to int() / random.seed().
+        # Narrow SEED to int before seeding the generator.
         raw_seed = validated_config.get("SEED", random.randrange(2**32))
         seed: int = raw_seed if isinstance(raw_seed, int) \
             else random.randrange(2**32)
-        random.seed(seed)
-
-        algorithm = validated_config.get("ALGORITHM", "DFS")
-        assert isinstance(algorithm, str)
-        if algorithm.upper() == "KRUSKAL":
-            maze = generate_kruskal(validated_config)
-        elif algorithm.upper() == "WILSON":
-            maze = generate_wilson(validated_config)
-        else:
-            maze = generate_dfs(validated_config)
-
-        ft_pattern = where_is_ft_pattern(maze)
-        if validated_config["ENTRY"] in ft_pattern:
-            raise ParsingError("Entry overlaps the 42 pattern.")
-        if validated_config["EXIT"] in ft_pattern:
-            raise ParsingError("Exit overlaps the 42 pattern.")
+        rng = SplitMixRandom(seed)
 
+        width = validated_config["WIDTH"]
+        assert isinstance(width, int)
+        height = validated_config["HEIGHT"]
+        assert isinstance(height, int)
         output_file = validated_config["OUTPUT_FILE"]
         assert isinstance(output_file, str)
         entry = validated_config["ENTRY"]
@@ -70,14 +154,54 @@ def main() -> int:
         exit_pos = validated_config["EXIT"]
         assert isinstance(exit_pos, tuple)
 
-        if not bool(validated_config.get("PERFECT", True)):
-            flaw_maze(maze)
+        check_pattern_overlap(validated_config)
+
+        if args.count is not None:
+            seed_start = args.seed_start
+            if seed_start is None:
+                config_seed = validated_config.get("SEED", 0)
+                seed_start = config_seed if isinstance(config_seed, int) \
+                    else 0
+            seeds = range(seed_start, seed_start + args.count)
+            write_batch(validated_config, seeds, args.out_dir, args.jobs)
+            print(f"Wrote {args.count} mazes and {MANIFEST_NAME} "
+                  f"to {args.out_dir}")
+            return 0
+
+        warn_pattern_skipped([validated_config])
+        algorithm = validated_config.get("ALGORITHM", "DFS")
+        perfect = bool(validated_config.get("PERFECT", True))
+        tiled = "TILE_SIZE" in validated_config
+        if algorithm == "ELLER" and perfect and not gui_enabled \
+                and not tiled:
+            # Rows reach the output file as soon as they are generated;
+            # the grid copy is only read back to solve the maze.
+            maze = allocate_grid(
+                width, height, config_storage(validated_config)
+            )
+            try:
+                write_output_stream(
+                    output_file,
+                    stream_eller_hex(validated_config, maze, rng),
+                    entry,
+                    exit_pos,
+                    lambda: a_star(entry, exit_pos, maze)
+                )
+            finally:
+                maze.close()
+            return 0
+
+        maze = generate_maze(validated_config, rng)
         write_output_file(output_file, maze, entry, exit_pos)
 
         if gui_enabled:
             from src.a_maze_ing.ui.gui import GUI
             gui_maze = None if animations_enabled else maze
+            if gui_maze is None:
+                # The GUI generates its own mazes on the same storage.
+                maze.close()
             GUI(validated_config, maze=gui_maze, seed=seed)
+        maze.close()
     except OSError as e:
         print(f"Error when writing into file : {e}")
     except Exception as e:
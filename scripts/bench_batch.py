@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch generation and solving across worker threads.
+
+The same batch of mazes is generated, then solved, with each worker count;
+the best wall-clock time of each stage is printed with its speedup over a
+single worker. Threads only scale on free-threaded Python builds (e.g.
+python3.13t); with the GIL enabled the speedup stays close to 1.
+
+Usage:
+    python scripts/bench_batch.py [--workers 1 2 4 8] [--count 32]
+        [--size 100] [--algorithm DFS] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.a_maze_ing.core.types import MazeConfig  # noqa: E402
+from src.a_maze_ing.maze.batch import (  # noqa: E402
+    generate_many,
+    solve_many
+)
+from collections.abc import Callable  # noqa: E402
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    """Return the best wall-clock time of several runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print one line per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[1, 2, 4, 8])
+    parser.add_argument("--count", type=int, default=32)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--algorithm", default="DFS")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config: MazeConfig = {
+        "WIDTH": args.size,
+        "HEIGHT": args.size,
+        "ENTRY": (0, 0),
+        "ALGORITHM": args.algorithm,
+    }
+    configs = [config] * args.count
+    corner = (args.size - 1, args.size - 1)
+    tasks = [
+        (grid, (0, 0), corner) for grid in generate_many(configs, seed=0)
+    ]
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"GIL {'enabled' if is_gil_enabled() else 'disabled'}")
+    print(f"{'workers':>7} {'generate (s)':>13} {'speedup':>8} "
+          f"{'solve (s)':>10} {'speedup':>8}")
+    base_generate = base_solve = 0.0
+    for workers in args.workers:
+        generate = best_time(
+            lambda: generate_many(configs, seed=0, workers=workers),
+            args.repeat
+        )
+        solve = best_time(
+            lambda: solve_many(tasks, workers=workers), args.repeat
+        )
+        base_generate = base_generate or generate
+        base_solve = base_solve or solve
+        print(f"{workers:>7} {generate:>13.4f} "
+              f"{base_generate / generate:>7.2f}x {solve:>10.4f} "
+              f"{base_solve / solve:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark solving on the junction graph against A* on the full grid.
+
+One maze per algorithm and PERFECT value is contracted into its junction
+graph; the script prints the compression ratio of each maze (open cells
+per graph node), the build time, and the time of the same random queries
+solved on the graph and with a_star.
+
+Usage:
+    python scripts/bench_junctions.py [--size 300] [--queries 20]
+        [--seed 0] [--algorithms DFS KRUSKAL WILSON PRIM]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.a_maze_ing.algorithms.a_star import a_star  # noqa: E402
+from src.a_maze_ing.algorithms.junction_graph import (  # noqa: E402
+    JunctionGraph
+)
+from src.a_maze_ing.core.rng import SplitMixRandom  # noqa: E402
+from src.a_maze_ing.maze.batch import generate_maze  # noqa: E402
+
+
+def main() -> None:
+    """Run the benchmark and print one line per maze."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithms", nargs="+",
+                        default=["DFS", "KRUSKAL", "WILSON", "PRIM"])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'algorithm':>12} {'perfect':>7} {'nodes':>8} {'ratio':>6} "
+          f"{'build (s)':>10} {'graph (s)':>10} {'a_star (s)':>11}")
+    for algorithm in args.algorithms:
+        for perfect in (True, False):
+            grid = generate_maze({
+                "WIDTH": args.size,
+                "HEIGHT": args.size,
+                "ENTRY": (0, 0),
+                "ALGORITHM": algorithm,
+                "PERFECT": perfect,
+            }, SplitMixRandom(args.seed))
+            rng = SplitMixRandom(args.seed + 1)
+            queries = [
+                ((rng.randrange(args.size), rng.randrange(args.size)),
+                 (rng.randrange(args.size), rng.randrange(args.size)))
+                for _ in range(args.queries)
+            ]
+
+            start = time.perf_counter()
+            graph = JunctionGraph(grid)
+            build = time.perf_counter() - start
+            start = time.perf_counter()
+            for entry, exit_pos in queries:
+                graph.path(entry, exit_pos)
+            on_graph = time.perf_counter() - start
+            start = time.perf_counter()
+            for entry, exit_pos in queries:
+                a_star(entry, exit_pos, grid)
+            on_grid = time.perf_counter() - start
+            print(f"{algorithm:>12} {str(perfect):>7} "
+                  f"{len(graph.nodes):>8} "
+                  f"{graph.compression_ratio:>5.1f}x {build:>10.4f} "
+                  f"{on_graph:>10.4f} {on_grid:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
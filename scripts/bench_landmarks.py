@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark the landmark (ALT) heuristic against the Manhattan distance.
+
+The same random queries are solved with a_star on one maze per algorithm
+and PERFECT value, once with each heuristic. The script prints the
+landmark preprocessing time and memory, then the number of nodes each
+heuristic expands and its wall-clock time (measured in a separate run,
+without the counting callback).
+
+Usage:
+    python scripts/bench_landmarks.py [--size 300] [--landmarks 8]
+        [--queries 20] [--seed 0] [--algorithms DFS KRUSKAL PRIM]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.a_maze_ing.algorithms.a_star import (  # noqa: E402
+    SearchEvent,
+    SearchEventKind,
+    a_star
+)
+from src.a_maze_ing.algorithms.landmarks import Landmarks  # noqa: E402
+from src.a_maze_ing.core.grid import MazeGrid  # noqa: E402
+from src.a_maze_ing.core.rng import SplitMixRandom  # noqa: E402
+from src.a_maze_ing.maze.batch import generate_maze  # noqa: E402
+
+Query = tuple[tuple[int, int], tuple[int, int]]
+
+
+def run_queries(
+        grid: MazeGrid,
+        queries: list[Query],
+        landmarks: Landmarks | None
+) -> tuple[int, float]:
+    """Solve queries; return the nodes expanded and the wall time."""
+    expanded = 0
+
+    def count(events: list[SearchEvent]) -> None:
+        nonlocal expanded
+        expanded += sum(
+            event.kind is SearchEventKind.CLOSED for event in events
+        )
+
+    for entry, exit_pos in queries:
+        heuristic = landmarks.heuristic(exit_pos) if landmarks else None
+        a_star(entry, exit_pos, grid, count, heuristic=heuristic)
+    start = time.perf_counter()
+    for entry, exit_pos in queries:
+        heuristic = landmarks.heuristic(exit_pos) if landmarks else None
+        a_star(entry, exit_pos, grid, heuristic=heuristic)
+    return expanded, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print one line per maze."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithms", nargs="+",
+                        default=["DFS", "KRUSKAL", "PRIM"])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'algorithm':>10} {'perfect':>7} {'prep (s)':>9} "
+          f"{'MiB':>6} {'manhattan':>10} {'(s)':>7} {'landmarks':>10} "
+          f"{'(s)':>7}")
+    for algorithm in args.algorithms:
+        for perfect in (True, False):
+            grid = generate_maze({
+                "WIDTH": args.size,
+                "HEIGHT": args.size,
+                "ENTRY": (0, 0),
+                "ALGORITHM": algorithm,
+                "PERFECT": perfect,
+            }, SplitMixRandom(args.seed))
+            rng = SplitMixRandom(args.seed + 1)
+            queries = [
+                ((rng.randrange(args.size), rng.randrange(args.size)),
+                 (rng.randrange(args.size), rng.randrange(args.size)))
+                for _ in range(args.queries)
+            ]
+            start = time.perf_counter()
+            landmarks = Landmarks(grid, args.landmarks, rng)
+            preprocessing = time.perf_counter() - start
+            plain, plain_time = run_queries(grid, queries, None)
+            alt, alt_time = run_queries(grid, queries, landmarks)
+            print(f"{algorithm:>10} {str(perfect):>7} "
+                  f"{preprocessing:>9.3f} "
+                  f"{landmarks.nbytes / 2**20:>6.2f} {plain:>10} "
+                  f"{plain_time:>7.3f} {alt:>10} {alt_time:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Aldous-Broder/Wilson hybrid against pure Wilson.
+
+Both generators run on the same sizes and seeds; the best wall-clock time
+of each is printed per size, along with the speedup of the hybrid.
+
+Usage:
+    python scripts/bench_wilson.py [--sizes 32 64 128] [--repeat 3]
+        [--coverage 30]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.a_maze_ing.algorithms.wilson import (  # noqa: E402
+    DEFAULT_HYBRID_COVERAGE,
+    generate_aldous_broder_wilson,
+    generate_wilson
+)
+from src.a_maze_ing.core.grid import MazeGrid  # noqa: E402
+from src.a_maze_ing.core.types import MazeConfig  # noqa: E402
+from collections.abc import Callable  # noqa: E402
+
+
+def best_time(
+        generator: Callable[[MazeConfig], MazeGrid],
+        config: MazeConfig,
+        repeat: int
+) -> float:
+    """Return the best wall-clock time of several seeded runs."""
+    timings = []
+    for seed in range(repeat):
+        random.seed(seed)
+        start = time.perf_counter()
+        generator(config)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print one line per size."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[32, 64, 128, 256])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--coverage", type=int,
+                        default=DEFAULT_HYBRID_COVERAGE)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'wilson (s)':>12} {'hybrid (s)':>12} "
+          f"{'speedup':>8}")
+    for size in args.sizes:
+        config: MazeConfig = {
+            "WIDTH": size,
+            "HEIGHT": size,
+            "HYBRID_COVERAGE": args.coverage,
+        }
+        wilson = best_time(generate_wilson, config, args.repeat)
+        hybrid = best_time(generate_aldous_broder_wilson, config,
+                           args.repeat)
+        print(f"{size:>6} {wilson:>12.4f} {hybrid:>12.4f} "
+              f"{wilson / hybrid:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,12 @@ MAZEGEN_SRC_DIR = Path(__file__).parent / "mazegen_sources"
 # Standard library imports to keep at the top of generator.py
 STDLIB_IMPORTS = {
     "random",
+    "os",
+    "tempfile",
+    "hashlib",
+    "logging",
     "heapq",
+    "mmap",
     "collections.abc",
     "enum",
     "typing",
@@ -157,6 +162,10 @@ def bundle_generator() -> None:
     a_star_src = SRC_DIR / "algorithms" / "a_star.py"
     ft_pattern_src = SRC_DIR / "algorithms" / "ft_pattern.py"
     grid_utils_src = SRC_DIR / "algorithms" / "grid_utils.py"
+    grid_src = SRC_DIR / "core" / "grid.py"
+    storage_src = SRC_DIR / "core" / "storage.py"
+    seeding_src = SRC_DIR / "core" / "seeding.py"
+    rng_src = SRC_DIR / "core" / "rng.py"
     flaw_src = SRC_DIR / "maze" / "flaw.py"
     wrapper_src = MAZEGEN_SRC_DIR / "wrapper.py.part"
 
@@ -177,6 +186,16 @@ def bundle_generator() -> None:
     grid_utils_imports, grid_utils_code = extract_code_parts(
         read_and_process(grid_utils_src)
     )
+    grid_imports, grid_code = extract_code_parts(
+        read_and_process(grid_src)
+    )
+    storage_imports, storage_code = extract_code_parts(
+        read_and_process(storage_src)
+    )
+    seeding_imports, seeding_code = extract_code_parts(
+        read_and_process(seeding_src)
+    )
+    rng_imports, rng_code = extract_code_parts(read_and_process(rng_src))
     flaw_imports, flaw_code = extract_code_parts(
         read_and_process(flaw_src)
     )
@@ -193,6 +212,10 @@ def bundle_generator() -> None:
         a_star_imports,
         ft_imports,
         grid_utils_imports,
+        grid_imports,
+        storage_imports,
+        seeding_imports,
+        rng_imports,
         flaw_imports,
         wrapper_imports
     ]:
@@ -222,7 +245,11 @@ Do not edit directly - modify the source files instead.
 '''
 
     imports_section = '\n'.join(sorted_imports)
-    internal_import = "\nfrom mazegen.cell import Cell, CellState\n"
+    internal_import = (
+        "\nfrom mazegen.cell import Cell, CellState\n"
+        "from mazegen.cell import ALL_WALLS, NORTH, EAST, SOUTH, WEST\n"
+        "from mazegen.cell import OPPOSITE_WALLS\n"
+    )
     type_alias = (
         "\nMazeConfig = Mapping[str, int | tuple[int, int] | str | bool]\n"
     )
@@ -237,6 +264,34 @@ Do not edit directly - modify the source files instead.
 {ft_code}
 
 
+# =============================================================================
+# Packed Grid (from core/grid.py)
+# =============================================================================
+
+{grid_code}
+
+
+# =============================================================================
+# Grid Storage (from core/storage.py)
+# =============================================================================
+
+{storage_code}
+
+
+# =============================================================================
+# Seed Derivation (from core/seeding.py)
+# =============================================================================
+
+{seeding_code}
+
+
+# =============================================================================
+# Random Numbers (from core/rng.py)
+# =============================================================================
+
+{rng_code}
+
+
 # =============================================================================
 # Grid Helpers (from algorithms/grid_utils.py)
 # =============================================================================
@@ -5,5 +5,6 @@ For reusable maze generation, see the mazegen package:
 """
 
 from src.a_maze_ing.core.cell import Cell, CellState
+from src.a_maze_ing.core.grid import MazeGrid
 
-__all__ = ["Cell", "CellState"]
+__all__ = ["Cell", "CellState", "MazeGrid"]
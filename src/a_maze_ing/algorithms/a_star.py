@@ -1,157 +1,284 @@
 """A* pathfinding utilities for maze grids."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from enum import Enum, auto
 from heapq import heappush, heappop
-from src.a_maze_ing.core.cell import Cell
+from typing import NamedTuple
+from src.a_maze_ing.core.cell import EAST, NORTH, SOUTH, WEST, Cell
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.storage import scratch_plane
 
+_STEP_LETTERS = {NORTH: "N", EAST: "E", SOUTH: "S", WEST: "W"}
 
-def _manhattan_distance(pos: tuple[int, int], goal: tuple[int, int]) -> int:
-    """Compute the Manhattan distance between two coordinates.
 
-    Args:
-        pos: Current position as (x, y).
-        goal: Target position as (x, y).
+class SearchEventKind(Enum):
+    """Kinds of incremental changes reported by the A* search."""
 
-    Returns:
-        Manhattan distance between the two points.
+    OPENED = auto()
+    CLOSED = auto()
+    PARENT_CHANGED = auto()
+
+
+class SearchEvent(NamedTuple):
+    """Single change to the search state.
+
+    Attributes:
+        kind: What happened to the node.
+        position: Node coordinates as (x, y).
+        parent: Predecessor on the best known path for OPENED and
+            PARENT_CHANGED events, None for the entry and CLOSED events.
     """
-    return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
 
+    kind: SearchEventKind
+    position: tuple[int, int]
+    parent: tuple[int, int] | None = None
+
+
+SearchStepCallback = Callable[[list[SearchEvent]], None]
+
+
+class SearchView:
+    """Search state rebuilt incrementally from A* events.
+
+    Attributes:
+        open_set: Nodes discovered but not expanded yet.
+        closed_set: Expanded nodes.
+        parents: Best known predecessor of each discovered node.
+        current: Most recently expanded node.
+        path: Best known path to ``current`` as of the last
+            ``follow_current`` call, entry included.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty search view."""
+        self.open_set: set[tuple[int, int]] = set()
+        self.closed_set: set[tuple[int, int]] = set()
+        self.parents: dict[tuple[int, int], tuple[int, int]] = {}
+        self.current: tuple[int, int] | None = None
+        self.path: list[tuple[int, int]] = []
+        self._path_positions: dict[tuple[int, int], int] = {}
+
+    def apply(self, events: Sequence[SearchEvent]) -> None:
+        """Apply a batch of search events.
+
+        Args:
+            events: Events reported by one A* step.
+        """
+        for kind, position, parent in events:
+            if kind is SearchEventKind.CLOSED:
+                self.open_set.discard(position)
+                self.closed_set.add(position)
+                self.current = position
+                continue
+            if kind is SearchEventKind.OPENED:
+                self.open_set.add(position)
+            if parent is not None:
+                self.parents[position] = parent
+
+    def path_to(self, position: tuple[int, int]) -> list[tuple[int, int]]:
+        """Return the best known path to a discovered node.
+
+        Args:
+            position: Target node coordinates.
+
+        Returns:
+            Coordinates from the entry to position, both included.
+        """
+        path = [position]
+        while position in self.parents:
+            position = self.parents[position]
+            path.append(position)
+        path.reverse()
+        return path
+
+    def follow_current(
+            self
+    ) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """Move ``path`` to the current node, keeping the shared prefix.
+
+        Expanded nodes never change parent, so only the branch from the
+        current node back to the old path is walked.
 
-def _get_accessible_neighbors(
-        cell: Cell, grid: list[list[Cell]]
-) -> list[tuple[Cell, str]]:
-    """Return accessible neighboring cells and the move direction.
+        Returns:
+            Tuple of (left, joined): nodes removed from the end of the
+            path and nodes appended to it, in path order.
+        """
+        if self.current is None:
+            return [], []
+        positions = self._path_positions
+        joined = []
+        cut = 0
+        node: tuple[int, int] | None = self.current
+        while node is not None:
+            if node in positions:
+                cut = positions[node] + 1
+                break
+            joined.append(node)
+            node = self.parents.get(node)
+        left = self.path[cut:]
+        del self.path[cut:]
+        for node in left:
+            del positions[node]
+        joined.reverse()
+        for node in joined:
+            positions[node] = len(self.path)
+            self.path.append(node)
+        return left, joined
+
+
+def _manhattan_distance(index: int, goal: int, width: int) -> int:
+    """Compute the Manhattan distance between two cells.
 
     Args:
-        cell: Current cell.
-        grid: 2D maze grid.
+        index: Flat index of the current cell.
+        goal: Flat index of the target cell.
+        width: Grid width used to unflatten the indices.
 
     Returns:
-        List of (neighbor_cell, direction) tuples with directions in N/E/S/W.
+        Manhattan distance between the two cells.
     """
-    x, y = cell.coordinates
-    height = len(grid)
-    width = len(grid[0]) if height > 0 else 0
-    neighbors = []
+    y, x = divmod(index, width)
+    goal_y, goal_x = divmod(goal, width)
+    return abs(x - goal_x) + abs(y - goal_y)
 
-    if not cell.north and y > 0:
-        neighbors.append((grid[y - 1][x], 'N'))
-    if not cell.south and y < height - 1:
-        neighbors.append((grid[y + 1][x], 'S'))
-    if not cell.west and x > 0:
-        neighbors.append((grid[y][x - 1], 'W'))
-    if not cell.east and x < width - 1:
-        neighbors.append((grid[y][x + 1], 'E'))
 
-    return neighbors
+def _reconstruct_path(
+        parents: memoryview,
+        start: int,
+        current: int,
+        width: int
+) -> str:
+    """Rebuild the path string by following parent moves back to start.
+
+    Args:
+        parents: Wall bit of the move that reached each cell.
+        start: Flat index of the entry cell.
+        current: Flat index to backtrack from.
+        width: Width of the rectangle the indices are taken in.
+
+    Returns:
+        Path string from start to current.
+    """
+    back = {NORTH: width, SOUTH: -width, WEST: 1, EAST: -1}
+    steps: list[str] = []
+    while current != start:
+        move = parents[current]
+        steps.append(_STEP_LETTERS[move])
+        current += back[move]
+    steps.reverse()
+    return "".join(steps)
 
 
 def a_star(
         entry: tuple[int, int],
         exit: tuple[int, int],
-        grid: list[list[Cell]],
-        on_step: Callable[
-            [tuple[int, int], set[tuple[int, int]], set[tuple[int, int]], str],
-            None
-        ] | None = None
+        grid: Sequence[Sequence[Cell]],
+        on_step: SearchStepCallback | None = None,
+        bounds: tuple[int, int, int, int] | None = None,
+        heuristic: Callable[[int], int] | None = None
 ) -> str:
     """Find the shortest path between entry and exit using A*.
 
+    Search state (g-score, parent move, closed flag) lives in flat arrays
+    covering the searched rectangle (the whole grid unless ``bounds`` is
+    given), on the grid's storage backend (see ``scratch_plane``), and
+    the path is rebuilt once when the exit is reached. Progress is
+    reported to ``on_step`` as the list of events produced by each
+    expansion, which ``SearchView`` can apply.
+
     Args:
         entry: Entry coordinates as (x, y).
         exit: Exit coordinates as (x, y).
         grid: 2D maze grid.
-        on_step: Optional callback called on each exploration step.
+        on_step: Optional callback called with the events of each
+            exploration step.
+        bounds: Optional rectangle (x, y, width, height) the search stays
+            in; entry and exit must lie inside it.
+        heuristic: Optional estimate of the distance from a flat cell
+            index to the exit, such as ``Landmarks.heuristic``. It must
+            never overestimate, nor drop by more than 1 per step. Default:
+            Manhattan distance.
 
     Returns:
         Path string composed of N/E/S/W steps. Empty string if no path.
     """
     if not grid or not grid[0]:
         return ""
-
-    def reconstruct_path(
-            came_from: dict[tuple[int, int], tuple[tuple[int, int], str]],
-            current: tuple[int, int]
-    ) -> str:
-        """Reconstruct the path string from the parent map.
-
-        Args:
-            came_from: Mapping from position to (previous, direction).
-            current: Current position to backtrack from.
-
-        Returns:
-            Path string from entry to current.
-        """
-        steps: list[str] = []
-        while current in came_from:
-            previous, direction = came_from[current]
-            steps.append(direction)
-            current = previous
-        steps.reverse()
-        return "".join(steps)
+    if not isinstance(grid, MazeGrid):
+        grid = MazeGrid.from_cells(grid)
+
+    width = grid.width
+    walls = grid.walls
+    start = grid.to_index(*entry)
+    goal = grid.to_index(*exit)
+    min_x, min_y, span, rows = 0, 0, width, grid.height
+    if bounds is not None:
+        min_x, min_y, span, rows = bounds
+    max_x = min_x + span - 1
+    max_y = min_y + rows - 1
+    estimate = heuristic if heuristic is not None else (
+        lambda index: _manhattan_distance(index, goal, width)
+    )
+
+    # Scratch planes cover the searched rectangle only, indexed from its
+    # top-left cell, and follow the grid storage (off the heap for mmap).
+    size = span * rows
+    g_score = scratch_plane(size, "i" if size < 2**31 else "q", -1, grid)
+    parents = scratch_plane(size, grid=grid)
+    closed = scratch_plane(size, grid=grid)
+    local_start = (entry[1] - min_y) * span + entry[0] - min_x
+    g_score[local_start] = 0
 
     counter = 0
-    open_set: list[tuple[int, int, tuple[int, int]]] = []
-    heappush(open_set, (0, counter, entry))
-    open_positions = {entry}
-
-    g_score = {entry: 0}
-    came_from: dict[tuple[int, int], tuple[tuple[int, int], str]] = {}
-
-    closed_set: set[tuple[int, int]] = set()
+    open_set: list[tuple[int, int, int]] = []
+    heappush(open_set, (0, counter, start))
+    events = [SearchEvent(SearchEventKind.OPENED, entry)]
 
     while open_set:
-        _, _, current_pos = heappop(open_set)
+        _, _, current = heappop(open_set)
+        y, x = divmod(current, width)
+        local = (y - min_y) * span + x - min_x
 
-        if current_pos in closed_set:
+        if closed[local]:
             continue
-        open_positions.discard(current_pos)
-        path = reconstruct_path(came_from, current_pos)
 
-        if current_pos == exit:
+        if on_step:
+            current_pos = grid.to_coordinates(current)
+            events.append(SearchEvent(SearchEventKind.CLOSED, current_pos))
+        if current == goal:
             if on_step:
-                on_step(
-                    current_pos,
-                    set(open_positions),
-                    closed_set | {current_pos},
-                    path
-                )
-            return path
-
-        closed_set.add(current_pos)
-
-        current_x, current_y = current_pos
-        current_cell = grid[current_y][current_x]
-
-        for neighbor_cell, direction in (
-                _get_accessible_neighbors(current_cell, grid)
+                on_step(events)
+            return _reconstruct_path(parents, local_start, local, span)
+
+        closed[local] = 1
+        cell_walls = walls[current]
+        tentative_g = g_score[local] + 1
+
+        for move, neighbor, local_neighbor, is_open in (
+                (NORTH, current - width, local - span, y > min_y),
+                (SOUTH, current + width, local + span, y < max_y),
+                (WEST, current - 1, local - 1, x > min_x),
+                (EAST, current + 1, local + 1, x < max_x)
         ):
-            neighbor_pos = neighbor_cell.coordinates
-
-            if neighbor_pos in closed_set:
+            if not is_open or cell_walls & move or closed[local_neighbor]:
                 continue
-
-            tentative_g = g_score[current_pos] + 1
-
-            if (neighbor_pos not in g_score or
-                    tentative_g < g_score[neighbor_pos]):
-                g_score[neighbor_pos] = tentative_g
-                came_from[neighbor_pos] = (current_pos, direction)
-                f_score = tentative_g + _manhattan_distance(neighbor_pos, exit)
+            known_g = g_score[local_neighbor]
+            if known_g < 0 or tentative_g < known_g:
+                g_score[local_neighbor] = tentative_g
+                parents[local_neighbor] = move
+                f_score = tentative_g + estimate(neighbor)
                 counter += 1
-                heappush(
-                    open_set,
-                    (f_score, counter, neighbor_pos)
-                )
-                open_positions.add(neighbor_pos)
+                heappush(open_set, (f_score, counter, neighbor))
+                if on_step:
+                    events.append(SearchEvent(
+                        SearchEventKind.OPENED if known_g < 0
+                        else SearchEventKind.PARENT_CHANGED,
+                        grid.to_coordinates(neighbor),
+                        current_pos
+                    ))
 
         if on_step:
-            on_step(
-                current_pos,
-                set(open_positions),
-                set(closed_set),
-                path
-            )
+            on_step(events)
+            events = []
 
     return ""
@@ -0,0 +1,135 @@
+"""Binary-tree maze generation."""
+
+from collections.abc import Callable
+from random import Random
+from typing import Any
+from src.a_maze_ing.core.cell import ALL_WALLS, EAST, NORTH, SOUTH, WEST
+from src.a_maze_ing.core.cell import CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.core.storage import MappedMazeGrid
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
+    connect_stranded,
+    generate_full_grid,
+    load_numpy
+)
+
+# Optional: whole-grid array operations when NumPy is installed.
+_numpy = load_numpy()
+
+
+def _carve_numpy(grid: MazeGrid, np: Any, rng: Random) -> list[int]:
+    """Carve every cell north or east with whole-grid array operations.
+
+    Args:
+        grid: Grid to carve in place.
+        np: The numpy module.
+        rng: Random number generator seeding the NumPy one.
+
+    Returns:
+        Flat indices of the cells that could carve neither way.
+    """
+    height, width = grid.height, grid.width
+    walls = np.frombuffer(grid.walls, dtype=np.uint8).reshape(height, width)
+    states = np.frombuffer(grid.states, dtype=np.uint8)
+    free = (states != CellState.VISITED.value).reshape(height, width)
+
+    north_ok = np.zeros((height, width), dtype=bool)
+    north_ok[1:] = free[1:] & free[:-1]
+    east_ok = np.zeros((height, width), dtype=bool)
+    east_ok[:, :-1] = free[:, :-1] & free[:, 1:]
+
+    generator = np.random.default_rng(rng.getrandbits(64))
+    coin = generator.random((height, width)) < 0.5
+    go_north = north_ok & (coin | ~east_ok)
+    go_east = east_ok & ~go_north
+
+    walls[go_north] &= ALL_WALLS & ~NORTH
+    walls[:-1][go_north[1:]] &= ALL_WALLS & ~SOUTH
+    walls[go_east] &= ALL_WALLS & ~EAST
+    walls[:, 1:][go_east[:, :-1]] &= ALL_WALLS & ~WEST
+
+    roots = np.flatnonzero(free & ~north_ok & ~east_ok)
+    return [int(index) for index in roots]
+
+
+def _carve_python(grid: MazeGrid, rng: Random) -> list[int]:
+    """Carve every cell north or east, one cell at a time.
+
+    Args:
+        grid: Grid to carve in place.
+        rng: Random number generator.
+
+    Returns:
+        Flat indices of the cells that could carve neither way.
+    """
+    width = grid.width
+    states = grid.states
+    blocked = CellState.VISITED.value
+    coins = ChoiceBuffer(rng)
+    roots = []
+    for index in range(grid.size):
+        if states[index] == blocked:
+            continue
+        north = index >= width and states[index - width] != blocked
+        east = (index + 1) % width != 0 and states[index + 1] != blocked
+        if north and (not east or coins.below(2)):
+            grid.open_wall(index, NORTH)
+        elif east:
+            grid.open_wall(index, EAST)
+        else:
+            roots.append(index)
+    return roots
+
+
+def generate_binary_tree(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze using the binary-tree algorithm.
+
+    Each cell opens its north or east wall at random. With NumPy the whole
+    grid is carved at once in the packed wall plane; without it, or for a
+    memory-mapped grid, cells are carved in a plain loop. Cells that
+    cannot go north or east because of the border or the 42 pattern start
+    stranded trees, which are then attached to the rest of the maze.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+        on_step: Optional callback called after carving and after the
+            stranded trees are attached.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    if grid.size == 0:
+        return grid
+    rng = ensure_rng(rng)
+
+    # NumPy temporaries span the whole grid; mapped grids stay off-heap.
+    if _numpy is not None and not isinstance(grid, MappedMazeGrid):
+        roots = _carve_numpy(grid, _numpy, rng)
+    else:
+        roots = _carve_python(grid, rng)
+    if on_step:
+        on_step(grid)
+
+    # The first root is the north-east corner, the root of the main tree.
+    connect_stranded(grid, roots[1:], rng)
+    if on_step:
+        on_step(grid)
+
+    return grid
@@ -1,25 +1,56 @@
 """Depth-first search maze generation."""
 
 from collections.abc import Callable
-from random import choice as random_choice
-from src.a_maze_ing.core.cell import Cell, CellState
+from random import Random
+from src.a_maze_ing.core.cell import (
+    ALL_WALLS,
+    EAST,
+    NORTH,
+    OPPOSITE_WALLS,
+    SOUTH,
+    WEST,
+    CellState
+)
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
 from src.a_maze_ing.core.types import MazeConfig
 from src.a_maze_ing.algorithms.grid_utils import (
-    generate_full_grid,
-    get_neighbors,
-    remove_walls_between
+    config_pattern,
+    config_storage,
+    generate_full_grid
+)
+
+# The direction back to the parent cell is kept in bits 4-5 of the wall
+# byte while a cell is on the current path; the low nibble stays the
+# wall mask, so readers masking with ALL_WALLS never see it.
+_BACKTRACK_SHIFT = 4
+_BACKTRACK_CODES = {NORTH: 0, EAST: 1, SOUTH: 2, WEST: 3}
+
+# Unvisited-neighbor mask -> candidate walls, in N, S, W, E order.
+_CANDIDATES = tuple(
+    tuple(wall for wall in (NORTH, SOUTH, WEST, EAST) if mask & wall)
+    for mask in range(ALL_WALLS + 1)
 )
 
 
 def generate_dfs(
         config: MazeConfig,
-        on_step: Callable[[list[list[Cell]]], None] | None = None
-) -> list[list[Cell]]:
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
     """Generate a perfect maze using recursive backtracker (DFS).
 
+    No stack is kept: each cell on the current path stores the direction
+    back to its parent as 2 bits of its wall byte, cleared again when the
+    walk backtracks through it. Unvisited neighbors are collected into a
+    4-bit mask, so the extra memory does not grow with the maze. Choices
+    are served from a buffer of bulk-drawn random bytes.
+
     Args:
         config: Configuration dictionary with WIDTH, HEIGHT, ENTRY keys.
         on_step: Optional callback called after each carving step.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
 
     Returns:
         Generated maze grid.
@@ -31,26 +62,45 @@ def generate_dfs(
     height = config["HEIGHT"]
     assert isinstance(width, int)
     assert isinstance(height, int)
-    grid, _ = generate_full_grid(width, height)
-    current = grid[y][x]
-    current.state = CellState.VISITED
-    stack = [current]
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    choices = ChoiceBuffer(ensure_rng(rng))
+    walls = grid.walls
+    states = grid.states
+    visited = CellState.VISITED.value
+    back_offsets = (-width, 1, width, -1)
+    start = current = grid.to_index(x, y)
+    states[current] = visited
     if on_step:
         on_step(grid)
 
-    while stack:
-        current = stack[-1]
-        neighbors = [nb for nb in get_neighbors(current.coordinates, grid)
-                     if nb.state != CellState.VISITED]
+    while True:
+        row, column = divmod(current, width)
+        mask = 0
+        if row > 0 and states[current - width] != visited:
+            mask |= NORTH
+        if row < height - 1 and states[current + width] != visited:
+            mask |= SOUTH
+        if column > 0 and states[current - 1] != visited:
+            mask |= WEST
+        if column < width - 1 and states[current + 1] != visited:
+            mask |= EAST
 
-        if neighbors:
-            next_cell = random_choice(neighbors)
-            remove_walls_between(current, next_cell)
-            next_cell.state = CellState.VISITED
-            stack.append(next_cell)
+        if mask:
+            wall = choices.choice(_CANDIDATES[mask])
+            current = grid.open_wall(current, wall)
+            walls[current] |= (
+                _BACKTRACK_CODES[OPPOSITE_WALLS[wall]] << _BACKTRACK_SHIFT
+            )
+            states[current] = visited
             if on_step:
                 on_step(grid)
+        elif current == start:
+            break
         else:
-            stack.pop()
+            code = walls[current] >> _BACKTRACK_SHIFT
+            walls[current] &= ALL_WALLS
+            current += back_offsets[code]
 
     return grid
@@ -0,0 +1,186 @@
+"""Recursive-division maze generation."""
+
+from collections.abc import Callable
+from random import Random
+from src.a_maze_ing.core.cell import ALL_WALLS, EAST, NORTH, SOUTH, WEST
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
+    connect_regions,
+    generate_full_grid
+)
+
+# Byte translation tables adding one wall bit to every cell of a slice.
+_ADD_WALL = {
+    wall: bytes(value | wall for value in range(256))
+    for wall in (NORTH, EAST, SOUTH, WEST)
+}
+
+
+def _add_wall(grid: MazeGrid, start: int, stop: int, step: int,
+              wall: int) -> None:
+    """Close one wall bit on a (possibly strided) slice of cells.
+
+    Args:
+        grid: Maze grid.
+        start: First flat index.
+        stop: Flat index past the last cell.
+        step: Distance between cells (1 for a row, width for a column).
+        wall: Wall bit to close.
+    """
+    walls = grid.walls
+    walls[start:stop:step] = walls[start:stop:step].translate(_ADD_WALL[wall])
+
+
+def _open_field(grid: MazeGrid, rows: dict[int, set[int]]) -> None:
+    """Open every inner wall, keeping the outer border and the pattern.
+
+    Args:
+        grid: Maze grid to clear, one row slice at a time.
+        rows: Columns of the pattern cells, by row.
+    """
+    width = grid.width
+    height = grid.height
+    row = bytearray(width)
+    row[0] |= WEST
+    row[-1] |= EAST
+    for y in range(height):
+        line = bytearray(row)
+        if y == 0:
+            line = bytearray(line.translate(_ADD_WALL[NORTH]))
+        if y == height - 1:
+            line = bytearray(line.translate(_ADD_WALL[SOUTH]))
+        for x in rows.get(y - 1, ()):
+            line[x] |= NORTH
+        for x in rows.get(y + 1, ()):
+            line[x] |= SOUTH
+        for x in rows.get(y, ()):
+            line[x] = ALL_WALLS
+            if x > 0:
+                line[x - 1] |= EAST
+            if x < width - 1:
+                line[x + 1] |= WEST
+        grid.walls[y * width:(y + 1) * width] = line
+
+
+def _gap(draws: ChoiceBuffer, length: int, blocked: set[int]) -> int | None:
+    """Pick the passage of a wall line, away from the pattern.
+
+    Args:
+        draws: Buffer the position is drawn from.
+        length: Number of cells along the line.
+        blocked: Positions with a pattern cell on either side.
+
+    Returns:
+        Position of the passage, or None if every position is blocked.
+    """
+    if not blocked:
+        return draws.below(length)
+    free = [offset for offset in range(length) if offset not in blocked]
+    return free[draws.below(len(free))] if free else None
+
+
+def generate_division(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze using recursive division.
+
+    The grid starts as an open field around the walled 42 pattern cells,
+    and chambers are split by wall lines with a single gap, each line
+    being written as one slice of the wall plane (strided for vertical
+    lines). Gaps are never drawn next to a pattern cell, so the pattern
+    is never opened; the regions it cuts apart are joined at the end.
+    Pending chambers live on an explicit stack, so grid size is not
+    limited by the recursion depth.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+        on_step: Optional callback called after each wall line.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    grid, pattern = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    if grid.size == 0:
+        return grid
+    draws = ChoiceBuffer(ensure_rng(rng))
+    rows: dict[int, set[int]] = {}
+    columns: dict[int, set[int]] = {}
+    for cell_x, cell_y in pattern:
+        rows.setdefault(cell_y, set()).add(cell_x)
+        columns.setdefault(cell_x, set()).add(cell_y)
+
+    _open_field(grid, rows)
+    if on_step:
+        on_step(grid)
+
+    chambers = [(0, 0, width, height)]
+    while chambers:
+        x, y, chamber_width, chamber_height = chambers.pop()
+        if chamber_width < 2 or chamber_height < 2:
+            continue
+        horizontal = (
+            chamber_height > chamber_width
+            or (chamber_height == chamber_width and draws.below(2))
+        )
+        if horizontal:
+            wall_y = y + draws.below(chamber_height - 1)
+            start = wall_y * width + x
+            _add_wall(grid, start, start + chamber_width, 1, SOUTH)
+            _add_wall(grid, start + width, start + width + chamber_width, 1,
+                      NORTH)
+            gap = _gap(draws, chamber_width, {
+                cell_x - x
+                for row in (wall_y, wall_y + 1)
+                for cell_x in rows.get(row, ())
+                if x <= cell_x < x + chamber_width
+            })
+            if gap is not None:
+                grid.open_wall(start + gap, SOUTH)
+            chambers.append((x, y, chamber_width, wall_y - y + 1))
+            chambers.append((x, wall_y + 1, chamber_width,
+                             y + chamber_height - wall_y - 1))
+        else:
+            wall_x = x + draws.below(chamber_width - 1)
+            start = y * width + wall_x
+            stop = start + chamber_height * width
+            _add_wall(grid, start, stop, width, EAST)
+            _add_wall(grid, start + 1, stop + 1, width, WEST)
+            gap = _gap(draws, chamber_height, {
+                cell_y - y
+                for column in (wall_x, wall_x + 1)
+                for cell_y in columns.get(column, ())
+                if y <= cell_y < y + chamber_height
+            })
+            if gap is not None:
+                grid.open_wall(start + gap * width, EAST)
+            chambers.append((x, y, wall_x - x + 1, chamber_height))
+            chambers.append((wall_x + 1, y, x + chamber_width - wall_x - 1,
+                             chamber_height))
+        if on_step:
+            on_step(grid)
+
+    if pattern:
+        # Every region the pattern cut off borders a pattern cell.
+        connect_regions(grid, (
+            neighbor
+            for x, y in pattern
+            for _, neighbor in grid.neighbors(grid.to_index(x, y))
+        ), draws.rng)
+        if on_step:
+            on_step(grid)
+
+    return grid
@@ -0,0 +1,241 @@
+"""Eller's algorithm for row-by-row maze generation."""
+
+from collections.abc import Callable, Iterable, Iterator
+from random import Random
+from src.a_maze_ing.core.cell import ALL_WALLS, EAST, NORTH, SOUTH, WEST
+from src.a_maze_ing.core.grid import MazeGrid, hex_encode
+from src.a_maze_ing.core.rng import ensure_rng
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
+    generate_full_grid
+)
+
+
+def _find(parent: list[int], label: int) -> int:
+    """Find the root of a set label, halving the path.
+
+    Args:
+        parent: Union-find parents of the current row labels.
+        label: Label to resolve.
+
+    Returns:
+        Root label.
+    """
+    while parent[label] != label:
+        parent[label] = parent[parent[label]]
+        label = parent[label]
+    return label
+
+
+def _merge(
+        parent: list[int],
+        labels: list[int],
+        walls: bytearray,
+        x: int
+) -> None:
+    """Join the sets of the cells at x and x + 1 if they differ.
+
+    Args:
+        parent: Union-find parents of the current row labels.
+        labels: Set label of each column.
+        walls: Wall bytes of the current row.
+        x: Column of the left cell.
+    """
+    root_a = _find(parent, labels[x])
+    root_b = _find(parent, labels[x + 1])
+    if root_a == root_b:
+        return
+    parent[root_b] = root_a
+    walls[x] &= ~EAST
+    walls[x + 1] &= ~WEST
+
+
+def eller_rows(
+        width: int,
+        height: int,
+        blocked: Iterable[tuple[int, int]] = (),
+        rng: Random | None = None
+) -> Iterator[bytearray]:
+    """Generate a perfect maze one row at a time with Eller's algorithm.
+
+    Only the set labels of the current row are kept, so memory grows with
+    the width and not with the height. Blocked cells keep all their walls
+    and never join a set. When the row below is partly blocked, sets that
+    could not continue downwards are merged sideways first so that no
+    region gets cut off.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        blocked: Coordinates of cells that must stay closed.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Yields:
+        Wall bytes of each row, top to bottom, one byte per cell.
+    """
+    blocked_rows: dict[int, set[int]] = {}
+    for x, y in blocked:
+        blocked_rows.setdefault(y, set()).add(x)
+    no_cells: set[int] = set()
+    rng = ensure_rng(rng)
+
+    labels = [0] * width
+    carried = bytearray(width)
+
+    for y in range(height):
+        row_blocked = blocked_rows.get(y, no_cells)
+        last_row = y == height - 1
+        walls = bytearray([ALL_WALLS]) * width
+
+        # Relabel the sets carried down from the previous row compactly so
+        # the union-find below never needs more than width + 1 slots.
+        parent = list(range(width + 1))
+        remap: dict[int, int] = {}
+        next_label = 1
+        for x in range(width):
+            if x in row_blocked:
+                labels[x] = 0
+                continue
+            if carried[x]:
+                walls[x] &= ~NORTH
+                label = remap.get(labels[x], 0)
+                if not label:
+                    label = remap[labels[x]] = next_label
+                    next_label += 1
+            else:
+                label = next_label
+                next_label += 1
+            labels[x] = label
+
+        # One bulk draw per row: byte x decides the merge of x and x + 1.
+        coins = rng.randbytes(width)
+        for x in range(width - 1):
+            if labels[x] and labels[x + 1] and (last_row or coins[x] & 1):
+                _merge(parent, labels, walls, x)
+
+        if last_row:
+            yield walls
+            return
+
+        below_blocked = blocked_rows.get(y + 1, no_cells)
+        if below_blocked:
+            merged = True
+            while merged:
+                merged = False
+                can_descend = {
+                    _find(parent, labels[x]) for x in range(width)
+                    if labels[x] and x not in below_blocked
+                }
+                for x in range(width - 1):
+                    if not labels[x] or not labels[x + 1]:
+                        continue
+                    root_a = _find(parent, labels[x])
+                    root_b = _find(parent, labels[x + 1])
+                    if root_a != root_b and (
+                            root_a not in can_descend
+                            or root_b not in can_descend):
+                        _merge(parent, labels, walls, x)
+                        merged = True
+                        break
+
+        candidates: dict[int, list[int]] = {}
+        for x in range(width):
+            carried[x] = 0
+            if not labels[x] or x in below_blocked:
+                continue
+            root = _find(parent, labels[x])
+            labels[x] = root
+            candidates.setdefault(root, []).append(x)
+        coins = rng.randbytes(width)
+        for columns in candidates.values():
+            descending = [x for x in columns if coins[x] & 1]
+            if not descending:
+                descending.append(rng.choice(columns))
+            for x in descending:
+                carried[x] = 1
+                walls[x] &= ~SOUTH
+
+        yield walls
+
+
+def generate_eller_rows(
+        config: MazeConfig,
+        rng: Random | None = None
+) -> Iterator[bytearray]:
+    """Stream the wall rows of an Eller maze around the 42 pattern.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+        rng: Optional random number generator.
+
+    Returns:
+        Iterator over the wall bytes of each row.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    return eller_rows(width, height, config_pattern(config), rng)
+
+
+def stream_eller_hex(
+        config: MazeConfig,
+        grid: MazeGrid | None = None,
+        rng: Random | None = None
+) -> Iterator[str]:
+    """Yield the hexadecimal rows of an Eller maze as they are generated.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+        grid: Optional grid receiving a copy of each row, e.g. to solve the
+            maze once streaming is done.
+        rng: Optional random number generator.
+
+    Yields:
+        One line of hexadecimal digits per row.
+    """
+    width = config["WIDTH"]
+    assert isinstance(width, int)
+    for y, walls in enumerate(generate_eller_rows(config, rng)):
+        if grid is not None:
+            grid.walls[y * width:(y + 1) * width] = walls
+        yield hex_encode(walls)
+
+
+def generate_eller(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze using Eller's algorithm.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+        on_step: Optional callback called after each generated row.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    grid, pattern = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+
+    if on_step:
+        on_step(grid)
+
+    for y, walls in enumerate(eller_rows(width, height, pattern, rng)):
+        start = y * width
+        grid.walls[start:start + width] = walls
+        if on_step:
+            on_step(grid)
+
+    return grid
@@ -10,8 +10,6 @@ _FT_PATTERN = [
     [0, 0, 1, 0, 1, 1, 1]
 ]
 
-_FT_PATTERN_WARNED = False
-
 
 def where_is_ft_pattern(
     grid: Sequence[Sequence[object]]
@@ -24,14 +22,24 @@ def where_is_ft_pattern(
     Returns:
         List of coordinates to mark as the 42 pattern. Empty if too small.
     """
-    if len(grid) < 7 or len(grid[0]) < 9:
-        global _FT_PATTERN_WARNED
-        if not _FT_PATTERN_WARNED:
-            print("Error: Maze too small for '42' pattern, skipping pattern.")
-            _FT_PATTERN_WARNED = True
+    height = len(grid)
+    return ft_pattern_cells(len(grid[0]) if height else 0, height)
+
+
+def ft_pattern_cells(width: int, height: int) -> list[tuple[int, int]]:
+    """Compute the '42' pattern coordinates for a grid size.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+
+    Returns:
+        List of coordinates to mark as the 42 pattern. Empty if too small.
+    """
+    if height < 7 or width < 9:
         return []
     result = []
-    pattern_top_left = (len(grid[0]) / 2 - 3, len(grid) / 2 - 2)
+    pattern_top_left = (width / 2 - 3, height / 2 - 2)
     for y in range(len(_FT_PATTERN)):
         for x in range(len(_FT_PATTERN[y])):
             top_left_x, top_left_y = pattern_top_left
@@ -1,40 +1,250 @@
 """Shared grid utilities for maze generation."""
 
+import logging
+from array import array
+from collections import deque
+from collections.abc import Iterable, Sequence
+from importlib import import_module
+from random import Random
+from typing import Any, Literal
+from src.a_maze_ing.core.cell import EAST, NORTH, SOUTH, WEST
 from src.a_maze_ing.core.cell import Cell, CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.storage import allocate_grid, scratch_plane
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.ft_pattern import ft_pattern_cells
 from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
 
+logger = logging.getLogger(__name__)
+
+
+def config_storage(config: MazeConfig) -> str | None:
+    """Return the grid storage specification requested by a config.
+
+    Args:
+        config: Configuration dictionary, optionally with a STORAGE key.
+
+    Returns:
+        Storage specification, or None for in-memory grids.
+    """
+    storage = config.get("STORAGE")
+    return storage if isinstance(storage, str) else None
+
+
+def config_pattern(config: MazeConfig) -> list[tuple[int, int]]:
+    """Return the 42 pattern cells that fall inside a configured grid.
+
+    A config describing one tile of a larger maze carries the tile
+    position in TILE_ORIGIN and the whole maze size in MAZE_SIZE; the
+    pattern is then placed for the whole maze and clipped to the tile.
+    Nothing is logged when the maze is too small for the pattern: entry
+    points report it once with ``warn_pattern_skipped``.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+
+    Returns:
+        Pattern coordinates relative to the configured grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    origin = config.get("TILE_ORIGIN")
+    maze_size = config.get("MAZE_SIZE")
+    if not isinstance(origin, tuple) or not isinstance(maze_size, tuple):
+        return ft_pattern_cells(width, height)
+    origin_x, origin_y = origin
+    return [
+        (x - origin_x, y - origin_y)
+        for x, y in ft_pattern_cells(*maze_size)
+        if origin_x <= x < origin_x + width
+        and origin_y <= y < origin_y + height
+    ]
+
+
+def pattern_skipped(config: MazeConfig) -> bool:
+    """Tell whether a configured maze is too small for the 42 pattern.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys; for a
+            tile, MAZE_SIZE gives the size of the whole maze.
+
+    Returns:
+        True if the maze is generated without the pattern.
+    """
+    maze_size = config.get("MAZE_SIZE")
+    if isinstance(maze_size, tuple):
+        return not ft_pattern_cells(*maze_size)
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    return not ft_pattern_cells(width, height)
+
+
+def warn_pattern_skipped(configs: Iterable[MazeConfig]) -> bool:
+    """Log a single warning if any maze is too small for the 42 pattern.
+
+    Generators stay silent so that batches and servers do not repeat the
+    warning for every maze; each entry point calls this once instead.
+
+    Args:
+        configs: Configurations about to be generated.
+
+    Returns:
+        True if the warning was logged.
+    """
+    if not any(pattern_skipped(config) for config in configs):
+        return False
+    logger.warning("Maze too small for '42' pattern, skipping pattern.")
+    return True
+
 
 def generate_full_grid(
         width: int,
-        height: int
-) -> tuple[list[list[Cell]], set[tuple[int, int]]]:
+        height: int,
+        storage: str | None = None,
+        pattern: Iterable[tuple[int, int]] | None = None
+) -> tuple[MazeGrid, set[tuple[int, int]]]:
     """Create a grid filled with closed walls and mark the 42 pattern.
 
     Args:
         width: Number of columns.
         height: Number of rows.
+        storage: Optional storage specification ("memory" or
+            "mmap:PATH").
+        pattern: Optional pattern cells to use instead of the pattern
+            centered in this grid (see ``config_pattern``).
 
     Returns:
         Tuple of (grid, pattern_positions).
     """
-    grid = [
-        [
-            Cell(
-                CellState.UNVISITED,
-                True, True, True, True,
-                (x, y)
-            ) for x in range(width)
-        ] for y in range(height)
-    ]
-    pattern_positions = set(where_is_ft_pattern(grid))
+    grid = allocate_grid(width, height, storage)
+    pattern_positions = set(
+        where_is_ft_pattern(grid) if pattern is None else pattern
+    )
+    visited = CellState.VISITED.value
     for x, y in pattern_positions:
-        grid[y][x].state = CellState.VISITED
+        grid.states[grid.to_index(x, y)] = visited
     return grid, pattern_positions
 
 
+def index_typecode(size: int) -> Literal["i", "q"]:
+    """Return the smallest array typecode able to hold values below size.
+
+    Args:
+        size: Exclusive upper bound of the stored values.
+
+    Returns:
+        Array typecode ("i" or "q").
+    """
+    return "i" if size < 2**31 else "q"
+
+
+# Wall bit -> step letter and wall bit -> opposite wall bit, as
+# bytes.translate tables for paths stored as one wall bit per step.
+_STEP_LETTERS = bytes(
+    {NORTH: ord("N"), EAST: ord("E"), SOUTH: ord("S"), WEST: ord("W")}
+    .get(bit, 0) for bit in range(256)
+)
+_REVERSED_STEPS = bytes(
+    {NORTH: SOUTH, EAST: WEST, SOUTH: NORTH, WEST: EAST}.get(bit, 0)
+    for bit in range(256)
+)
+
+
+def steps_to_path(steps: bytes | bytearray) -> str:
+    """Convert moves stored as wall bits into a path string.
+
+    Args:
+        steps: Wall bit crossed at each step.
+
+    Returns:
+        Path string composed of N/E/S/W steps.
+    """
+    return steps.translate(_STEP_LETTERS).decode("ascii")
+
+
+def reverse_steps(steps: bytes | bytearray) -> bytes:
+    """Return the moves walking a path backwards.
+
+    Args:
+        steps: Wall bit crossed at each step.
+
+    Returns:
+        Wall bits of the reversed path.
+    """
+    return bytes(steps[::-1].translate(_REVERSED_STEPS))
+
+
+# Items initialized per slice assignment in DisjointSet.
+_RANGE_CHUNK = 1 << 16
+
+
+class DisjointSet:
+    """Disjoint-set (union-find) over integers in ``range(size)``."""
+
+    def __init__(self, size: int, grid: MazeGrid | None = None) -> None:
+        """Initialize every index as its own singleton set.
+
+        Args:
+            size: Number of indices.
+            grid: Optional grid whose storage backend holds the arrays
+                (see ``scratch_plane``).
+        """
+        typecode = index_typecode(size)
+        self.parent = scratch_plane(size, typecode, grid=grid)
+        for start in range(0, size, _RANGE_CHUNK):
+            end = min(start + _RANGE_CHUNK, size)
+            self.parent[start:end] = array(typecode, range(start, end))
+        self.rank = scratch_plane(size, grid=grid)
+
+    def find(self, item: int) -> int:
+        """Find the representative for an item, halving the path.
+
+        Args:
+            item: Index to find.
+
+        Returns:
+            Root representative for the item.
+        """
+        parent = self.parent
+        while parent[item] != item:
+            grandparent = parent[parent[item]]
+            parent[item] = grandparent
+            item = grandparent
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """Union two sets if they are disjoint.
+
+        Args:
+            a: First index.
+            b: Second index.
+
+        Returns:
+            True if a union was performed, False if already connected.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        rank_a = self.rank[root_a]
+        rank_b = self.rank[root_b]
+        if rank_a < rank_b:
+            self.parent[root_a] = root_b
+        elif rank_a > rank_b:
+            self.parent[root_b] = root_a
+        else:
+            self.parent[root_b] = root_a
+            self.rank[root_a] += 1
+        return True
+
+
 def get_neighbors(
         coordinates: tuple[int, int],
-        grid: list[list[Cell]],
+        grid: Sequence[Sequence[Cell]],
         blocked: set[tuple[int, int]] | None = None
 ) -> list[Cell]:
     """Return neighboring cells, excluding blocked positions.
@@ -77,15 +287,151 @@ def remove_walls_between(cell1: Cell, cell2: Cell) -> None:
 
     if x1 == x2:
         if y2 < y1:
-            cell1.north = False
-            cell2.south = False
+            cell1.walls &= ~NORTH
+            cell2.walls &= ~SOUTH
         else:
-            cell1.south = False
-            cell2.north = False
+            cell1.walls &= ~SOUTH
+            cell2.walls &= ~NORTH
     elif y1 == y2:
         if x2 < x1:
-            cell1.west = False
-            cell2.east = False
+            cell1.walls &= ~WEST
+            cell2.walls &= ~EAST
         else:
-            cell1.east = False
-            cell2.west = False
+            cell1.walls &= ~EAST
+            cell2.walls &= ~WEST
+
+
+def load_numpy() -> Any | None:
+    """Import NumPy if it is installed.
+
+    Returns:
+        The numpy module, or None when it is not available.
+    """
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
+
+
+def connect_stranded(
+        grid: MazeGrid,
+        roots: Iterable[int],
+        rng: Random
+) -> None:
+    """Attach stranded trees of a spanning forest to the rest of the maze.
+
+    The open walls of the grid must form a forest whose trees, apart from
+    one main tree, each contain exactly one of the given cells. For each
+    cell, its current region is flooded and one random closed wall towards
+    a different region is opened. Every opening joins two distinct trees,
+    so the result is a single perfect maze. Only the stranded regions are
+    flooded, never the main tree.
+
+    Args:
+        grid: Maze grid whose VISITED cells are blocked.
+        roots: One cell of each tree to attach.
+        rng: Random number generator.
+    """
+    states = grid.states
+    blocked = CellState.VISITED.value
+    for root in roots:
+        region = {root}
+        members = [root]
+        queue = deque(members)
+        while queue:
+            current = queue.popleft()
+            for _, neighbor in grid.open_neighbors(current):
+                if neighbor not in region:
+                    region.add(neighbor)
+                    members.append(neighbor)
+                    queue.append(neighbor)
+        exits = [
+            (cell, wall)
+            for cell in members
+            for wall, neighbor in grid.neighbors(cell)
+            if neighbor not in region and states[neighbor] != blocked
+        ]
+        if exits:
+            cell, wall = rng.choice(exits)
+            grid.open_wall(cell, wall)
+
+
+def connect_regions(
+        grid: MazeGrid,
+        cells: Iterable[int],
+        rng: Random
+) -> None:
+    """Join every region reachable from the given cells into one tree.
+
+    The open walls of the grid must form a forest in which every tree
+    contains at least one of the given cells. A breadth-first flood starts
+    from each cell and the floods advance in turns, merging when they meet.
+    A flood that runs out of cells has covered a whole tree: one random
+    closed wall towards another region is opened and the flood is folded
+    into whichever flood later reaches it. The last flood still running is
+    the largest region, which is never flooded in full.
+
+    Args:
+        grid: Maze grid whose VISITED cells are blocked.
+        cells: Seed cells, typically the cells bordering an obstacle.
+        rng: Random number generator.
+    """
+    states = grid.states
+    blocked = CellState.VISITED.value
+    owner: dict[int, int] = {}
+    parent: list[int] = []
+    queues: dict[int, deque[int]] = {}
+    members: dict[int, list[int]] = {}
+    for cell in cells:
+        if cell in owner or states[cell] == blocked:
+            continue
+        label = len(parent)
+        parent.append(label)
+        owner[cell] = label
+        queues[label] = deque([cell])
+        members[label] = [cell]
+
+    def find(label: int) -> int:
+        """Return the current flood a label was merged into."""
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    while len(queues) > 1:
+        for label in list(queues):
+            queue = queues.get(label)
+            if queue is None:
+                continue
+            if queue:
+                current = queue.popleft()
+                for _, neighbor in grid.open_neighbors(current):
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = label
+                        queue.append(neighbor)
+                        members[label].append(neighbor)
+                        continue
+                    other = find(other)
+                    if other != label:
+                        parent[other] = label
+                        queue.extend(queues.pop(other, ()))
+                        members[label].extend(members.pop(other))
+                continue
+
+            del queues[label]
+            exits = [
+                (cell, wall)
+                for cell in members[label]
+                for wall, neighbor in grid.neighbors(cell)
+                if states[neighbor] != blocked
+                and (neighbor not in owner or find(owner[neighbor]) != label)
+            ]
+            if not exits:
+                continue
+            cell, wall = rng.choice(exits)
+            neighbor = grid.open_wall(cell, wall)
+            if neighbor in owner:
+                other = find(owner[neighbor])
+                parent[label] = other
+                members[other].extend(members.pop(label))
@@ -0,0 +1,214 @@
+"""Growing-tree maze generation."""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
+from itertools import accumulate
+from random import Random
+from src.a_maze_ing.core.cell import CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
+    generate_full_grid,
+    index_typecode
+)
+
+STRATEGIES = ("NEWEST", "RANDOM", "OLDEST")
+DEFAULT_MIX = "NEWEST:75,RANDOM:25"
+
+
+def parse_growing_tree_mix(spec: str) -> list[tuple[str, int]]:
+    """Parse a growing-tree selection mix.
+
+    The mix is a comma-separated list of ``STRATEGY:WEIGHT`` items, e.g.
+    ``NEWEST:75,RANDOM:25``; a bare strategy name has weight 1.
+
+    Args:
+        spec: Value of the GROWING_TREE_MIX key.
+
+    Returns:
+        List of (strategy, weight) pairs with positive weights.
+
+    Raises:
+        ValueError: If the specification is not recognized.
+    """
+    mix = []
+    for item in spec.split(","):
+        name, _, weight = item.partition(":")
+        name = name.strip().upper()
+        try:
+            value = int(weight) if weight.strip() else 1
+        except ValueError:
+            value = 0
+        if name not in STRATEGIES or value < 0:
+            raise ValueError(
+                f"Invalid GROWING_TREE_MIX item '{item.strip()}'. Expected "
+                f"STRATEGY:WEIGHT with STRATEGY in {', '.join(STRATEGIES)}."
+            )
+        if value:
+            mix.append((name, value))
+    if not mix:
+        raise ValueError("GROWING_TREE_MIX needs a positive weight.")
+    return mix
+
+
+class _ActiveCells:
+    """Active cells in insertion order with amortized O(1) pick and removal.
+
+    Removing the oldest cell advances a head offset and removing the
+    newest pops the tail; removing any other cell leaves a tombstone, so
+    the order of the others is kept. The head and tail always hold live
+    cells. RANDOM draws slots until one holds a live cell, and the list is
+    compacted once tombstones outnumber live cells, so a pick takes fewer
+    than two draws on average.
+    """
+
+    DEAD = -1
+
+    def __init__(self, size: int, choices: ChoiceBuffer) -> None:
+        """Initialize an empty list able to hold indices below size.
+
+        Args:
+            size: Number of cells in the grid.
+            choices: Random draws used by the RANDOM strategy.
+        """
+        self.choices = choices
+        self.cells = array(index_typecode(size))
+        self.head = 0
+        self.dead = 0
+
+    def __len__(self) -> int:
+        """Return the number of active cells."""
+        return len(self.cells) - self.head - self.dead
+
+    def append(self, index: int) -> None:
+        """Add a newly carved cell.
+
+        Args:
+            index: Flat index of the cell.
+        """
+        self.cells.append(index)
+
+    def pick(self, strategy: str) -> int:
+        """Return the position of the cell a strategy selects.
+
+        Args:
+            strategy: NEWEST, RANDOM or OLDEST.
+
+        Returns:
+            Position of the selected cell.
+        """
+        if strategy == "NEWEST":
+            return len(self.cells) - 1
+        if strategy == "OLDEST":
+            return self.head
+        span = len(self.cells) - self.head
+        while True:
+            position = self.head + self.choices.below(span)
+            if self.cells[position] != self.DEAD:
+                return position
+
+    def remove(self, position: int) -> None:
+        """Remove the cell at a position.
+
+        Args:
+            position: Position returned by ``pick``.
+        """
+        cells = self.cells
+        if position == len(cells) - 1:
+            cells.pop()
+            while len(cells) > self.head and cells[-1] == self.DEAD:
+                cells.pop()
+                self.dead -= 1
+        elif position == self.head:
+            self.head += 1
+            while cells[self.head] == self.DEAD:
+                self.head += 1
+                self.dead -= 1
+        else:
+            cells[position] = self.DEAD
+            self.dead += 1
+        if self.dead * 2 > len(cells) - self.head:
+            self.cells = array(cells.typecode, [
+                index for index in cells[self.head:] if index != self.DEAD
+            ])
+            self.head = 0
+            self.dead = 0
+        elif self.head * 2 > len(cells):
+            del cells[:self.head]
+            self.head = 0
+
+
+def generate_growing_tree(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze using the growing-tree algorithm.
+
+    At each step a strategy is drawn from GROWING_TREE_MIX to select an
+    active cell: NEWEST behaves like the recursive backtracker, RANDOM like
+    Prim's algorithm and OLDEST gives long straight corridors. The cell
+    carves into a random unvisited neighbor, or leaves the active list once
+    it has none.
+
+    Args:
+        config: Configuration dictionary with WIDTH, HEIGHT, ENTRY keys and
+            an optional GROWING_TREE_MIX key.
+        on_step: Optional callback called after each carving step.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    entry = config["ENTRY"]
+    assert isinstance(entry, tuple)
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    spec = config.get("GROWING_TREE_MIX", DEFAULT_MIX)
+    assert isinstance(spec, str)
+    strategies, weights = zip(*parse_growing_tree_mix(spec))
+    single = strategies[0] if len(strategies) == 1 else None
+
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    states = grid.states
+    unvisited = CellState.UNVISITED.value
+    in_maze = CellState.IN_MAZE.value
+    choices = ChoiceBuffer(ensure_rng(rng))
+    bounds = list(accumulate(weights))
+    active = _ActiveCells(grid.size, choices)
+    start = grid.to_index(*entry)
+    states[start] = in_maze
+    active.append(start)
+    if on_step:
+        on_step(grid)
+
+    while active:
+        strategy = single or strategies[
+            bisect_right(bounds, choices.below(bounds[-1]))
+        ]
+        position = active.pick(strategy)
+        current = active.cells[position]
+        neighbors = [
+            (wall, neighbor) for wall, neighbor in grid.neighbors(current)
+            if states[neighbor] == unvisited
+        ]
+        if not neighbors:
+            active.remove(position)
+            continue
+        wall, neighbor = choices.choice(neighbors)
+        grid.open_wall(current, wall)
+        states[neighbor] = in_maze
+        active.append(neighbor)
+        if on_step:
+            on_step(grid)
+
+    return grid
@@ -0,0 +1,281 @@
+"""Hierarchical path planning (HPA*) over square clusters of a maze."""
+
+from collections import deque
+from heapq import heappop, heappush
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.grid_utils import steps_to_path
+
+
+class HierarchicalPlanner:
+    """Two-level path planner for large mazes, loops included.
+
+    The grid is split into square clusters. Border cells (cells with an
+    open wall into another cluster) are the nodes of an abstract graph:
+    crossings link two border cells with a cost of 1, and the distances
+    between the border cells of each cluster, staying inside it, are
+    precomputed once. A query links the entry and exit to the borders of
+    their clusters, runs A* on the abstract graph, then refines every
+    hop inside a cluster with ``a_star`` bounded to that cluster. Every
+    crossing is its own node, so the paths found are shortest paths.
+
+    Attributes:
+        grid: Planned maze grid.
+        cluster_size: Side of the clusters, in cells.
+        columns: Number of cluster columns.
+        rows: Number of cluster rows.
+        borders: Border cells of each cluster.
+        links: Distance from each border cell to the other border cells
+            of its cluster, per cluster.
+    """
+
+    def __init__(self, grid: MazeGrid, cluster_size: int = 32) -> None:
+        """Split a maze into clusters and precompute their distances.
+
+        Args:
+            grid: Maze grid. Walls changed afterwards must be reported
+                with ``open_wall``, ``close_wall`` or ``invalidate``.
+            cluster_size: Side of the clusters, in cells.
+
+        Raises:
+            ValueError: If cluster_size is smaller than 1.
+        """
+        if cluster_size < 1:
+            raise ValueError("cluster_size must be at least 1.")
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.columns = -(-grid.width // cluster_size)
+        self.rows = -(-grid.height // cluster_size)
+        count = self.columns * self.rows
+        self.borders: list[list[int]] = [[] for _ in range(count)]
+        self.links: list[dict[int, list[tuple[int, int]]]] = [
+            {} for _ in range(count)
+        ]
+        for cluster in range(count):
+            self._build_cluster(cluster)
+
+    def cluster_of(self, cell: int) -> int:
+        """Return the cluster containing a cell.
+
+        Args:
+            cell: Flat cell index.
+
+        Returns:
+            Cluster index, row by row.
+        """
+        y, x = divmod(cell, self.grid.width)
+        size = self.cluster_size
+        return (y // size) * self.columns + x // size
+
+    def cluster_bounds(self, cluster: int) -> tuple[int, int, int, int]:
+        """Return the rectangle covered by a cluster.
+
+        Args:
+            cluster: Cluster index.
+
+        Returns:
+            Rectangle as (x, y, width, height); clusters on the right and
+            bottom edges may be smaller than cluster_size.
+        """
+        size = self.cluster_size
+        row, column = divmod(cluster, self.columns)
+        x = column * size
+        y = row * size
+        return (x, y, min(size, self.grid.width - x),
+                min(size, self.grid.height - y))
+
+    def _crossings(self, cell: int) -> list[int]:
+        """Return the open neighbors of a cell in other clusters.
+
+        Args:
+            cell: Flat cell index.
+
+        Returns:
+            Flat indices of the neighbors.
+        """
+        cluster = self.cluster_of(cell)
+        return [
+            neighbor for _, neighbor in self.grid.open_neighbors(cell)
+            if self.cluster_of(neighbor) != cluster
+        ]
+
+    def _local_distances(self, start: int) -> dict[int, int]:
+        """Breadth-first distances from a cell, inside its cluster.
+
+        Args:
+            start: Flat cell index.
+
+        Returns:
+            Distance to every cell of the cluster reachable without
+            leaving it.
+        """
+        grid = self.grid
+        cluster = self.cluster_of(start)
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            for _, neighbor in grid.open_neighbors(current):
+                if neighbor not in distances \
+                        and self.cluster_of(neighbor) == cluster:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return distances
+
+    def _build_cluster(self, cluster: int) -> None:
+        """Find the border cells of a cluster and their distances.
+
+        Args:
+            cluster: Cluster index.
+        """
+        x, y, width, height = self.cluster_bounds(cluster)
+        grid_width = self.grid.width
+        borders = [
+            row * grid_width + column
+            for row in range(y, y + height)
+            for column in range(x, x + width)
+            if self._crossings(row * grid_width + column)
+        ]
+        links = {}
+        for border in borders:
+            distances = self._local_distances(border)
+            links[border] = [
+                (other, distances[other]) for other in borders
+                if other != border and other in distances
+            ]
+        self.borders[cluster] = borders
+        self.links[cluster] = links
+
+    def invalidate(self, *cells: int) -> None:
+        """Recompute the clusters containing cells whose walls changed.
+
+        Only these clusters are rebuilt; for a wall on a cluster edge,
+        pass the cells on both sides.
+
+        Args:
+            cells: Flat indices of the changed cells.
+        """
+        for cluster in {self.cluster_of(cell) for cell in cells}:
+            self._build_cluster(cluster)
+
+    def open_wall(self, x: int, y: int, wall: int) -> None:
+        """Break a wall and update the affected clusters.
+
+        Args:
+            x: Column of the cell.
+            y: Row of the cell.
+            wall: Wall bit to open; the neighbor behind it must exist.
+        """
+        index = self.grid.to_index(x, y)
+        self.invalidate(index, self.grid.open_wall(index, wall))
+
+    def close_wall(self, x: int, y: int, wall: int) -> None:
+        """Close a wall and update the affected clusters.
+
+        Args:
+            x: Column of the cell.
+            y: Row of the cell.
+            wall: Wall bit to close; the neighbor behind it must exist.
+        """
+        index = self.grid.to_index(x, y)
+        self.invalidate(index, self.grid.close_wall(index, wall))
+
+    def _abstract_path(self, start: int, goal: int) -> list[int]:
+        """Search the abstract graph between two cells.
+
+        Args:
+            start: Flat index of the entry cell.
+            goal: Flat index of the exit cell.
+
+        Returns:
+            Cells of the abstract path, from start to goal, or an empty
+            list if there is no path.
+        """
+        width = self.grid.width
+        goal_y, goal_x = divmod(goal, width)
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        distances = self._local_distances(start)
+        start_links = [
+            (border, distances[border])
+            for border in self.borders[start_cluster]
+            if border in distances
+        ]
+        if goal in distances:
+            start_links.append((goal, distances[goal]))
+        distances = self._local_distances(goal)
+        goal_links = {
+            border: distances[border]
+            for border in self.borders[goal_cluster]
+            if border in distances
+        }
+
+        g_score = {start: 0}
+        parents: dict[int, int] = {}
+        closed = set()
+        counter = 0
+        open_set = [(0, counter, start)]
+        while open_set:
+            _, _, current = heappop(open_set)
+            if current == goal:
+                path = [goal]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+            if current in closed:
+                continue
+            closed.add(current)
+            if current == start:
+                edges = list(start_links)
+            else:
+                cluster = self.cluster_of(current)
+                edges = list(self.links[cluster].get(current, ()))
+                if current in goal_links:
+                    edges.append((goal, goal_links[current]))
+            edges.extend((cell, 1) for cell in self._crossings(current))
+            for neighbor, cost in edges:
+                tentative_g = g_score[current] + cost
+                if neighbor in closed or \
+                        tentative_g >= g_score.get(neighbor, tentative_g + 1):
+                    continue
+                g_score[neighbor] = tentative_g
+                parents[neighbor] = current
+                y, x = divmod(neighbor, width)
+                counter += 1
+                heappush(open_set, (
+                    tentative_g + abs(x - goal_x) + abs(y - goal_y),
+                    counter,
+                    neighbor
+                ))
+        return []
+
+    def path(self, entry: tuple[int, int], exit: tuple[int, int]) -> str:
+        """Return a shortest path between two cells.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Path string composed of N/E/S/W steps. Empty string if no path.
+        """
+        grid = self.grid
+        nodes = self._abstract_path(grid.to_index(*entry),
+                                    grid.to_index(*exit))
+        pieces = []
+        for current, following in zip(nodes, nodes[1:]):
+            cluster = self.cluster_of(current)
+            if cluster != self.cluster_of(following):
+                for wall, neighbor in grid.open_neighbors(current):
+                    if neighbor == following:
+                        pieces.append(steps_to_path(bytes([wall])))
+                continue
+            pieces.append(a_star(
+                grid.to_coordinates(current),
+                grid.to_coordinates(following),
+                grid,
+                bounds=self.cluster_bounds(cluster)
+            ))
+        return "".join(pieces)
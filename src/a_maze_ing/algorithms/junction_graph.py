@@ -0,0 +1,342 @@
+"""Maze graph with corridors contracted into weighted edges."""
+
+from array import array
+from collections.abc import Sequence
+from heapq import heappop, heappush
+from src.a_maze_ing.core.cell import OPPOSITE_WALLS, Cell
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.algorithms.grid_utils import index_typecode
+from src.a_maze_ing.algorithms.grid_utils import reverse_steps
+from src.a_maze_ing.algorithms.grid_utils import steps_to_path
+
+# Attachment of a cell to the graph: (node, cost, edge, forward), where
+# the cell reaches node by walking cost steps along edge, in the edge
+# direction if forward. Nodes themselves use edge -1.
+_Anchor = tuple[int, int, int, bool]
+
+
+class JunctionGraph:
+    """Junctions and dead ends of a maze, linked by their corridors.
+
+    Most cells of a maze have exactly two open sides: they only lead from
+    one cell to the next. The graph keeps the other cells (junctions and
+    dead ends) as nodes, and replaces each corridor between two of them
+    by a single edge weighted by its length. Shortest paths are searched
+    on this graph with Dijkstra's algorithm, then expanded back into
+    steps by walking the corridors they use. Loops are kept as parallel
+    edges or self loops, and a closed ring of corridor cells gets one of
+    its cells as a node.
+
+    Attributes:
+        grid: Indexed maze grid.
+        nodes: Flat index of the cell of each node.
+        edge_from: Node each edge starts from.
+        edge_to: Node each edge ends at.
+        edge_length: Number of steps of each edge.
+        edge_wall: First wall bit crossed by each edge.
+        adjacency: (edge, forward) pairs leaving each node.
+    """
+
+    def __init__(self, grid: MazeGrid) -> None:
+        """Contract the corridors of a maze.
+
+        Args:
+            grid: Maze grid; it must not be modified afterwards.
+        """
+        size = grid.size
+        typecode = index_typecode(size)
+        self.grid = grid
+        self.nodes = array(typecode)
+        self.edge_from = array(typecode)
+        self.edge_to = array(typecode)
+        self.edge_length = array(typecode)
+        self.edge_wall = bytearray()
+        self.adjacency: list[list[tuple[int, bool]]] = []
+        self._node_of = array(typecode, [-1]) * size
+        # Edge holding each corridor cell and its distance along the edge.
+        self._edge_of = array(typecode, [-1]) * size
+        self._offsets = array(typecode, [0]) * size
+
+        self.cell_count = 0
+        degrees = bytearray(size)
+        for cell in range(size):
+            degree = len(grid.open_neighbors(cell))
+            degrees[cell] = degree
+            if degree:
+                self.cell_count += 1
+            if degree and degree != 2:
+                self._add_node(cell)
+        for node in range(len(self.nodes)):
+            self._trace_corridors(node)
+        for cell in range(size):
+            if degrees[cell] == 2 and self._node_of[cell] < 0 \
+                    and self._edge_of[cell] < 0:
+                self._trace_corridors(self._add_node(cell))
+
+    def _add_node(self, cell: int) -> int:
+        """Make a cell a node.
+
+        Args:
+            cell: Flat cell index.
+
+        Returns:
+            Index of the new node.
+        """
+        node = len(self.nodes)
+        self.nodes.append(cell)
+        self.adjacency.append([])
+        self._node_of[cell] = node
+        return node
+
+    def _trace_corridors(self, node: int) -> None:
+        """Add the edges leaving a node that are not known yet.
+
+        Args:
+            node: Index of the node.
+        """
+        grid = self.grid
+        node_of = self._node_of
+        edge_of = self._edge_of
+        offsets = self._offsets
+        start = self.nodes[node]
+        for wall, current in grid.open_neighbors(start):
+            if node_of[current] >= 0:
+                # Adjacent nodes: add the edge from the lower cell only.
+                if start < current:
+                    self._add_edge(node, node_of[current], 1, wall)
+                continue
+            if edge_of[current] >= 0:
+                continue
+            edge = len(self.edge_from)
+            length = 1
+            came = wall
+            while node_of[current] < 0:
+                edge_of[current] = edge
+                offsets[current] = length
+                back = OPPOSITE_WALLS[came]
+                for came, next_cell in grid.open_neighbors(current):
+                    if came != back:
+                        break
+                current = next_cell
+                length += 1
+            self._add_edge(node, node_of[current], length, wall)
+
+    def _add_edge(self, first: int, second: int, length: int,
+                  wall: int) -> None:
+        """Link two nodes.
+
+        Args:
+            first: Node the edge starts from.
+            second: Node the edge ends at.
+            length: Number of steps of the edge.
+            wall: First wall bit crossed from the first node.
+        """
+        edge = len(self.edge_from)
+        self.edge_from.append(first)
+        self.edge_to.append(second)
+        self.edge_length.append(length)
+        self.edge_wall.append(wall)
+        self.adjacency[first].append((edge, True))
+        self.adjacency[second].append((edge, False))
+
+    @property
+    def compression_ratio(self) -> float:
+        """Return the number of open cells per graph node.
+
+        Returns:
+            Open cells divided by nodes, 1.0 for a maze without nodes.
+        """
+        if not self.nodes:
+            return 1.0
+        return self.cell_count / len(self.nodes)
+
+    def _edge_steps(self, edge: int) -> bytes:
+        """Walk an edge from its first node.
+
+        Args:
+            edge: Index of the edge.
+
+        Returns:
+            Wall bit crossed at each step.
+        """
+        grid = self.grid
+        wall = self.edge_wall[edge]
+        steps = bytearray([wall])
+        current = grid.neighbor(self.nodes[self.edge_from[edge]], wall)
+        assert current is not None
+        for _ in range(self.edge_length[edge] - 1):
+            back = OPPOSITE_WALLS[wall]
+            for wall, current in grid.open_neighbors(current):
+                if wall != back:
+                    break
+            steps.append(wall)
+        return bytes(steps)
+
+    def _anchors(self, cell: int) -> list[_Anchor]:
+        """Return the ways a cell reaches the graph.
+
+        Args:
+            cell: Flat cell index.
+
+        Returns:
+            Anchors leaving the cell: itself if it is a node, both ends of
+            its corridor otherwise, nothing for a closed cell.
+        """
+        node = self._node_of[cell]
+        if node >= 0:
+            return [(node, 0, -1, True)]
+        edge = self._edge_of[cell]
+        if edge < 0:
+            return []
+        offset = self._offsets[cell]
+        return [
+            (self.edge_from[edge], offset, edge, False),
+            (self.edge_to[edge], self.edge_length[edge] - offset, edge,
+             True),
+        ]
+
+    def path(self, entry: tuple[int, int], exit: tuple[int, int]) -> str:
+        """Return a shortest path between two cells.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Path string composed of N/E/S/W steps. Empty string if no path.
+        """
+        start = self.grid.to_index(*entry)
+        goal = self.grid.to_index(*exit)
+        if start == goal:
+            return ""
+        edge_to = self.edge_to
+        edge_from = self.edge_from
+        edge_length = self.edge_length
+
+        targets: dict[int, _Anchor] = {}
+        for anchor in self._anchors(goal):
+            if anchor[0] not in targets or anchor[1] < targets[anchor[0]][1]:
+                targets[anchor[0]] = anchor
+        best = -1
+        best_node = -1
+        edge = self._edge_of[start]
+        if edge >= 0 and edge == self._edge_of[goal]:
+            best = abs(self._offsets[start] - self._offsets[goal])
+
+        distances: dict[int, int] = {}
+        parents: dict[int, tuple[int, int, bool]] = {}
+        queue: list[tuple[int, int]] = []
+        for node, cost, edge, forward in self._anchors(start):
+            if node not in distances or cost < distances[node]:
+                distances[node] = cost
+                parents[node] = (-1, edge, forward)
+                heappush(queue, (cost, node))
+        while queue:
+            distance, node = heappop(queue)
+            if distance > distances[node]:
+                continue
+            if 0 <= best <= distance:
+                break
+            if node in targets:
+                total = distance + targets[node][1]
+                if best < 0 or total < best:
+                    best = total
+                    best_node = node
+            for edge, forward in self.adjacency[node]:
+                other = edge_to[edge] if forward else edge_from[edge]
+                total = distance + edge_length[edge]
+                if other not in distances or total < distances[other]:
+                    distances[other] = total
+                    parents[other] = (node, edge, forward)
+                    heappush(queue, (total, other))
+
+        if best < 0:
+            return ""
+        if best_node < 0:
+            steps = self._edge_steps(self._edge_of[start])
+            first = self._offsets[start]
+            last = self._offsets[goal]
+            if first < last:
+                return steps_to_path(steps[first:last])
+            return steps_to_path(reverse_steps(steps[last:first]))
+        return steps_to_path(self._expand(start, goal, best_node, targets,
+                                          parents))
+
+    def _expand(
+            self,
+            start: int,
+            goal: int,
+            node: int,
+            targets: dict[int, _Anchor],
+            parents: dict[int, tuple[int, int, bool]]
+    ) -> bytes:
+        """Rebuild the steps of a path found on the graph.
+
+        Args:
+            start: Flat index of the entry cell.
+            goal: Flat index of the exit cell.
+            node: Last node of the path before the exit.
+            targets: Anchors of the exit, by node.
+            parents: Previous node, edge and direction of each node.
+
+        Returns:
+            Wall bit crossed at each step.
+        """
+        pieces: list[bytes] = []
+        _, _, edge, forward = targets[node]
+        if edge >= 0:
+            # Enter the exit corridor from node, against the anchor.
+            steps = self._edge_steps(edge)
+            offset = self._offsets[goal]
+            if forward:
+                pieces.append(reverse_steps(steps[offset:]))
+            else:
+                pieces.append(steps[:offset])
+        while True:
+            previous, edge, forward = parents[node]
+            if edge < 0:
+                break
+            steps = self._edge_steps(edge)
+            if previous < 0:
+                offset = self._offsets[start]
+                if forward:
+                    pieces.append(steps[offset:])
+                else:
+                    pieces.append(reverse_steps(steps[:offset]))
+                break
+            pieces.append(steps if forward else reverse_steps(steps))
+            node = previous
+        pieces.reverse()
+        return b"".join(pieces)
+
+    def distance(
+            self,
+            entry: tuple[int, int],
+            exit: tuple[int, int]
+    ) -> int:
+        """Return the length of a shortest path between two cells.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Number of steps, or -1 if there is no path.
+        """
+        if entry == exit:
+            return 0
+        return len(self.path(entry, exit)) or -1
+
+
+def junction_graph(grid: Sequence[Sequence[Cell]]) -> JunctionGraph:
+    """Build the junction graph of any maze grid.
+
+    Args:
+        grid: 2D maze grid.
+
+    Returns:
+        Junction graph of the maze.
+    """
+    if not isinstance(grid, MazeGrid):
+        grid = MazeGrid.from_cells(grid)
+    return JunctionGraph(grid)
@@ -1,106 +1,73 @@
 """Kruskal-based maze generation."""
 
-from collections.abc import Callable
-from random import shuffle as random_shuffle
-from src.a_maze_ing.core.cell import Cell, CellState
+from collections.abc import Callable, MutableSequence
+from random import Random
+from typing import cast
+from src.a_maze_ing.core.cell import EAST, SOUTH, CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ensure_rng
+from src.a_maze_ing.core.storage import scratch_plane
 from src.a_maze_ing.core.types import MazeConfig
 from src.a_maze_ing.algorithms.grid_utils import (
+    DisjointSet,
+    config_pattern,
+    config_storage,
     generate_full_grid,
-    remove_walls_between
+    index_typecode
 )
 
+# Edge codes store the cell index shifted left once; the low bit selects
+# the wall opened from that cell.
+_EDGE_WALLS = (SOUTH, EAST)
 
-class _DisjointSet:
-    """Disjoint-set (union-find) structure for Kruskal."""
-
-    def __init__(self, items: list[tuple[int, int]]) -> None:
-        """Initialize the disjoint set with individual items.
-
-        Args:
-            items: Items to store, keyed by coordinates.
-        """
-        self.parent = {item: item for item in items}
-        self.rank = {item: 0 for item in items}
-
-    def find(self, item: tuple[int, int]) -> tuple[int, int]:
-        """Find the representative for an item.
-
-        Args:
-            item: Item to find.
-
-        Returns:
-            Root representative for the item.
-        """
-        parent = self.parent[item]
-        if parent != item:
-            self.parent[item] = self.find(parent)
-        return self.parent[item]
-
-    def union(self, a: tuple[int, int], b: tuple[int, int]) -> bool:
-        """Union two sets if they are disjoint.
-
-        Args:
-            a: First item.
-            b: Second item.
-
-        Returns:
-            True if a union was performed, False if already connected.
-        """
-        root_a = self.find(a)
-        root_b = self.find(b)
-        if root_a == root_b:
-            return False
-        rank_a = self.rank[root_a]
-        rank_b = self.rank[root_b]
-        if rank_a < rank_b:
-            self.parent[root_a] = root_b
-        elif rank_a > rank_b:
-            self.parent[root_b] = root_a
-        else:
-            self.parent[root_b] = root_a
-            self.rank[root_a] += 1
-        return True
-
-
-def _get_edges(grid: list[list[Cell]]) -> list[tuple[Cell, Cell]]:
+
+def _get_edges(grid: MazeGrid) -> memoryview:
     """Collect candidate edges between adjacent unvisited cells.
 
     Args:
-        grid: 2D maze grid.
+        grid: Maze grid whose VISITED cells are blocked.
 
     Returns:
-        List of cell pairs representing edges.
+        Packed edge codes (``index << 1 | axis``), stored on the grid's
+        storage backend.
     """
-    edges: list[tuple[Cell, Cell]] = []
-    height = len(grid)
-    width = len(grid[0]) if height > 0 else 0
-
-    for y in range(height):
-        for x in range(width):
-            cell = grid[y][x]
-            if cell.state == CellState.VISITED:
-                continue
-            if y + 1 < height:
-                neighbor = grid[y + 1][x]
-                if neighbor.state != CellState.VISITED:
-                    edges.append((cell, neighbor))
-            if x + 1 < width:
-                neighbor = grid[y][x + 1]
-                if neighbor.state != CellState.VISITED:
-                    edges.append((cell, neighbor))
-
-    return edges
+    width = grid.width
+    size = grid.size
+    states = grid.states
+    blocked = CellState.VISITED.value
+    edges = scratch_plane(2 * size, index_typecode(2 * size), grid=grid)
+    count = 0
+
+    for index in range(size):
+        if states[index] == blocked:
+            continue
+        below = index + width
+        if below < size and states[below] != blocked:
+            edges[count] = index << 1
+            count += 1
+        if (index + 1) % width and states[index + 1] != blocked:
+            edges[count] = index << 1 | 1
+            count += 1
+
+    return edges[:count]
 
 
 def generate_kruskal(
         config: MazeConfig,
-        on_step: Callable[[list[list[Cell]]], None] | None = None
-) -> list[list[Cell]]:
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
     """Generate a perfect maze using Kruskal's algorithm.
 
+    Cells are flat indices and edges are packed integers, shuffled in
+    one pass and merged through an array-backed union-find; both arrays
+    follow the grid storage backend.
+
     Args:
         config: Configuration dictionary with WIDTH and HEIGHT keys.
         on_step: Optional callback called after each carving step.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
 
     Returns:
         Generated maze grid.
@@ -110,24 +77,22 @@ def generate_kruskal(
     assert isinstance(width, int)
     assert isinstance(height, int)
 
-    grid, _ = generate_full_grid(width, height)
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
     edges = _get_edges(grid)
-    random_shuffle(edges)
-
-    items = [
-        cell.coordinates
-        for row in grid
-        for cell in row
-        if cell.state != CellState.VISITED
-    ]
-    disjoint_set = _DisjointSet(items)
+    ensure_rng(rng).shuffle(cast(MutableSequence[int], edges))
+    disjoint_set = DisjointSet(grid.size, grid)
+    offsets = (width, 1)
 
     if on_step:
         on_step(grid)
 
-    for cell1, cell2 in edges:
-        if disjoint_set.union(cell1.coordinates, cell2.coordinates):
-            remove_walls_between(cell1, cell2)
+    for edge in edges:
+        index = edge >> 1
+        axis = edge & 1
+        if disjoint_set.union(index, index + offsets[axis]):
+            grid.open_wall(index, _EDGE_WALLS[axis])
             if on_step:
                 on_step(grid)
 
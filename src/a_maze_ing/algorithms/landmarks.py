@@ -0,0 +1,196 @@
+"""Landmark (ALT) distance heuristic for A* on a fixed maze."""
+
+from array import array
+from collections import deque
+from collections.abc import Callable
+from random import Random
+from src.a_maze_ing.core.cell import ALL_WALLS, EAST, NORTH, SOUTH, WEST
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ensure_rng
+
+
+def distance_typecode(size: int) -> str:
+    """Return the smallest unsigned typecode for distances in a grid.
+
+    Distances are below size, and the largest value of the typecode is
+    kept as the "unreachable" marker.
+
+    Args:
+        size: Number of cells.
+
+    Returns:
+        Array typecode ("H", "I" or "Q").
+    """
+    if size < 2**16:
+        return "H"
+    if size < 2**32:
+        return "I"
+    return "Q"
+
+
+class Landmarks:
+    """Breadth-first distances from a few landmark cells.
+
+    For any landmark L, the triangle inequality gives
+    ``|d(L, goal) - d(L, cell)| <= d(cell, goal)``, so the largest of
+    these differences is a lower bound of the distance to the goal that
+    follows the maze walls, unlike the Manhattan distance. Landmarks are
+    picked by farthest-point sampling: each one is the cell farthest from
+    the landmarks already chosen, which places them at the ends of long
+    corridors where the bound is tightest. One distance array per
+    landmark is stored with the smallest typecode able to hold the grid
+    size.
+
+    Attributes:
+        grid: Maze grid the distances were measured on.
+        cells: Flat index of each landmark.
+        distances: Distance from each landmark to every cell.
+        unreachable: Distance stored for cells a landmark cannot reach.
+    """
+
+    def __init__(
+            self,
+            grid: MazeGrid,
+            count: int = 8,
+            rng: Random | None = None
+    ) -> None:
+        """Pick landmarks and measure their distances.
+
+        Args:
+            grid: Maze grid; it must not be modified afterwards.
+            count: Maximum number of landmarks; fewer are kept when every
+                reachable cell is already a landmark.
+            rng: Optional random number generator picking the cell the
+                sampling starts from.
+
+        Raises:
+            ValueError: If count is smaller than 1.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+        self.grid = grid
+        typecode = distance_typecode(grid.size)
+        self.unreachable = 2 ** (8 * array(typecode).itemsize) - 1
+        self.cells: list[int] = []
+        self.distances: list[array[int]] = []
+
+        size = grid.size
+        walls = grid.walls
+        origin = ensure_rng(rng).randrange(size)
+        for _ in range(size):
+            if walls[origin] != ALL_WALLS:
+                break
+            origin = (origin + 1) % size
+        # Distance from each cell to the nearest landmark so far (to the
+        # origin before the first one), 0 for cells the origin cannot
+        # reach so that they are never picked.
+        gaps = self._reached(self._breadth_first(origin))
+        for _ in range(count):
+            gap = max(gaps)
+            if self.cells and gap == 0:
+                break
+            farthest = gaps.index(gap)
+            distances = self._breadth_first(farthest)
+            if self.cells:
+                gaps = array(gaps.typecode, map(min, gaps, distances))
+            else:
+                gaps = self._reached(distances)
+            self.cells.append(farthest)
+            self.distances.append(distances)
+
+    def _reached(self, distances: "array[int]") -> "array[int]":
+        """Replace the unreachable markers of a distance array by 0.
+
+        Args:
+            distances: Distances from a cell.
+
+        Returns:
+            New distance array.
+        """
+        unreachable = self.unreachable
+        return array(distances.typecode, (
+            0 if distance == unreachable else distance
+            for distance in distances
+        ))
+
+    def _breadth_first(self, start: int) -> "array[int]":
+        """Measure the distance from a cell to every cell.
+
+        Args:
+            start: Flat index of the start cell.
+
+        Returns:
+            Distance of every cell, ``unreachable`` if there is no path.
+        """
+        grid = self.grid
+        width = grid.width
+        height = grid.height
+        walls = grid.walls
+        unreachable = self.unreachable
+        distances = array(distance_typecode(grid.size), [unreachable])
+        distances *= grid.size
+        distances[start] = 0
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            y, x = divmod(current, width)
+            cell_walls = walls[current]
+            for move, neighbor, is_open in (
+                    (NORTH, current - width, y > 0),
+                    (SOUTH, current + width, y < height - 1),
+                    (WEST, current - 1, x > 0),
+                    (EAST, current + 1, x < width - 1)
+            ):
+                if is_open and not cell_walls & move \
+                        and distances[neighbor] == unreachable:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return distances
+
+    def heuristic(self, exit: tuple[int, int]) -> Callable[[int], int]:
+        """Return an A* heuristic towards a cell, for ``a_star``.
+
+        The estimate is the largest of the landmark lower bounds and the
+        Manhattan distance.
+
+        Args:
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Function mapping a flat cell index to a lower bound of its
+            distance to the exit.
+        """
+        width = self.grid.width
+        goal_x, goal_y = exit
+        goal = self.grid.to_index(goal_x, goal_y)
+        unreachable = self.unreachable
+        columns = [
+            (distances, distances[goal]) for distances in self.distances
+            if distances[goal] != unreachable
+        ]
+
+        def estimate(index: int) -> int:
+            y, x = divmod(index, width)
+            best = abs(x - goal_x) + abs(y - goal_y)
+            for distances, to_goal in columns:
+                gap = distances[index] - to_goal
+                if gap < 0:
+                    gap = -gap
+                if gap > best and distances[index] != unreachable:
+                    best = gap
+            return best
+
+        return estimate
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the distance arrays.
+
+        Returns:
+            Size in bytes.
+        """
+        return sum(
+            len(distances) * distances.itemsize
+            for distances in self.distances
+        )
@@ -0,0 +1,88 @@
+"""Randomized Prim's algorithm for maze generation."""
+
+from array import array
+from collections.abc import Callable
+from random import Random
+from src.a_maze_ing.core.cell import CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
+    generate_full_grid,
+    index_typecode
+)
+
+
+def _add_to_maze(grid: MazeGrid, frontier: array, index: int) -> None:
+    """Mark a cell as carved and push its unvisited neighbors.
+
+    Args:
+        grid: Maze grid.
+        frontier: Frontier cell indices.
+        index: Flat index of the newly carved cell.
+    """
+    states = grid.states
+    unvisited = CellState.UNVISITED.value
+    states[index] = CellState.IN_MAZE.value
+    for _, neighbor in grid.neighbors(index):
+        if states[neighbor] == unvisited:
+            states[neighbor] = CellState.FRONTIER.value
+            frontier.append(neighbor)
+
+
+def generate_prim(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze using randomized Prim's algorithm.
+
+    Frontier cells (unvisited cells next to the maze) live in a flat array.
+    A random frontier cell is removed in O(1) by moving the last entry into
+    its slot, then joined to a random neighbor already in the maze.
+
+    Args:
+        config: Configuration dictionary with WIDTH, HEIGHT, ENTRY keys.
+        on_step: Optional callback called after each carving step.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    entry = config["ENTRY"]
+    assert isinstance(entry, tuple)
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    states = grid.states
+    in_maze = CellState.IN_MAZE.value
+    frontier = array(index_typecode(grid.size))
+    choices = ChoiceBuffer(ensure_rng(rng))
+
+    _add_to_maze(grid, frontier, grid.to_index(*entry))
+    if on_step:
+        on_step(grid)
+
+    while frontier:
+        position = choices.below(len(frontier))
+        current = frontier[position]
+        last = frontier.pop()
+        if position < len(frontier):
+            frontier[position] = last
+        wall = choices.choice([
+            wall for wall, neighbor in grid.neighbors(current)
+            if states[neighbor] == in_maze
+        ])
+        grid.open_wall(current, wall)
+        _add_to_maze(grid, frontier, current)
+        if on_step:
+            on_step(grid)
+
+    return grid
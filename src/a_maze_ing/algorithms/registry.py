@@ -0,0 +1,45 @@
+"""Lookup table of the available maze generators."""
+
+from collections.abc import Callable
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.algorithms.binary_tree import generate_binary_tree
+from src.a_maze_ing.algorithms.dfs import generate_dfs
+from src.a_maze_ing.algorithms.division import generate_division
+from src.a_maze_ing.algorithms.eller import generate_eller
+from src.a_maze_ing.algorithms.growing_tree import generate_growing_tree
+from src.a_maze_ing.algorithms.kruskal import generate_kruskal
+from src.a_maze_ing.algorithms.prim import generate_prim
+from src.a_maze_ing.algorithms.sidewinder import generate_sidewinder
+from src.a_maze_ing.algorithms.wilson import (
+    generate_aldous_broder_wilson,
+    generate_wilson
+)
+
+MazeGeneratorFunction = Callable[..., MazeGrid]
+
+GENERATORS: dict[str, MazeGeneratorFunction] = {
+    "DFS": generate_dfs,
+    "KRUSKAL": generate_kruskal,
+    "WILSON": generate_wilson,
+    "ELLER": generate_eller,
+    "BINARY_TREE": generate_binary_tree,
+    "SIDEWINDER": generate_sidewinder,
+    "PRIM": generate_prim,
+    "GROWING_TREE": generate_growing_tree,
+    "DIVISION": generate_division,
+    "ALDOUS_BRODER_WILSON": generate_aldous_broder_wilson,
+}
+
+
+def get_generator(algorithm: object) -> MazeGeneratorFunction:
+    """Return the generator registered for an ALGORITHM value.
+
+    Args:
+        algorithm: ALGORITHM config value; unknown values fall back to DFS.
+
+    Returns:
+        Maze generator callable.
+    """
+    if isinstance(algorithm, str):
+        return GENERATORS.get(algorithm.strip().upper(), generate_dfs)
+    return generate_dfs
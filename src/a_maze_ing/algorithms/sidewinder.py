@@ -0,0 +1,158 @@
+"""Sidewinder maze generation."""
+
+from collections.abc import Callable
+from random import Random
+from typing import Any
+from src.a_maze_ing.core.cell import ALL_WALLS, EAST, NORTH, SOUTH, WEST
+from src.a_maze_ing.core.cell import CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.core.storage import MappedMazeGrid
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
+    connect_stranded,
+    generate_full_grid,
+    load_numpy
+)
+
+# Optional: whole-grid array operations when NumPy is installed.
+_numpy = load_numpy()
+
+
+def _carve_numpy(grid: MazeGrid, np: Any, rng: Random) -> list[int]:
+    """Carve east runs and one north link per run with array operations.
+
+    Runs never cross a row because the last column always closes its run,
+    so the flattened grid can be split into runs in one pass. Each run
+    links north through the member with the highest random key among
+    those that can go north.
+
+    Args:
+        grid: Grid to carve in place.
+        np: The numpy module.
+        rng: Random number generator seeding the NumPy one.
+
+    Returns:
+        First cell of every run that could not link north.
+    """
+    height, width = grid.height, grid.width
+    size = grid.size
+    walls = np.frombuffer(grid.walls, dtype=np.uint8).reshape(height, width)
+    states = np.frombuffer(grid.states, dtype=np.uint8)
+    free = (states != CellState.VISITED.value).reshape(height, width)
+
+    north_ok = np.zeros((height, width), dtype=bool)
+    north_ok[1:] = free[1:] & free[:-1]
+    east_ok = np.zeros((height, width), dtype=bool)
+    east_ok[:, :-1] = free[:, :-1] & free[:, 1:]
+
+    generator = np.random.default_rng(rng.getrandbits(64))
+    close = ~east_ok | (generator.random((height, width)) < 0.5)
+    close[0] = ~east_ok[0]
+    go_east = ~close
+
+    flat_close = close.ravel()
+    starts = np.flatnonzero(np.concatenate(([True], flat_close[:-1])))
+    keys = generator.permutation(size)
+    keys[~north_ok.ravel()] = -1
+    run_best = np.maximum.reduceat(keys, starts)
+    best = np.repeat(run_best, np.diff(np.append(starts, size)))
+    go_north = ((keys == best) & (best >= 0)).reshape(height, width)
+
+    walls[go_east] &= ALL_WALLS & ~EAST
+    walls[:, 1:][go_east[:, :-1]] &= ALL_WALLS & ~WEST
+    walls[go_north] &= ALL_WALLS & ~NORTH
+    walls[:-1][go_north[1:]] &= ALL_WALLS & ~SOUTH
+
+    stranded = starts[(run_best < 0) & free.ravel()[starts]]
+    return [int(index) for index in stranded]
+
+
+def _carve_python(grid: MazeGrid, rng: Random) -> list[int]:
+    """Carve east runs and one north link per run, one cell at a time.
+
+    Args:
+        grid: Grid to carve in place.
+        rng: Random number generator.
+
+    Returns:
+        First cell of every run that could not link north.
+    """
+    width = grid.width
+    states = grid.states
+    blocked = CellState.VISITED.value
+    coins = ChoiceBuffer(rng)
+    roots = []
+    for y in range(grid.height):
+        run: list[int] = []
+        for index in range(y * width, (y + 1) * width):
+            if states[index] == blocked:
+                continue
+            run.append(index)
+            east = (index + 1) % width != 0 and states[index + 1] != blocked
+            if east and (y == 0 or coins.below(2)):
+                grid.open_wall(index, EAST)
+                continue
+            candidates = [
+                cell for cell in run
+                if cell >= width and states[cell - width] != blocked
+            ]
+            if candidates:
+                grid.open_wall(rng.choice(candidates), NORTH)
+            else:
+                roots.append(run[0])
+            run = []
+    return roots
+
+
+def generate_sidewinder(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze using the sidewinder algorithm.
+
+    Rows are split into random east-carved runs and every run opens one
+    north wall. With NumPy the whole grid is carved at once in the packed
+    wall plane; without it, or for a memory-mapped grid, rows are carved
+    in a plain loop. Runs that cannot link north because of the 42
+    pattern start stranded trees, which are then attached to the rest of
+    the maze.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys.
+        on_step: Optional callback called after carving and after the
+            stranded trees are attached.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    if grid.size == 0:
+        return grid
+    rng = ensure_rng(rng)
+
+    # NumPy temporaries span the whole grid; mapped grids stay off-heap.
+    if _numpy is not None and not isinstance(grid, MappedMazeGrid):
+        roots = _carve_numpy(grid, _numpy, rng)
+    else:
+        roots = _carve_python(grid, rng)
+    if on_step:
+        on_step(grid)
+
+    # The first root is the top row run, the root of the main tree.
+    connect_stranded(grid, roots[1:], rng)
+    if on_step:
+        on_step(grid)
+
+    return grid
@@ -0,0 +1,220 @@
+"""Tiled maze generation across a process pool."""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from src.a_maze_ing.core.cell import EAST, SOUTH, CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom, ensure_rng
+from src.a_maze_ing.core.seeding import derive_seed
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.grid_utils import (
+    DisjointSet,
+    config_pattern,
+    config_storage,
+    generate_full_grid
+)
+from src.a_maze_ing.algorithms.registry import get_generator
+
+# A tile job: (algorithm, tile config, tile seed).
+_TileTask = tuple[str, dict[str, int | tuple[int, int] | str | bool], int]
+
+
+def _tile_bounds(
+        length: int,
+        tile_size: int,
+        keep_together: tuple[int, int] | None
+) -> list[int]:
+    """Split one axis into tile boundaries.
+
+    Args:
+        length: Axis length in cells.
+        tile_size: Requested tile length.
+        keep_together: Inclusive range of positions that must not be split
+            across tiles, or None.
+
+    Returns:
+        Sorted boundaries, starting at 0 and ending at length.
+    """
+    bounds = [0]
+    for cut in range(tile_size, length, tile_size):
+        if keep_together is not None:
+            first, last = keep_together
+            if first < cut <= last:
+                cut = last + 1
+        if bounds[-1] < cut < length:
+            bounds.append(cut)
+    bounds.append(length)
+    return bounds
+
+
+def _generate_tile(task: _TileTask) -> bytes:
+    """Generate one tile; runs in a worker process.
+
+    Args:
+        task: Algorithm name, tile config and tile seed.
+
+    Returns:
+        Wall plane of the tile.
+    """
+    algorithm, config, seed = task
+    grid = get_generator(algorithm)(config, rng=SplitMixRandom(seed))
+    return bytes(grid.walls)
+
+
+def _run_tasks(tasks: list[_TileTask], workers: int) -> Iterator[bytes]:
+    """Generate tiles in order, in a process pool when workers > 1.
+
+    Args:
+        tasks: Tile jobs.
+        workers: Number of worker processes.
+
+    Yields:
+        Wall plane of each tile, in task order.
+    """
+    if workers <= 1:
+        for task in tasks:
+            yield _generate_tile(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_generate_tile, tasks)
+
+
+def _boundary_pairs(
+        grid: MazeGrid,
+        cells: Iterable[tuple[int, int]]
+) -> list[int]:
+    """Return the cells whose wall towards the next tile can be opened.
+
+    Args:
+        grid: Whole maze grid.
+        cells: (cell, neighbor) index pairs along a tile boundary.
+
+    Returns:
+        Indices of cells where both sides are outside the 42 pattern.
+    """
+    states = grid.states
+    blocked = CellState.VISITED.value
+    return [
+        cell for cell, neighbor in cells
+        if states[cell] != blocked and states[neighbor] != blocked
+    ]
+
+
+def generate_tiled(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+) -> MazeGrid:
+    """Generate a perfect maze from independently generated tiles.
+
+    The grid is split into TILE_SIZE x TILE_SIZE tiles (the tiles around
+    the 42 pattern grow so that it, and a one-cell ring around it, stay in
+    a single tile). Each tile is generated with the configured ALGORITHM
+    in one of WORKERS processes, seeded from a base seed and its tile
+    position so the maze does not depend on the worker count. Tiles are
+    then joined by opening one random wall per edge of a random spanning
+    tree of the tile adjacency graph.
+
+    Args:
+        config: Configuration dictionary with WIDTH, HEIGHT and TILE_SIZE
+            keys, and optional ALGORITHM and WORKERS keys.
+        on_step: Optional callback called after each tile is copied in
+            and after the tiles are joined.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    tile_size = config["TILE_SIZE"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    assert isinstance(tile_size, int)
+    workers = config.get("WORKERS", 1)
+    assert isinstance(workers, int)
+    algorithm = config.get("ALGORITHM", "DFS")
+    assert isinstance(algorithm, str)
+
+    grid, pattern = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    keep_x = keep_y = None
+    if pattern:
+        keep_x = (min(x for x, _ in pattern) - 1,
+                  max(x for x, _ in pattern) + 1)
+        keep_y = (min(y for _, y in pattern) - 1,
+                  max(y for _, y in pattern) + 1)
+    xs = _tile_bounds(width, tile_size, keep_x)
+    ys = _tile_bounds(height, tile_size, keep_y)
+    columns = len(xs) - 1
+
+    rng = ensure_rng(rng)
+    base_seed = rng.getrandbits(64)
+    tasks: list[_TileTask] = []
+    for tile_y in range(len(ys) - 1):
+        for tile_x in range(columns):
+            tile_config: dict[str, int | tuple[int, int] | str | bool] = {
+                "WIDTH": xs[tile_x + 1] - xs[tile_x],
+                "HEIGHT": ys[tile_y + 1] - ys[tile_y],
+                "TILE_ORIGIN": (xs[tile_x], ys[tile_y]),
+                "MAZE_SIZE": (width, height),
+            }
+            blocked = set(config_pattern(tile_config))
+            tile_config["ENTRY"] = next(
+                (x, y)
+                for y in range(ys[tile_y + 1] - ys[tile_y])
+                for x in range(xs[tile_x + 1] - xs[tile_x])
+                if (x, y) not in blocked
+            )
+            seed = derive_seed(base_seed, tile_x, tile_y)
+            tasks.append((algorithm, tile_config, seed))
+
+    for number, walls in enumerate(_run_tasks(tasks, workers)):
+        tile_y, tile_x = divmod(number, columns)
+        x0, x1 = xs[tile_x], xs[tile_x + 1]
+        tile_width = x1 - x0
+        for row, y in enumerate(range(ys[tile_y], ys[tile_y + 1])):
+            start = y * width
+            grid.walls[start + x0:start + x1] = \
+                walls[row * tile_width:(row + 1) * tile_width]
+        if on_step:
+            on_step(grid)
+
+    edges = []
+    for tile_y in range(len(ys) - 1):
+        for tile_x in range(columns):
+            tile = tile_y * columns + tile_x
+            if tile_x + 1 < columns:
+                edges.append((tile, tile + 1, EAST, tile_x, tile_y))
+            if tile_y + 2 < len(ys):
+                edges.append((tile, tile + columns, SOUTH, tile_x, tile_y))
+    rng.shuffle(edges)
+
+    tiles = DisjointSet(columns * (len(ys) - 1))
+    for tile, other, wall, tile_x, tile_y in edges:
+        if tiles.find(tile) == tiles.find(other):
+            continue
+        if wall == EAST:
+            x = xs[tile_x + 1] - 1
+            pairs = (
+                (y * width + x, y * width + x + 1)
+                for y in range(ys[tile_y], ys[tile_y + 1])
+            )
+        else:
+            y = ys[tile_y + 1] - 1
+            pairs = (
+                (y * width + x, (y + 1) * width + x)
+                for x in range(xs[tile_x], xs[tile_x + 1])
+            )
+        candidates = _boundary_pairs(grid, pairs)
+        if candidates:
+            tiles.union(tile, other)
+            grid.open_wall(rng.choice(candidates), wall)
+
+    if on_step:
+        on_step(grid)
+
+    return grid
@@ -0,0 +1,247 @@
+"""Tree index answering path queries on perfect mazes in O(n) memory."""
+
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from src.a_maze_ing.core.cell import OPPOSITE_WALLS, Cell
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.algorithms.junction_graph import JunctionGraph
+from src.a_maze_ing.algorithms.grid_utils import index_typecode
+from src.a_maze_ing.algorithms.grid_utils import steps_to_path
+
+
+class TreeIndex:
+    """Parent, depth and jump pointers of a perfect maze.
+
+    A perfect maze is a spanning tree of its free cells: rooting it gives
+    every cell a parent, and the path between two cells goes up to their
+    lowest common ancestor (LCA) and back down. Each cell also stores one
+    skew-binary jump pointer (Myers, 1983): the pointers are built in a
+    single BFS, in O(n) time and memory, and reach any ancestor in
+    O(log n) hops, so distances take O(log n) and paths O(log n) plus
+    their length. Mazes split into several trees (the closed cells of the
+    42 pattern are one-cell trees) are indexed as a forest.
+    """
+
+    def __init__(self, grid: MazeGrid) -> None:
+        """Index a perfect maze.
+
+        Args:
+            grid: Maze grid; it must not be modified afterwards.
+
+        Raises:
+            ValueError: If the open walls contain a cycle.
+        """
+        size = grid.size
+        typecode = index_typecode(size)
+        self.grid = grid
+        self.parents = array(typecode, [-1]) * size
+        self.jumps = array(typecode, [-1]) * size
+        self.depths = array(typecode, [0]) * size
+        # Wall bit leading from the parent to each cell, 0 for roots.
+        self.moves = bytearray(size)
+
+        for root in range(size):
+            if self.parents[root] >= 0:
+                continue
+            self.parents[root] = root
+            self.jumps[root] = root
+            self._index_tree(root)
+
+    def _index_tree(self, root: int) -> None:
+        """Index the tree containing a root cell, breadth first.
+
+        Args:
+            root: Flat index of the root, already its own parent.
+
+        Raises:
+            ValueError: If the tree contains a cycle.
+        """
+        grid = self.grid
+        parents = self.parents
+        jumps = self.jumps
+        depths = self.depths
+        moves = self.moves
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            back = OPPOSITE_WALLS.get(moves[current], 0)
+            jump = jumps[current]
+            # Skew-binary rule: merge two equal-length jumps into one.
+            if depths[current] - depths[jump] == \
+                    depths[jump] - depths[jumps[jump]]:
+                child_jump = jumps[jump]
+            else:
+                child_jump = current
+            for wall, neighbor in grid.open_neighbors(current):
+                if wall == back:
+                    continue
+                if parents[neighbor] >= 0:
+                    raise ValueError("The maze must be perfect.")
+                parents[neighbor] = current
+                jumps[neighbor] = child_jump
+                depths[neighbor] = depths[current] + 1
+                moves[neighbor] = wall
+                queue.append(neighbor)
+
+    def _ancestor(self, cell: int, depth: int) -> int:
+        """Return the ancestor of a cell at a given depth.
+
+        Args:
+            cell: Flat cell index.
+            depth: Depth of the ancestor, at most the depth of cell.
+
+        Returns:
+            Flat index of the ancestor.
+        """
+        depths = self.depths
+        jumps = self.jumps
+        parents = self.parents
+        while depths[cell] > depth:
+            jump = jumps[cell]
+            cell = jump if depths[jump] >= depth else parents[cell]
+        return cell
+
+    def lca(self, first: int, second: int) -> int:
+        """Return the lowest common ancestor of two cells.
+
+        Args:
+            first: Flat cell index.
+            second: Flat cell index.
+
+        Returns:
+            Flat index of the LCA, or -1 if the cells are in different
+            trees.
+        """
+        depths = self.depths
+        jumps = self.jumps
+        parents = self.parents
+        depth = min(depths[first], depths[second])
+        first = self._ancestor(first, depth)
+        second = self._ancestor(second, depth)
+        # Jump targets only depend on depth, so both cells stay level.
+        while first != second:
+            if parents[first] == first:
+                return -1
+            if jumps[first] != jumps[second]:
+                first = jumps[first]
+                second = jumps[second]
+            else:
+                first = parents[first]
+                second = parents[second]
+        return first
+
+    def distance(
+            self,
+            entry: tuple[int, int],
+            exit: tuple[int, int]
+    ) -> int:
+        """Return the number of steps between two cells.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Path length, or -1 if there is no path.
+        """
+        first = self.grid.to_index(*entry)
+        second = self.grid.to_index(*exit)
+        common = self.lca(first, second)
+        if common < 0:
+            return -1
+        depths = self.depths
+        return depths[first] + depths[second] - 2 * depths[common]
+
+    def path(self, entry: tuple[int, int], exit: tuple[int, int]) -> str:
+        """Return the path between two cells, like ``a_star``.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Path string composed of N/E/S/W steps. Empty string if no path.
+        """
+        first = self.grid.to_index(*entry)
+        second = self.grid.to_index(*exit)
+        common = self.lca(first, second)
+        if common < 0:
+            return ""
+        parents = self.parents
+        moves = self.moves
+        up = bytearray()
+        while first != common:
+            up.append(OPPOSITE_WALLS[moves[first]])
+            first = parents[first]
+        down = bytearray()
+        while second != common:
+            down.append(moves[second])
+            second = parents[second]
+        down.reverse()
+        return steps_to_path(up + down)
+
+
+class MazePaths:
+    """Path queries on any maze: tree index if perfect, graph otherwise."""
+
+    def __init__(
+            self,
+            grid: Sequence[Sequence[Cell]],
+            perfect: bool = True
+    ) -> None:
+        """Prepare a maze for path queries.
+
+        Args:
+            grid: 2D maze grid; it must not be modified afterwards.
+            perfect: PERFECT config value. When True the maze is indexed
+                once with a TreeIndex, falling back to search if it turns
+                out to contain loops; when False, or with loops, queries
+                are searched on the maze's JunctionGraph.
+        """
+        if not isinstance(grid, MazeGrid):
+            grid = MazeGrid.from_cells(grid)
+        self.grid = grid
+        self.tree: TreeIndex | None = None
+        self.graph: JunctionGraph | None = None
+        if perfect:
+            try:
+                self.tree = TreeIndex(grid)
+            except ValueError:
+                self.tree = None
+        if self.tree is None:
+            self.graph = JunctionGraph(grid)
+
+    def path(self, entry: tuple[int, int], exit: tuple[int, int]) -> str:
+        """Return a shortest path between two cells.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Path string composed of N/E/S/W steps. Empty string if no path.
+        """
+        if self.tree is not None:
+            return self.tree.path(entry, exit)
+        assert self.graph is not None
+        return self.graph.path(entry, exit)
+
+    def distance(
+            self,
+            entry: tuple[int, int],
+            exit: tuple[int, int]
+    ) -> int:
+        """Return the length of a shortest path between two cells.
+
+        Args:
+            entry: Entry coordinates as (x, y).
+            exit: Exit coordinates as (x, y).
+
+        Returns:
+            Number of steps, or -1 if there is no path.
+        """
+        if self.tree is not None:
+            return self.tree.distance(entry, exit)
+        assert self.graph is not None
+        return self.graph.distance(entry, exit)
@@ -1,58 +1,136 @@
 """Wilson's algorithm for maze generation."""
 
 from collections.abc import Callable
-from random import choice as rd_choice
-from src.a_maze_ing.core.cell import Cell, CellState
+from random import Random
+from src.a_maze_ing.core.cell import CellState
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.core.storage import scratch_plane
 from src.a_maze_ing.core.types import MazeConfig
 from src.a_maze_ing.algorithms.grid_utils import (
+    config_pattern,
+    config_storage,
     generate_full_grid,
-    get_neighbors,
-    remove_walls_between
+    index_typecode
 )
 
+DEFAULT_HYBRID_COVERAGE = 30
 
-def _has_unvisited(grid: list[list[Cell]]) -> bool:
-    """Check whether the grid contains unvisited cells.
 
-    Args:
-        grid: 2D maze grid.
+class _UnvisitedPool:
+    """Indexed pool of unvisited cells with O(1) sampling and removal.
 
-    Returns:
-        True if any cell is unvisited, otherwise False.
+    The pool arrays follow the grid storage backend; the first ``count``
+    entries of ``cells`` are the pooled cells.
     """
-    return any(
-        cell.state == CellState.UNVISITED
-        for row in grid
-        for cell in row
-    )
 
-
-def _get_random_unvisited(grid: list[list[Cell]]) -> Cell:
-    """Pick a random unvisited cell.
+    def __init__(self, grid: MazeGrid, rng: Random) -> None:
+        """Collect every unvisited cell of the grid.
+
+        Args:
+            grid: Maze grid whose UNVISITED cells form the pool.
+            rng: Random number generator used for sampling.
+        """
+        self.rng = rng
+        typecode = index_typecode(grid.size)
+        unvisited = CellState.UNVISITED.value
+        self.cells = scratch_plane(grid.size, typecode, grid=grid)
+        self.positions = scratch_plane(grid.size, typecode, -1, grid)
+        self.count = 0
+        # A view reads ints from mmap planes too, which iterate as bytes.
+        for index, state in enumerate(memoryview(grid.states)):
+            if state == unvisited:
+                self.cells[self.count] = index
+                self.positions[index] = self.count
+                self.count += 1
+
+    def __len__(self) -> int:
+        """Return the number of cells left in the pool."""
+        return self.count
+
+    def sample(self) -> int:
+        """Return a random cell of the pool without removing it."""
+        return self.rng.choice(self.cells[:self.count])
+
+    def remove(self, index: int) -> None:
+        """Remove a cell by swapping it with the last pool entry.
+
+        Args:
+            index: Flat index of the cell to remove.
+        """
+        position = self.positions[index]
+        self.count -= 1
+        last = self.cells[self.count]
+        if last != index:
+            self.cells[position] = last
+            self.positions[last] = position
+        self.positions[index] = -1
+
+
+def _loop_erased_walks(
+        grid: MazeGrid,
+        pool: _UnvisitedPool,
+        choices: ChoiceBuffer,
+        on_step: Callable[[MazeGrid], None] | None = None
+) -> None:
+    """Attach every pooled cell to the maze with loop-erased random walks.
 
     Args:
-        grid: 2D maze grid.
-
-    Returns:
-        A randomly selected unvisited cell.
+        grid: Maze grid with at least one IN_MAZE cell unless the pool is
+            empty.
+        pool: Cells not yet in the maze.
+        choices: Buffer the walk directions are drawn from.
+        on_step: Optional callback called after each carving step.
     """
-    unvisited = [
-        cell for row in grid
-        for cell in row
-        if cell.state == CellState.UNVISITED
-    ]
-    return rd_choice(unvisited)
+    states = grid.states
+    blocked = CellState.VISITED.value
+    in_maze = CellState.IN_MAZE.value
+    exits = scratch_plane(grid.size, grid=grid)
+
+    while pool:
+        start = pool.sample()
+        current = start
+        while states[current] != in_maze:
+            neighbors = [
+                (wall, neighbor)
+                for wall, neighbor in grid.neighbors(current)
+                if states[neighbor] != blocked
+            ]
+            if not neighbors:
+                break
+            exits[current], current = choices.choice(neighbors)
+
+        if states[current] != in_maze:
+            # Isolated cell: nothing can ever reach it.
+            pool.remove(start)
+            states[start] = in_maze
+            continue
+
+        current = start
+        while states[current] != in_maze:
+            states[current] = in_maze
+            pool.remove(current)
+            current = grid.open_wall(current, exits[current])
+            if on_step:
+                on_step(grid)
 
 
 def generate_wilson(
         config: MazeConfig,
-        on_step: Callable[[list[list[Cell]]], None] | None = None
-        ) -> list[list[Cell]]:
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+        ) -> MazeGrid:
     """Generate a perfect maze using Wilson's algorithm.
 
+    Unvisited cells are sampled from an indexed pool. Random walks record
+    the direction they last left each cell in, so following those exit
+    marks from the walk start yields the loop-erased path directly.
+
     Args:
         config: Configuration dictionary with WIDTH and HEIGHT keys.
         on_step: Optional callback called after each carving step.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
 
     Returns:
         Generated maze grid.
@@ -61,39 +139,91 @@ def generate_wilson(
     height = config["HEIGHT"]
     assert isinstance(width, int)
     assert isinstance(height, int)
-    grid, pattern_positions = generate_full_grid(width, height)
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    rng = ensure_rng(rng)
+    choices = ChoiceBuffer(rng)
+    pool = _UnvisitedPool(grid, rng)
+    if not pool:
+        return grid
 
-    random_cell_in_maze: Cell = _get_random_unvisited(grid)
-    random_cell_in_maze.state = CellState.IN_MAZE
+    root = pool.sample()
+    pool.remove(root)
+    grid.states[root] = CellState.IN_MAZE.value
 
     if on_step:
         on_step(grid)
 
-    while _has_unvisited(grid):
-        current_cell: Cell = _get_random_unvisited(grid)
-        path: list[Cell] = [current_cell]
-        while (current_cell.state != CellState.IN_MAZE):
-            neighbors = get_neighbors(
-                current_cell.coordinates,
-                grid,
-                blocked=pattern_positions
-            )
-            if not neighbors:
-                break
-            next_cell: Cell = rd_choice(neighbors)
-            if next_cell in path:
-                index = path.index(next_cell)
-                path = path[:index + 1]
-            else:
-                path.append(next_cell)
-            current_cell = next_cell
-
-        if current_cell.state == CellState.IN_MAZE:
-            for i in range(len(path) - 1):
-                remove_walls_between(path[i], path[i + 1])
-                if on_step:
-                    on_step(grid)
-            for cells in path:
-                cells.state = CellState.IN_MAZE
+    _loop_erased_walks(grid, pool, choices, on_step)
+    return grid
+
+
+def generate_aldous_broder_wilson(
+        config: MazeConfig,
+        on_step: Callable[[MazeGrid], None] | None = None,
+        rng: Random | None = None
+        ) -> MazeGrid:
+    """Generate a uniform perfect maze with Aldous-Broder, then Wilson.
+
+    Aldous-Broder covers new cells quickly while the maze is small, when
+    Wilson's walks are the longest; it slows down once most neighbors are
+    already covered. A single random walk therefore carves the first
+    HYBRID_COVERAGE percent of the cells, and loop-erased walks attach the
+    rest. Both stages sample uniform spanning trees, so the result is
+    uniform too.
+
+    Args:
+        config: Configuration dictionary with WIDTH and HEIGHT keys and an
+            optional HYBRID_COVERAGE key (0 to 100).
+        on_step: Optional callback called after each carving step.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
+
+    Returns:
+        Generated maze grid.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    coverage = config.get("HYBRID_COVERAGE", DEFAULT_HYBRID_COVERAGE)
+    assert isinstance(coverage, int)
+    grid, _ = generate_full_grid(
+        width, height, config_storage(config), config_pattern(config)
+    )
+    states = grid.states
+    blocked = CellState.VISITED.value
+    in_maze = CellState.IN_MAZE.value
+    rng = ensure_rng(rng)
+    choices = ChoiceBuffer(rng)
+    pool = _UnvisitedPool(grid, rng)
+    if not pool:
+        return grid
+
+    current = pool.sample()
+    pool.remove(current)
+    states[current] = in_maze
+    if on_step:
+        on_step(grid)
 
+    remaining = len(pool) - len(pool) * coverage // 100
+    while len(pool) > remaining:
+        neighbors = [
+            (wall, neighbor)
+            for wall, neighbor in grid.neighbors(current)
+            if states[neighbor] != blocked
+        ]
+        if not neighbors:
+            break
+        wall, neighbor = choices.choice(neighbors)
+        if states[neighbor] != in_maze:
+            grid.open_wall(current, wall)
+            states[neighbor] = in_maze
+            pool.remove(neighbor)
+            if on_step:
+                on_step(grid)
+        current = neighbor
+
+    _loop_erased_walks(grid, pool, choices, on_step)
     return grid
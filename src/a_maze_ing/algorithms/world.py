@@ -0,0 +1,158 @@
+"""Endless maze world generated lazily, one tile at a time."""
+
+from collections import OrderedDict
+from src.a_maze_ing.core.cell import EAST, NORTH, SOUTH, WEST
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.seeding import derive_seed
+from src.a_maze_ing.algorithms.registry import get_generator
+
+
+class MazeWorld:
+    """Unbounded maze made of square tiles generated on demand.
+
+    Tile (tile_x, tile_y) covers world cells tile_x * tile_size to
+    (tile_x + 1) * tile_size - 1 horizontally, and the same vertically;
+    coordinates may be negative. A tile only depends on the master seed
+    and its own position: its interior is generated with ALGORITHM from a
+    derived seed, and each of its four borders gets one opening whose
+    offset is hashed from the seed and the border position. Both tiles
+    sharing a border compute the same opening, so tiles can be produced in
+    any order without generating their neighbors. Every tile is reachable
+    from every other one; loops only appear at tile scale.
+
+    Generated tiles are kept in a least-recently-used cache of at most
+    ``cache_size`` tiles.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        tile_size: int,
+        algorithm: str = "DFS",
+        cache_size: int = 64
+    ) -> None:
+        """Create a world.
+
+        Args:
+            seed: Master seed.
+            tile_size: Side of a tile, in cells.
+            algorithm: Generator used for tile interiors.
+            cache_size: Maximum number of tiles kept in memory.
+
+        Raises:
+            ValueError: If tile_size or cache_size is below 1.
+        """
+        if tile_size < 1 or cache_size < 1:
+            raise ValueError("tile_size and cache_size must be at least 1.")
+        self.seed = seed
+        self.tile_size = tile_size
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[int, int], MazeGrid] = OrderedDict()
+
+    def east_opening(self, tile_x: int, tile_y: int) -> int:
+        """Return the row of the opening between a tile and its east one.
+
+        Args:
+            tile_x: Tile column.
+            tile_y: Tile row.
+
+        Returns:
+            Row offset inside the tile.
+        """
+        return derive_seed(self.seed, "E", tile_x, tile_y) % self.tile_size
+
+    def south_opening(self, tile_x: int, tile_y: int) -> int:
+        """Return the column of the opening between a tile and its south one.
+
+        Args:
+            tile_x: Tile column.
+            tile_y: Tile row.
+
+        Returns:
+            Column offset inside the tile.
+        """
+        return derive_seed(self.seed, "S", tile_x, tile_y) % self.tile_size
+
+    def tile(self, tile_x: int, tile_y: int) -> MazeGrid:
+        """Return a tile, generating it if it is not cached.
+
+        The returned grid is shared with the cache and must not be
+        modified.
+
+        Args:
+            tile_x: Tile column.
+            tile_y: Tile row.
+
+        Returns:
+            Tile grid with its four border openings carved.
+        """
+        key = (tile_x, tile_y)
+        grid = self._cache.get(key)
+        if grid is not None:
+            self._cache.move_to_end(key)
+            return grid
+        grid = self._generate_tile(tile_x, tile_y)
+        self._cache[key] = grid
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return grid
+
+    def _generate_tile(self, tile_x: int, tile_y: int) -> MazeGrid:
+        """Generate a tile from the master seed and its position.
+
+        Args:
+            tile_x: Tile column.
+            tile_y: Tile row.
+
+        Returns:
+            Tile grid with its four border openings carved.
+        """
+        size = self.tile_size
+        rng = SplitMixRandom(derive_seed(self.seed, "tile", tile_x, tile_y))
+        grid = get_generator(self.algorithm)({
+            "WIDTH": size,
+            "HEIGHT": size,
+            "ENTRY": (0, 0),
+        }, rng=rng)
+
+        last = size - 1
+        walls = grid.walls
+        walls[grid.to_index(last, self.east_opening(tile_x, tile_y))] &= ~EAST
+        walls[grid.to_index(0, self.east_opening(tile_x - 1, tile_y))] &= ~WEST
+        walls[grid.to_index(self.south_opening(tile_x, tile_y), last)] &= \
+            ~SOUTH
+        walls[grid.to_index(self.south_opening(tile_x, tile_y - 1), 0)] &= \
+            ~NORTH
+        return grid
+
+    def region(self, x: int, y: int, width: int, height: int) -> MazeGrid:
+        """Assemble a rectangle of world cells into a single grid.
+
+        Passages crossing the edge of the rectangle are left open.
+
+        Args:
+            x: World column of the top-left cell.
+            y: World row of the top-left cell.
+            width: Number of columns.
+            height: Number of rows.
+
+        Returns:
+            Grid holding the walls of the requested cells.
+        """
+        size = self.tile_size
+        grid = MazeGrid(width, height)
+        for row in range(height):
+            tile_y, inner_y = divmod(y + row, size)
+            column = 0
+            while column < width:
+                tile_x, inner_x = divmod(x + column, size)
+                count = min(size - inner_x, width - column)
+                source = self.tile(tile_x, tile_y).walls
+                start = inner_y * size + inner_x
+                target = row * width + column
+                grid.walls[target:target + count] = \
+                    source[start:start + count]
+                column += count
+        return grid
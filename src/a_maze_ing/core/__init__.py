@@ -1,6 +1,14 @@
 """Core models and parsing utilities."""
 
 from src.a_maze_ing.core.cell import Cell, CellState
+from src.a_maze_ing.core.grid import GridCell, GridRow, MazeGrid
 from src.a_maze_ing.core.parsing import ParsingError
 
-__all__ = ["Cell", "CellState", "ParsingError"]
+__all__ = [
+    "Cell",
+    "CellState",
+    "GridCell",
+    "GridRow",
+    "MazeGrid",
+    "ParsingError"
+]
@@ -2,6 +2,18 @@
 
 from enum import Enum, auto
 
+# Wall bits, matching the hexadecimal output format.
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+ALL_WALLS = NORTH | EAST | SOUTH | WEST
+
+WALL_BITS = {"N": NORTH, "E": EAST, "S": SOUTH, "W": WEST}
+OPPOSITE_WALLS = {NORTH: SOUTH, EAST: WEST, SOUTH: NORTH, WEST: EAST}
+
+_HEX_DIGITS = "0123456789ABCDEF"
+
 
 class CellState(Enum):
     """State markers used during maze generation and solving."""
@@ -14,7 +26,13 @@ class CellState(Enum):
 
 
 class Cell:
-    """Represent a single maze cell and its walls."""
+    """Represent a single maze cell and its walls.
+
+    Walls are stored as a 4-bit mask using the output format layout
+    (N=1, E=2, S=4, W=8); a set bit means the wall is closed.
+    """
+
+    __slots__ = ("state", "walls", "coordinates")
 
     def __init__(self,
                  state: CellState,
@@ -36,25 +54,58 @@ class Cell:
         """
         self.state = state
 
-        self.north = north
-        self.east = east
-        self.south = south
-        self.west = west
+        self.walls = (
+            (NORTH if north else 0)
+            | (EAST if east else 0)
+            | (SOUTH if south else 0)
+            | (WEST if west else 0)
+        )
 
         self.coordinates = coordinates
 
+    @property
+    def north(self) -> bool:
+        """Whether the north wall is closed."""
+        return bool(self.walls & NORTH)
+
+    @north.setter
+    def north(self, value: bool) -> None:
+        self._set_bit(NORTH, value)
+
+    @property
+    def east(self) -> bool:
+        """Whether the east wall is closed."""
+        return bool(self.walls & EAST)
+
+    @east.setter
+    def east(self, value: bool) -> None:
+        self._set_bit(EAST, value)
+
+    @property
+    def south(self) -> bool:
+        """Whether the south wall is closed."""
+        return bool(self.walls & SOUTH)
+
+    @south.setter
+    def south(self, value: bool) -> None:
+        self._set_bit(SOUTH, value)
+
+    @property
+    def west(self) -> bool:
+        """Whether the west wall is closed."""
+        return bool(self.walls & WEST)
+
+    @west.setter
+    def west(self, value: bool) -> None:
+        self._set_bit(WEST, value)
+
     def __str__(self) -> str:
         """Return the hexadecimal wall encoding for the cell."""
-        return hex(
-            int(self.north) * 1 +
-            int(self.east) * 2 +
-            int(self.south) * 4 +
-            int(self.west) * 8
-        )[2:].upper()
+        return _HEX_DIGITS[self.walls & ALL_WALLS]
 
     def to_hex(self) -> str:
         """Return hexadecimal representation of the cell walls."""
-        return str(self)
+        return _HEX_DIGITS[self.walls & ALL_WALLS]
 
     def has_wall(self, direction: str) -> bool:
         """Check if a wall exists in the given direction.
@@ -65,12 +116,7 @@ class Cell:
         Returns:
             True if the wall is closed in that direction.
         """
-        return {
-            "N": self.north,
-            "E": self.east,
-            "S": self.south,
-            "W": self.west
-        }[direction.upper()]
+        return bool(self.walls & WALL_BITS[direction.upper()])
 
     def set_wall(self, direction: str, value: bool) -> None:
         """Set the wall state in the given direction.
@@ -79,12 +125,16 @@ class Cell:
             direction: Direction character (N/E/S/W).
             value: True to close the wall, False to open it.
         """
-        direction = direction.upper()
-        if direction == "N":
-            self.north = value
-        elif direction == "E":
-            self.east = value
-        elif direction == "S":
-            self.south = value
-        elif direction == "W":
-            self.west = value
+        self._set_bit(WALL_BITS.get(direction.upper(), 0), value)
+
+    def _set_bit(self, wall: int, value: bool) -> None:
+        """Set or clear one wall bit.
+
+        Args:
+            wall: Wall bit to update.
+            value: True to close the wall, False to open it.
+        """
+        if value:
+            self.walls |= wall
+        else:
+            self.walls &= ~wall
@@ -0,0 +1,452 @@
+"""Packed array-backed maze grid."""
+
+from collections.abc import Iterator, Sequence
+from mmap import mmap
+from typing import overload
+
+from src.a_maze_ing.core.cell import (
+    ALL_WALLS,
+    EAST,
+    NORTH,
+    OPPOSITE_WALLS,
+    SOUTH,
+    WEST,
+    Cell,
+    CellState
+)
+
+# Byte buffers a grid plane can live in: heap memory or a mapped file.
+GridPlane = bytearray | mmap
+
+_STATE_BY_CODE = {state.value: state for state in CellState}
+
+# Maps every wall byte to the uppercase hexadecimal digit of its low nibble.
+_HEX_TABLE = bytes(
+    b"0123456789ABCDEF"[value & ALL_WALLS] for value in range(256)
+)
+
+
+def hex_encode(walls: bytes | bytearray) -> str:
+    """Encode a run of wall bytes as uppercase hexadecimal digits.
+
+    Args:
+        walls: Wall bytes, one per cell; bits above the nibble are ignored.
+
+    Returns:
+        One hexadecimal digit per cell.
+    """
+    return walls.translate(_HEX_TABLE).decode("ascii")
+
+
+class MazeGrid(Sequence["GridRow"]):
+    """Maze grid stored as two flat byte planes.
+
+    Cell (x, y) lives at index ``y * width + x``. The ``walls`` plane holds
+    one wall nibble per cell (N=1, E=2, S=4, W=8) and the ``states`` plane
+    holds the ``CellState`` value of each cell. Hot paths work on the
+    integer indices directly, while ``grid[y][x]`` returns a ``GridCell``
+    view so code written for ``list[list[Cell]]`` keeps working.
+    """
+
+    def __init__(
+            self,
+            width: int,
+            height: int,
+            walls: GridPlane | None = None,
+            states: GridPlane | None = None
+    ) -> None:
+        """Initialize a grid with every wall closed.
+
+        Args:
+            width: Number of columns.
+            height: Number of rows.
+            walls: Optional existing wall plane, one byte per cell.
+            states: Optional existing state plane, one byte per cell.
+
+        Raises:
+            ValueError: If the size or the planes are inconsistent.
+        """
+        if width < 0 or height < 0:
+            raise ValueError(
+                f"Grid size must be positive, got {width}x{height}."
+            )
+        size = width * height
+        self.width = width
+        self.height = height
+        self.walls: GridPlane = (
+            bytearray([ALL_WALLS]) * size if walls is None else walls
+        )
+        self.states: GridPlane = (
+            bytearray([CellState.UNVISITED.value]) * size
+            if states is None else states
+        )
+        if len(self.walls) != size or len(self.states) != size:
+            raise ValueError("Grid planes must hold one byte per cell.")
+        self._offsets = {NORTH: -width, EAST: 1, SOUTH: width, WEST: -1}
+
+    @classmethod
+    def from_cells(cls, cells: Sequence[Sequence[Cell]]) -> "MazeGrid":
+        """Build a packed grid from a nested sequence of cells.
+
+        Args:
+            cells: 2D grid of cells, indexed as cells[y][x].
+
+        Returns:
+            Packed copy of the grid.
+        """
+        height = len(cells)
+        width = len(cells[0]) if height > 0 else 0
+        grid = cls(width, height)
+        for y, row in enumerate(cells):
+            for x, cell in enumerate(row):
+                index = y * width + x
+                grid.walls[index] = cell.walls & ALL_WALLS
+                grid.states[index] = cell.state.value
+        return grid
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.height
+
+    @overload
+    def __getitem__(self, y: int) -> "GridRow":
+        ...
+
+    @overload
+    def __getitem__(self, y: slice) -> list["GridRow"]:
+        ...
+
+    def __getitem__(self, y: int | slice) -> "GridRow | list[GridRow]":
+        """Return a row view, or a list of row views for a slice.
+
+        Args:
+            y: Row index or slice.
+
+        Returns:
+            Row view(s) of the grid.
+
+        Raises:
+            IndexError: If the row index is out of range.
+        """
+        if isinstance(y, slice):
+            return [GridRow(self, row) for row in range(*y.indices(len(self)))]
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("Grid row index out of range.")
+        return GridRow(self, y)
+
+    def __iter__(self) -> Iterator["GridRow"]:
+        """Iterate over row views from top to bottom."""
+        for y in range(self.height):
+            yield GridRow(self, y)
+
+    @property
+    def size(self) -> int:
+        """Return the number of cells in the grid."""
+        return self.width * self.height
+
+    def close(self) -> None:
+        """Release the storage backing the grid.
+
+        In-memory grids have nothing to release; file-backed grids
+        override this to flush and unmap their planes.
+        """
+
+    def to_index(self, x: int, y: int) -> int:
+        """Convert coordinates to a flat cell index.
+
+        Args:
+            x: Column.
+            y: Row.
+
+        Returns:
+            Flat index of the cell.
+        """
+        return y * self.width + x
+
+    def to_coordinates(self, index: int) -> tuple[int, int]:
+        """Convert a flat cell index to coordinates.
+
+        Args:
+            index: Flat index of the cell.
+
+        Returns:
+            Cell coordinates as (x, y).
+        """
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def cell(self, x: int, y: int) -> "GridCell":
+        """Return a view of the cell at the given coordinates.
+
+        Args:
+            x: Column.
+            y: Row.
+
+        Returns:
+            Cell view bound to this grid.
+        """
+        return GridCell(self, y * self.width + x)
+
+    def get_state(self, index: int) -> CellState:
+        """Return the state of a cell.
+
+        Args:
+            index: Flat index of the cell.
+
+        Returns:
+            Current state of the cell.
+        """
+        return _STATE_BY_CODE[self.states[index]]
+
+    def set_state(self, index: int, state: CellState) -> None:
+        """Set the state of a cell.
+
+        Args:
+            index: Flat index of the cell.
+            state: New state.
+        """
+        self.states[index] = state.value
+
+    def has_wall(self, index: int, wall: int) -> bool:
+        """Check whether a wall of a cell is closed.
+
+        Args:
+            index: Flat index of the cell.
+            wall: Wall bit (NORTH, EAST, SOUTH or WEST).
+
+        Returns:
+            True if the wall is closed.
+        """
+        return bool(self.walls[index] & wall)
+
+    def neighbor(self, index: int, wall: int) -> int | None:
+        """Return the index of the cell behind a wall.
+
+        Args:
+            index: Flat index of the cell.
+            wall: Wall bit (NORTH, EAST, SOUTH or WEST).
+
+        Returns:
+            Index of the adjacent cell, or None on the grid border.
+        """
+        if wall == NORTH:
+            return index - self.width if index >= self.width else None
+        if wall == SOUTH:
+            below = index + self.width
+            return below if below < self.size else None
+        if wall == WEST:
+            return index - 1 if index % self.width > 0 else None
+        if wall == EAST:
+            return index + 1 if index % self.width < self.width - 1 else None
+        raise ValueError(f"Unknown wall bit {wall}")
+
+    def neighbors(self, index: int) -> list[tuple[int, int]]:
+        """Return the adjacent cells of a cell, ignoring walls.
+
+        Neighbors are listed in N, S, W, E order.
+
+        Args:
+            index: Flat index of the cell.
+
+        Returns:
+            List of (wall, neighbor_index) tuples.
+        """
+        width = self.width
+        y, x = divmod(index, width)
+        result = []
+        if y > 0:
+            result.append((NORTH, index - width))
+        if y < self.height - 1:
+            result.append((SOUTH, index + width))
+        if x > 0:
+            result.append((WEST, index - 1))
+        if x < width - 1:
+            result.append((EAST, index + 1))
+        return result
+
+    def open_neighbors(self, index: int) -> list[tuple[int, int]]:
+        """Return the adjacent cells reachable through an open wall.
+
+        Args:
+            index: Flat index of the cell.
+
+        Returns:
+            List of (wall, neighbor_index) tuples in N, S, W, E order.
+        """
+        walls = self.walls[index]
+        return [
+            (wall, neighbor) for wall, neighbor in self.neighbors(index)
+            if not walls & wall
+        ]
+
+    def open_wall(self, index: int, wall: int) -> int:
+        """Open a wall on both sides.
+
+        The neighbor behind the wall must exist.
+
+        Args:
+            index: Flat index of the cell.
+            wall: Wall bit to open.
+
+        Returns:
+            Index of the neighbor behind the opened wall.
+        """
+        neighbor = index + self._offsets[wall]
+        self.walls[index] &= ~wall
+        self.walls[neighbor] &= ~OPPOSITE_WALLS[wall]
+        return neighbor
+
+    def close_wall(self, index: int, wall: int) -> int:
+        """Close a wall on both sides.
+
+        The neighbor behind the wall must exist.
+
+        Args:
+            index: Flat index of the cell.
+            wall: Wall bit to close.
+
+        Returns:
+            Index of the neighbor behind the closed wall.
+        """
+        neighbor = index + self._offsets[wall]
+        self.walls[index] |= wall
+        self.walls[neighbor] |= OPPOSITE_WALLS[wall]
+        return neighbor
+
+    def hex_row(self, y: int) -> str:
+        """Return the hexadecimal encoding of one row.
+
+        Args:
+            y: Row index.
+
+        Returns:
+            One uppercase hexadecimal digit per cell.
+        """
+        start = y * self.width
+        return hex_encode(self.walls[start:start + self.width])
+
+
+class GridRow(Sequence["GridCell"]):
+    """Row view of a ``MazeGrid``."""
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid: MazeGrid, y: int) -> None:
+        """Initialize a row view.
+
+        Args:
+            grid: Grid owning the row.
+            y: Row index.
+        """
+        self.grid = grid
+        self.y = y
+
+    def __len__(self) -> int:
+        """Return the number of cells in the row."""
+        return self.grid.width
+
+    @overload
+    def __getitem__(self, x: int) -> "GridCell":
+        ...
+
+    @overload
+    def __getitem__(self, x: slice) -> list["GridCell"]:
+        ...
+
+    def __getitem__(self, x: int | slice) -> "GridCell | list[GridCell]":
+        """Return a cell view, or a list of cell views for a slice.
+
+        Args:
+            x: Column index or slice.
+
+        Returns:
+            Cell view(s) of the row.
+
+        Raises:
+            IndexError: If the column index is out of range.
+        """
+        width = self.grid.width
+        start = self.y * width
+        if isinstance(x, slice):
+            return [
+                GridCell(self.grid, start + column)
+                for column in range(*x.indices(width))
+            ]
+        if x < 0:
+            x += width
+        if not 0 <= x < width:
+            raise IndexError("Grid column index out of range.")
+        return GridCell(self.grid, start + x)
+
+    def __iter__(self) -> Iterator["GridCell"]:
+        """Iterate over cell views from left to right."""
+        start = self.y * self.grid.width
+        for index in range(start, start + self.grid.width):
+            yield GridCell(self.grid, index)
+
+    def __str__(self) -> str:
+        """Return the hexadecimal encoding of the row."""
+        return self.grid.hex_row(self.y)
+
+
+class GridCell(Cell):
+    """Live ``Cell`` view over one cell of a ``MazeGrid``.
+
+    Reads and writes go straight to the grid planes, so views are cheap to
+    create and two views of the same cell compare equal.
+    """
+
+    __slots__ = ("grid", "index")
+
+    def __init__(self, grid: MazeGrid, index: int) -> None:
+        """Initialize a cell view.
+
+        Args:
+            grid: Grid owning the cell.
+            index: Flat index of the cell.
+        """
+        self.grid = grid
+        self.index = index
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both views target the same cell."""
+        return (
+            isinstance(other, GridCell)
+            and other.grid is self.grid
+            and other.index == self.index
+        )
+
+    def __hash__(self) -> int:
+        """Hash the view by grid identity and cell index."""
+        return hash((id(self.grid), self.index))
+
+    @property
+    def walls(self) -> int:
+        """Wall bitmask of the cell."""
+        return self.grid.walls[self.index] & ALL_WALLS
+
+    @walls.setter
+    def walls(self, value: int) -> None:
+        index = self.index
+        planes = self.grid.walls
+        planes[index] = (planes[index] & ~ALL_WALLS) | (value & ALL_WALLS)
+
+    @property
+    def state(self) -> CellState:
+        """State of the cell."""
+        return _STATE_BY_CODE[self.grid.states[self.index]]
+
+    @state.setter
+    def state(self, value: CellState) -> None:
+        self.grid.states[self.index] = value.value
+
+    @property
+    def coordinates(self) -> tuple[int, int]:
+        """Cell coordinates as (x, y)."""
+        return self.grid.to_coordinates(self.index)
+
+    @coordinates.setter
+    def coordinates(self, value: tuple[int, int]) -> None:
+        raise AttributeError("Grid cell coordinates are read-only.")
@@ -1,6 +1,16 @@
 """Configuration parsing utilities."""
 
+from collections.abc import Iterable, Mapping, Sequence
 from re import match as re_match
+from src.a_maze_ing.core.storage import parse_storage_spec
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.ft_pattern import ft_pattern_cells
+from src.a_maze_ing.algorithms.growing_tree import parse_growing_tree_mix
+from src.a_maze_ing.algorithms.registry import GENERATORS
+
+MANDATORY_KEYS = (
+    "WIDTH", "HEIGHT", "ENTRY", "EXIT", "OUTPUT_FILE", "PERFECT"
+)
 
 
 class ParsingError(Exception):
@@ -71,7 +81,13 @@ def _get_line_value(line: str) -> int | tuple[int, int] | str | bool | None:
         "ANIMATIONS": bool,
         "GUI": bool,
         "ALGORITHM": str,
-        "SEED": int
+        "SEED": int,
+        "STORAGE": str,
+        "TILE_SIZE": int,
+        "WORKERS": int,
+        "GROWING_TREE_MIX": str,
+        "MUTATION_STEPS": int,
+        "HYBRID_COVERAGE": int
     }
 
     line_splitted = line.split("=")
@@ -127,69 +143,162 @@ def parse_config(path: str) \
         OSError: If the file cannot be read.
     """
     with open(path, "r") as f:
-        result = {}
-        for line in f:
-            try:
-                _check_line_format(line)
-                result[line.split("=")[0]] = _get_line_value(line)
-            except CommentError:
-                pass
-        if "ANIMATIONS" not in result:
-            result["ANIMATIONS"] = True
-        if "GUI" not in result:
-            result["GUI"] = False
-        if "ALGORITHM" not in result:
-            result["ALGORITHM"] = "DFS"
-        algorithm = result.get("ALGORITHM")
-        if isinstance(algorithm, str):
-            algorithm = algorithm.strip().upper()
-            if algorithm not in ("DFS", "KRUSKAL", "WILSON"):
-                raise ParsingError(
-                    "Invalid ALGORITHM value. Expected DFS, KRUSKAL or WILSON."
-                )
-            result["ALGORITHM"] = algorithm
-
-        entry = result.get("ENTRY")
-        exit_ = result.get("EXIT")
-        width = result.get("WIDTH")
-        height = result.get("HEIGHT")
-
-        if not isinstance(entry, tuple):
-            raise ParsingError("Invalid or missing ENTRY value.")
-        if not isinstance(exit_, tuple):
-            raise ParsingError("Invalid or missing EXIT value.")
-        if not isinstance(width, int):
-            raise ParsingError("Invalid or missing WIDTH value.")
-        if not isinstance(height, int):
-            raise ParsingError("Invalid or missing HEIGHT value.")
-
-        if entry == exit_:
-            raise ParsingError("Entry and exit are in the same place.")
-        if entry[0] < 0 or \
-                entry[1] < 0 or \
-                entry[0] >= width or \
-                entry[1] >= height:
-            raise ParsingError("Entry is out of the grid.")
-        if exit_[0] < 0 or \
-                exit_[1] < 0 or \
-                exit_[0] >= width or \
-                exit_[1] >= height:
-            raise ParsingError("Exit is out of the grid.")
-        return result
+        return parse_config_lines(f)
+
+
+def parse_config_mapping(
+        values: Mapping[str, object]
+) -> dict[str, int | tuple[int, int] | str | bool | None]:
+    """Parse configuration values given as a mapping, e.g. decoded JSON.
+
+    Each value is written back as a KEY=VALUE line (booleans as True or
+    False, coordinate pairs as INT,INT) and validated exactly like a
+    configuration file line.
+
+    Args:
+        values: Configuration keys and values.
+
+    Returns:
+        Parsed configuration dictionary with defaults applied.
+
+    Raises:
+        ParsingError: If a key or value is invalid.
+    """
+    lines = []
+    for key, value in values.items():
+        if isinstance(value, bool):
+            text = "True" if value else "False"
+        elif isinstance(value, (list, tuple)):
+            text = ",".join(str(item) for item in value)
+        else:
+            text = str(value)
+        if "\n" in key or "\n" in text:
+            raise ParsingError(f"Invalid value for '{key}'.")
+        lines.append(f"{key}={text}")
+    return parse_config_lines(lines)
+
+
+def parse_config_lines(
+        lines: Iterable[str]
+) -> dict[str, int | tuple[int, int] | str | bool | None]:
+    """Parse configuration lines.
+
+    Args:
+        lines: Lines in KEY=VALUE format; comments and empty lines are
+            skipped.
+
+    Returns:
+        Parsed configuration dictionary with defaults applied.
+
+    Raises:
+        ParsingError: If a line is invalid.
+    """
+    result = {}
+    for line in lines:
+        try:
+            _check_line_format(line)
+            result[line.split("=")[0]] = _get_line_value(line)
+        except CommentError:
+            pass
+    if "ANIMATIONS" not in result:
+        result["ANIMATIONS"] = True
+    if "GUI" not in result:
+        result["GUI"] = False
+    if "ALGORITHM" not in result:
+        result["ALGORITHM"] = "DFS"
+    algorithm = result.get("ALGORITHM")
+    if isinstance(algorithm, str):
+        algorithm = algorithm.strip().upper()
+        if algorithm not in GENERATORS:
+            raise ParsingError(
+                "Invalid ALGORITHM value. Expected "
+                f"{', '.join(GENERATORS)}."
+            )
+        result["ALGORITHM"] = algorithm
+    storage = result.get("STORAGE")
+    if isinstance(storage, str):
+        try:
+            parse_storage_spec(storage)
+        except ValueError as e:
+            raise ParsingError(str(e))
+
+    mix = result.get("GROWING_TREE_MIX")
+    if isinstance(mix, str):
+        try:
+            parse_growing_tree_mix(mix)
+        except ValueError as e:
+            raise ParsingError(str(e))
+    for key in ("TILE_SIZE", "WORKERS", "MUTATION_STEPS"):
+        value = result.get(key)
+        if isinstance(value, int) and value < 1:
+            raise ParsingError(f"{key} must be at least 1.")
+    coverage = result.get("HYBRID_COVERAGE")
+    if isinstance(coverage, int) and not 0 <= coverage <= 100:
+        raise ParsingError("HYBRID_COVERAGE must be between 0 and 100.")
+
+    entry = result.get("ENTRY")
+    exit_ = result.get("EXIT")
+    width = result.get("WIDTH")
+    height = result.get("HEIGHT")
+
+    if not isinstance(entry, tuple):
+        raise ParsingError("Invalid or missing ENTRY value.")
+    if not isinstance(exit_, tuple):
+        raise ParsingError("Invalid or missing EXIT value.")
+    if not isinstance(width, int):
+        raise ParsingError("Invalid or missing WIDTH value.")
+    if not isinstance(height, int):
+        raise ParsingError("Invalid or missing HEIGHT value.")
+
+    if entry == exit_:
+        raise ParsingError("Entry and exit are in the same place.")
+    if entry[0] < 0 or \
+            entry[1] < 0 or \
+            entry[0] >= width or \
+            entry[1] >= height:
+        raise ParsingError("Entry is out of the grid.")
+    if exit_[0] < 0 or \
+            exit_[1] < 0 or \
+            exit_[0] >= width or \
+            exit_[1] >= height:
+        raise ParsingError("Exit is out of the grid.")
+    return result
 
 
 def check_config_mandatory(
-        config: dict[str, int | tuple[int, int] | str | bool | None]
+        config: dict[str, int | tuple[int, int] | str | bool | None],
+        keys: Sequence[str] = MANDATORY_KEYS
 ) -> None:
     """Ensure all mandatory keys exist in the config.
 
     Args:
         config: Parsed configuration dictionary.
+        keys: Keys that must be present.
 
     Raises:
         ParsingError: If a mandatory key is missing.
     """
-    for key in ["WIDTH", "HEIGHT", "ENTRY", "EXIT", "OUTPUT_FILE", "PERFECT"]:
+    for key in keys:
         if key not in config:
             raise ParsingError(f"Missing mandatory key '{key}' "
                                f"in config file.")
+
+
+def check_pattern_overlap(config: MazeConfig) -> None:
+    """Ensure the entry and exit are not cells of the 42 pattern.
+
+    Args:
+        config: Validated configuration dictionary.
+
+    Raises:
+        ParsingError: If the entry or exit is a pattern cell.
+    """
+    width = config["WIDTH"]
+    height = config["HEIGHT"]
+    assert isinstance(width, int)
+    assert isinstance(height, int)
+    pattern = ft_pattern_cells(width, height)
+    if config["ENTRY"] in pattern:
+        raise ParsingError("Entry overlaps the 42 pattern.")
+    if config["EXIT"] in pattern:
+        raise ParsingError("Exit overlaps the 42 pattern.")
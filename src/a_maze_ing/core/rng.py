@@ -0,0 +1,265 @@
+"""Counter-based random number generation for the maze algorithms."""
+
+import os
+from random import Random, getrandbits
+from collections.abc import Sequence
+from typing import Any, TypeVar
+from src.a_maze_ing.core.seeding import derive_seed
+
+_T = TypeVar("_T")
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix64(value: int) -> int:
+    """Return the SplitMix64 finalizer of a 64-bit value.
+
+    Args:
+        value: Integer in ``range(2**64)``.
+
+    Returns:
+        Scrambled integer in ``range(2**64)``.
+    """
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+class SplitMixRandom(Random):
+    """SplitMix64 stream usable anywhere a ``random.Random`` is expected.
+
+    Output number ``i`` is a pure function of the key and ``i``, so the
+    stream can jump ahead in O(1) and independent streams can be derived
+    for workers from a single seed. Every ``random.Random`` method
+    (``choice``, ``shuffle``, ``randrange``...) is built on top of it.
+    """
+
+    def __init__(self, seed: Any = None) -> None:
+        """Create a stream.
+
+        Args:
+            seed: Integer or string seed; None draws one from the OS.
+        """
+        self._key = 0
+        self._counter = 0
+        super().__init__(seed)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """Restart the stream from a seed.
+
+        Args:
+            a: Integer or string seed; None draws one from the OS.
+            version: Ignored, kept for ``random.Random`` compatibility.
+        """
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "big")
+        if isinstance(a, int) and 0 <= a <= _MASK64:
+            self._key = a
+        else:
+            self._key = derive_seed(0, str(a))
+        self._counter = 0
+        self.gauss_next = None
+
+    def getstate(self) -> tuple[Any, ...]:
+        """Return the stream state, for ``setstate``."""
+        return self._key, self._counter, self.gauss_next
+
+    def setstate(self, state: Any) -> None:
+        """Restore a state returned by ``getstate``.
+
+        Args:
+            state: Stream state.
+        """
+        self._key, self._counter, self.gauss_next = state
+
+    def _next64(self) -> int:
+        """Return the next 64-bit output and advance the counter."""
+        self._counter += 1
+        return _mix64((self._key + self._counter * _GAMMA) & _MASK64)
+
+    def getrandbits(self, k: int) -> int:
+        """Return an integer with k random bits.
+
+        Args:
+            k: Number of bits.
+
+        Returns:
+            Integer in ``range(2**k)``.
+        """
+        if k <= 64:
+            return self._next64() >> (64 - k)
+        value = 0
+        for _ in range(0, k, 64):
+            value = value << 64 | self._next64()
+        return value >> (-k % 64)
+
+    def _randbelow(self, n: int) -> int:
+        """Return a random integer in ``range(n)`` by rejection sampling.
+
+        Backs ``choice``, ``shuffle`` and ``randrange``; inlined here since
+        it runs once per draw.
+
+        Args:
+            n: Positive upper bound.
+
+        Returns:
+            Uniformly drawn integer.
+        """
+        shift = 64 - n.bit_length()
+        key = self._key
+        while True:
+            self._counter += 1
+            value = (key + self._counter * _GAMMA) & _MASK64
+            value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+            value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+            value = (value ^ (value >> 31)) >> shift
+            if value < n:
+                return value
+
+    def random(self) -> float:
+        """Return a float in [0.0, 1.0)."""
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def _block(self) -> Random:
+        """Return a generator for one bulk draw, keyed by the next output.
+
+        Bulk draws cost a single step of the counter whatever their size:
+        the output keys the C-implemented Mersenne Twister, which then
+        produces the whole block at native speed.
+        """
+        return Random(self._next64())
+
+    def randbytes(self, n: int) -> bytes:
+        """Return n random bytes as one bulk draw.
+
+        Args:
+            n: Number of bytes.
+
+        Returns:
+            Random bytes.
+        """
+        return self._block().randbytes(n)
+
+    def shuffle(self, x: Any) -> None:
+        """Shuffle a mutable sequence in place as one bulk draw.
+
+        Args:
+            x: Sequence to shuffle.
+        """
+        self._block().shuffle(x)
+
+    def jump(self, n: int) -> None:
+        """Skip the next n 64-bit outputs in O(1).
+
+        Args:
+            n: Number of outputs to skip.
+        """
+        self._counter += n
+
+    def spawn(self, stream: int | str) -> "SplitMixRandom":
+        """Return an independent stream derived from this one's seed.
+
+        The result only depends on the seed and ``stream``, not on how
+        many numbers were drawn, so workers can each build their own.
+
+        Args:
+            stream: Stream identifier, e.g. a worker or tile number.
+
+        Returns:
+            New generator.
+        """
+        return SplitMixRandom(derive_seed(self._key, "stream", stream))
+
+
+class ChoiceBuffer:
+    """Unbiased bounded draws served from bulk-drawn random bytes.
+
+    Drawing one value per call through ``random.Random`` costs several
+    Python calls; here the bytes come from a single ``randbytes`` call per
+    refill and each draw only indexes the buffer. Refills start small and
+    double up to ``size`` bytes, so tiny mazes draw little.
+    """
+
+    def __init__(self, rng: Random, size: int = 4096) -> None:
+        """Create an empty buffer.
+
+        Args:
+            rng: Generator the bytes are drawn from.
+            size: Maximum number of bytes drawn per refill.
+        """
+        self.rng = rng
+        self.size = size
+        self.refill_size = min(64, size)
+        self.buffer = b""
+        self.position = 0
+
+    def _refill(self) -> None:
+        """Replace the buffer with fresh random bytes."""
+        self.buffer = self.rng.randbytes(self.refill_size)
+        self.refill_size = min(self.refill_size * 2, self.size)
+        self.position = 0
+
+    def below(self, n: int) -> int:
+        """Return a random integer in ``range(n)``.
+
+        Bounds up to 256 use a single byte per attempt; larger ones use as
+        many bytes as needed. Attempts above the largest multiple of n are
+        rejected so that every value is equally likely.
+
+        Args:
+            n: Positive number of possible values.
+
+        Returns:
+            Uniformly drawn integer.
+        """
+        if n <= 256:
+            if n == 1:
+                return 0
+            limit = 256 - 256 % n
+            while True:
+                if self.position >= len(self.buffer):
+                    self._refill()
+                value = self.buffer[self.position]
+                self.position += 1
+                if value < limit:
+                    return value % n
+        width = ((n - 1).bit_length() + 7) // 8
+        span = 1 << (8 * width)
+        limit = span - span % n
+        while True:
+            if self.position + width > len(self.buffer):
+                self._refill()
+            start = self.position
+            self.position += width
+            value = int.from_bytes(
+                self.buffer[start:start + width], "little"
+            )
+            if value < limit:
+                return value % n
+
+    def choice(self, seq: Sequence[_T]) -> _T:
+        """Return a random element of a non-empty sequence.
+
+        Args:
+            seq: Sequence to pick from.
+
+        Returns:
+            Chosen element.
+        """
+        return seq[self.below(len(seq))]
+
+
+def ensure_rng(rng: Random | None) -> Random:
+    """Return the generator an algorithm should draw from.
+
+    Args:
+        rng: Explicit generator, or None.
+
+    Returns:
+        rng itself, or a new SplitMixRandom seeded from the global
+        ``random`` module so that ``random.seed`` keeps runs reproducible.
+    """
+    if rng is not None:
+        return rng
+    return SplitMixRandom(getrandbits(64))
@@ -0,0 +1,21 @@
+"""Deterministic seed derivation."""
+
+from hashlib import blake2b
+
+
+def derive_seed(seed: int, *keys: int | str) -> int:
+    """Derive an independent 64-bit seed from a base seed and keys.
+
+    The same base seed and keys always give the same result, on every
+    platform and in every process, so work split across processes can be
+    seeded reproducibly.
+
+    Args:
+        seed: Base seed.
+        keys: Values identifying the derived stream (e.g. tile position).
+
+    Returns:
+        Derived seed in ``range(2**64)``.
+    """
+    data = repr((seed, *keys)).encode("ascii")
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "big")
@@ -0,0 +1,183 @@
+"""Storage backends for maze grids.
+
+A grid is either kept in heap memory (the default) or mapped from a file
+on disk so that mazes larger than the available RAM can be generated,
+solved and written. The ``STORAGE`` config key selects the backend:
+
+- ``memory``: planes are plain ``bytearray`` objects.
+- ``mmap:<path>``: planes live in ``<path>``, walls first, then states
+  at the next allocation-granularity boundary.
+
+Per-cell work arrays of generators and solvers (``scratch_plane``) follow
+the grid: they are mapped from temporary files next to a mapped grid.
+"""
+
+import os
+import tempfile
+from array import array
+from mmap import ALLOCATIONGRANULARITY, mmap
+from typing import Literal
+from src.a_maze_ing.core.cell import ALL_WALLS, CellState
+from src.a_maze_ing.core.grid import MazeGrid
+
+_MMAP_PREFIX = "mmap:"
+
+# Item types of scratch planes, as ``array`` typecodes.
+Typecode = Literal["B", "H", "I", "Q", "i", "q"]
+
+# Bytes written per call when initializing a mapped plane.
+_FILL_CHUNK = 1 << 20
+
+
+def parse_storage_spec(spec: str | None) -> str | None:
+    """Validate a storage specification.
+
+    Args:
+        spec: Value of the STORAGE key, or None for the default.
+
+    Returns:
+        Backing file path for ``mmap:<path>``, None for memory storage.
+
+    Raises:
+        ValueError: If the specification is not recognized.
+    """
+    if spec is None or spec.strip().lower() == "memory":
+        return None
+    spec = spec.strip()
+    if spec.lower().startswith(_MMAP_PREFIX):
+        path = spec[len(_MMAP_PREFIX):].strip()
+        if path:
+            return path
+    raise ValueError(
+        f"Invalid STORAGE value '{spec}'. Expected 'memory' or 'mmap:PATH'."
+    )
+
+
+class MappedMazeGrid(MazeGrid):
+    """Maze grid whose planes are memory-mapped from a file."""
+
+    def __init__(
+            self,
+            path: str,
+            width: int,
+            height: int,
+            create: bool = True
+    ) -> None:
+        """Map a grid file, creating it with every wall closed if needed.
+
+        Args:
+            path: Backing file path.
+            width: Number of columns.
+            height: Number of rows.
+            create: True to (re)initialize the file, False to map an
+                existing grid file as is.
+
+        Raises:
+            ValueError: If the grid is empty.
+            OSError: If the file cannot be created or mapped.
+        """
+        size = width * height
+        if size <= 0:
+            raise ValueError("Memory-mapped grids cannot be empty.")
+        states_offset = -(-size // ALLOCATIONGRANULARITY) \
+            * ALLOCATIONGRANULARITY
+        self.path = path
+        self._file = open(path, "w+b" if create else "r+b")
+        try:
+            if create:
+                self._file.truncate(states_offset + size)
+            walls = mmap(self._file.fileno(), size)
+            states = mmap(self._file.fileno(), size, offset=states_offset)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        if create:
+            _fill(walls, bytes([ALL_WALLS]))
+            _fill(states, bytes([CellState.UNVISITED.value]))
+        self._walls_map = walls
+        self._states_map = states
+        super().__init__(width, height, walls=walls, states=states)
+
+    def flush(self) -> None:
+        """Write pending changes back to the backing file."""
+        self._walls_map.flush()
+        self._states_map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the grid planes, then close the file."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._walls_map.close()
+        self._states_map.close()
+        self._file.close()
+
+
+def _fill(plane: mmap, pattern: bytes) -> None:
+    """Fill a mapped plane with a repeated byte pattern.
+
+    Args:
+        plane: Mapped plane to fill; its size is a multiple of the
+            pattern size.
+        pattern: Bytes written for every item.
+    """
+    chunk = pattern * max(1, min(_FILL_CHUNK, len(plane)) // len(pattern))
+    for start in range(0, len(plane), len(chunk)):
+        end = min(start + len(chunk), len(plane))
+        plane[start:end] = chunk[:end - start]
+
+
+def scratch_plane(
+        count: int,
+        typecode: Typecode = "B",
+        fill: int = 0,
+        grid: MazeGrid | None = None
+) -> memoryview:
+    """Allocate a work array on the storage backend of a grid.
+
+    For a memory-mapped grid, the array is mapped from an unlinked
+    temporary file in the directory of the grid file, so it does not
+    hold heap memory either; the file goes away with the last view of
+    the array. Otherwise the array lives in a ``bytearray``.
+
+    Args:
+        count: Number of items.
+        typecode: Item type, as an ``array`` typecode.
+        fill: Initial value of every item.
+        grid: Grid whose backend is used; memory if None.
+
+    Returns:
+        Writable view of ``count`` items of the given type.
+    """
+    pattern = array(typecode, [fill]).tobytes()
+    if not isinstance(grid, MappedMazeGrid) or count == 0:
+        return memoryview(bytearray(pattern) * count).cast(typecode)
+    nbytes = count * len(pattern)
+    directory = os.path.dirname(os.path.abspath(grid.path))
+    with tempfile.TemporaryFile(dir=directory) as file:
+        file.truncate(nbytes)
+        plane = mmap(file.fileno(), nbytes)
+    if any(pattern):
+        _fill(plane, pattern)
+    return memoryview(plane).cast(typecode)
+
+
+def allocate_grid(
+        width: int,
+        height: int,
+        storage: str | None = None
+) -> MazeGrid:
+    """Create a grid with every wall closed on the requested backend.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        storage: Storage specification (see ``parse_storage_spec``).
+
+    Returns:
+        New grid, memory-mapped when a file path is requested.
+    """
+    path = parse_storage_spec(storage)
+    if path is None:
+        return MazeGrid(width, height)
+    return MappedMazeGrid(path, width, height)
@@ -1,6 +1,14 @@
 """Maze rendering and output helpers."""
 
 from src.a_maze_ing.io.output import write_output_file
-from src.a_maze_ing.io.rendering import render_ascii, render_hex
+from src.a_maze_ing.io.output import write_output_stream
+from src.a_maze_ing.io.rendering import iter_hex_rows, render_ascii
+from src.a_maze_ing.io.rendering import render_hex
 
-__all__ = ["render_ascii", "render_hex", "write_output_file"]
+__all__ = [
+    "iter_hex_rows",
+    "render_ascii",
+    "render_hex",
+    "write_output_file",
+    "write_output_stream"
+]
@@ -0,0 +1,717 @@
+"""Local HTTP maze service backed by a prewarmed process pool."""
+
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.managers import SyncManager
+from multiprocessing.queues import Queue
+from queue import Queue as SyncQueue
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.parsing import ParsingError
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.storage import allocate_grid
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.eller import stream_eller_hex
+from src.a_maze_ing.algorithms.grid_utils import config_storage
+from src.a_maze_ing.algorithms.grid_utils import warn_pattern_skipped
+from src.a_maze_ing.io.rendering import iter_hex_rows, render_ascii
+from src.a_maze_ing.io.stdio_server import parse_request
+from src.a_maze_ing.maze.batch import generate_maze
+
+# Endpoint -> content type of its body.
+ENDPOINTS = {
+    "/generate": "text/plain; charset=utf-8",
+    "/solve": "application/json",
+    "/render": "text/plain; charset=utf-8",
+}
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+# Largest request line or header line accepted, in bytes.
+_MAX_LINE = 8192
+
+# Largest request body skipped to keep a connection alive, in bytes.
+_MAX_BODY = 1 << 16
+
+# Body bytes a worker gathers before sending them to the server.
+_BATCH_BYTES = 1 << 14
+
+# Batches a worker may send before the server acknowledges the first one.
+_WINDOW = 4
+
+# Quantiles reported on the metrics page.
+_QUANTILES = (0.5, 0.9, 0.99)
+
+# Queue a worker process sends body batches to; set by _init_worker.
+_worker_queue: "Queue[Any] | None" = None
+
+
+def iter_body(
+        endpoint: str,
+        config: MazeConfig,
+        seed: int
+) -> Generator[str, None, None]:
+    """Generate a maze and yield its response body as it is built.
+
+    ``/generate`` yields the maze rows before the path is searched; for
+    perfect Eller mazes, each row is yielded as soon as it is generated.
+
+    Args:
+        endpoint: One of ENDPOINTS. ``/generate`` gives the output file
+            format, ``/solve`` a JSON object with the seed and path, and
+            ``/render`` the ASCII drawing of the maze.
+        config: Validated maze config.
+        seed: Seed of the maze.
+
+    Yields:
+        Body lines, without line terminators.
+    """
+    entry = config["ENTRY"]
+    exit_pos = config["EXIT"]
+    assert isinstance(entry, tuple)
+    assert isinstance(exit_pos, tuple)
+    rng = SplitMixRandom(seed)
+    rows: Iterator[str] | None = None
+    maze: MazeGrid
+    if endpoint == "/generate" and config.get("ALGORITHM") == "ELLER" \
+            and config.get("PERFECT", True) and "TILE_SIZE" not in config:
+        width = config["WIDTH"]
+        height = config["HEIGHT"]
+        assert isinstance(width, int)
+        assert isinstance(height, int)
+        maze = allocate_grid(width, height, config_storage(config))
+        rows = stream_eller_hex(config, maze, rng)
+    else:
+        maze = generate_maze(config, rng)
+    try:
+        if endpoint == "/render":
+            yield from render_ascii(maze, entry, exit_pos, color=False) \
+                .split("\n")
+            return
+        if endpoint == "/solve":
+            path = a_star(entry, exit_pos, maze)
+            yield json.dumps({"seed": seed, "path": path})
+            return
+        yield from rows if rows is not None else iter_hex_rows(maze)
+        yield ""
+        yield f"{entry[0]},{entry[1]}"
+        yield f"{exit_pos[0]},{exit_pos[1]}"
+        yield a_star(entry, exit_pos, maze)
+    finally:
+        maze.close()
+
+
+def _init_worker(queue: "Queue[Any]") -> None:
+    """Keep the body queue of the server in a new worker process.
+
+    Args:
+        queue: Queue shared with the server.
+    """
+    global _worker_queue
+    _worker_queue = queue
+
+
+def _stream_body(
+        stream: int,
+        acks: "SyncQueue[bool]",
+        endpoint: str,
+        config: MazeConfig,
+        seed: int
+) -> None:
+    """Send the body of a request to the server in batches; runs in a worker.
+
+    Messages are (stream, kind, payload) tuples: ``"lines"`` with a list of
+    body lines, then either ``"end"`` or ``"error"`` with a message. At
+    most _WINDOW batches are in flight: past that, each batch waits for
+    the server to acknowledge a written one (True on ``acks``). False
+    means the client is gone, and the body is abandoned.
+
+    Args:
+        stream: Identifier of the request on the server.
+        acks: Acknowledgements from the server.
+        endpoint: One of ENDPOINTS.
+        config: Validated maze config.
+        seed: Seed of the maze.
+    """
+    queue = _worker_queue
+    assert queue is not None
+    lines = iter_body(endpoint, config, seed)
+    try:
+        for sent, batch in enumerate(_batches(lines)):
+            if sent >= _WINDOW and not acks.get():
+                return
+            queue.put((stream, "lines", batch))
+    except Exception as e:
+        queue.put((stream, "error", str(e)))
+        return
+    finally:
+        lines.close()
+    queue.put((stream, "end", None))
+
+
+def _batches(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Group body lines into batches of about _BATCH_BYTES.
+
+    Args:
+        lines: Body lines, without line terminators.
+
+    Yields:
+        Non-empty lists of consecutive lines.
+    """
+    batch: list[str] = []
+    size = 0
+    for line in lines:
+        batch.append(line)
+        size += len(line) + 1
+        if size >= _BATCH_BYTES:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def _warm_up() -> None:
+    """Run a small job so a worker process is started and ready."""
+    for _ in iter_body("/generate", {
+        "WIDTH": 9,
+        "HEIGHT": 7,
+        "ENTRY": (0, 0),
+        "EXIT": (8, 6),
+    }, 0):
+        pass
+
+
+def parse_query(query: str) -> tuple[MazeConfig, int]:
+    """Validate the query string of a maze request.
+
+    Keys are configuration keys, validated like a configuration file
+    (e.g. ``WIDTH=20&ENTRY=0,0&PERFECT=True``), plus an optional integer
+    ``seed``.
+
+    Args:
+        query: Raw query string.
+
+    Returns:
+        Maze config and seed.
+
+    Raises:
+        ParsingError: If a key or value is invalid.
+    """
+    values = dict(parse_qsl(query, keep_blank_values=True))
+    request: dict[str, object] = {"config": values}
+    if "seed" in values:
+        try:
+            request["seed"] = int(values.pop("seed"))
+        except ValueError:
+            raise ParsingError("The request 'seed' must be an integer.")
+    return parse_request(request)
+
+
+class ServerMetrics:
+    """Request counters and latencies of each endpoint.
+
+    Attributes:
+        started: Monotonic time the server started at.
+        requests: Number of answered requests per path.
+        errors: Number of answers with an error status per path.
+        latency_sum: Total latency per path, in seconds.
+        latencies: Most recent latencies per path, in seconds.
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        """Create empty metrics.
+
+        Args:
+            window: Number of recent latencies kept per path for the
+                quantiles.
+        """
+        self.started = time.monotonic()
+        self.window = window
+        self.requests: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.latency_sum: dict[str, float] = {}
+        self.latencies: dict[str, deque[float]] = {}
+
+    def record(self, path: str, status: int, latency: float) -> None:
+        """Record one answered request.
+
+        Args:
+            path: Request path; unknown paths are grouped as "other".
+            status: HTTP status of the answer.
+            latency: Seconds from the request line to the last byte.
+        """
+        if path not in ENDPOINTS and path != "/metrics":
+            path = "other"
+        self.requests[path] = self.requests.get(path, 0) + 1
+        if status >= 400:
+            self.errors[path] = self.errors.get(path, 0) + 1
+        self.latency_sum[path] = self.latency_sum.get(path, 0.0) + latency
+        self.latencies.setdefault(path, deque(maxlen=self.window)) \
+            .append(latency)
+
+    def render(self) -> list[str]:
+        """Return the metrics in the Prometheus text format.
+
+        Returns:
+            Metrics page lines.
+        """
+        uptime = time.monotonic() - self.started
+        total = sum(self.requests.values())
+        lines = [
+            "# TYPE maze_uptime_seconds gauge",
+            f"maze_uptime_seconds {uptime:.3f}",
+            "# TYPE maze_throughput_requests_per_second gauge",
+            f"maze_throughput_requests_per_second {total / uptime:.3f}",
+            "# TYPE maze_requests_total counter",
+        ]
+        for path, count in sorted(self.requests.items()):
+            lines.append(f'maze_requests_total{{path="{path}"}} {count}')
+        lines.append("# TYPE maze_errors_total counter")
+        for path, count in sorted(self.errors.items()):
+            lines.append(f'maze_errors_total{{path="{path}"}} {count}')
+        lines.append("# TYPE maze_request_latency_seconds summary")
+        for path, recent in sorted(self.latencies.items()):
+            ordered = sorted(recent)
+            for quantile in _QUANTILES:
+                value = ordered[min(len(ordered) - 1,
+                                    int(quantile * len(ordered)))]
+                lines.append(
+                    "maze_request_latency_seconds"
+                    f'{{path="{path}",quantile="{quantile}"}} {value:.6f}'
+                )
+            lines.append(
+                f'maze_request_latency_seconds_sum{{path="{path}"}} '
+                f"{self.latency_sum[path]:.6f}"
+            )
+            lines.append(
+                f'maze_request_latency_seconds_count{{path="{path}"}} '
+                f"{self.requests[path]}"
+            )
+        return lines
+
+
+class MazeHTTPServer:
+    """Asyncio HTTP/1.1 server answering maze requests.
+
+    GET requests on ENDPOINTS take the maze config in the query string
+    (see ``parse_query``); the maze is built by ``iter_body`` in a
+    process pool whose workers are started before the first request is
+    accepted. Workers send the body in batches of lines through a shared
+    queue as it is built, and a router thread hands each batch to its
+    request, which writes it as one chunk of a chunked response.
+    ``/metrics`` serves the ServerMetrics page. Connections are kept
+    alive unless the client asks otherwise or sends a request body that
+    cannot be skipped. The small-maze pattern warning is logged once per
+    server.
+    """
+
+    def __init__(self, jobs: int = 1) -> None:
+        """Create a stopped server.
+
+        Args:
+            jobs: Number of worker processes.
+        """
+        self.jobs = jobs
+        self.metrics = ServerMetrics()
+        self._pool: ProcessPoolExecutor | None = None
+        self._server: asyncio.Server | None = None
+        self._pattern_warned = False
+        self._bodies: Queue[Any] | None = None
+        self._router: threading.Thread | None = None
+        self._manager: SyncManager | None = None
+        self._streams: dict[int, asyncio.Queue[tuple[str, Any]]] = {}
+        self._acks: dict[int, SyncQueue[bool]] = {}
+        self._next_stream = 0
+
+    async def start(self, host: str, port: int) -> int:
+        """Start the worker processes, then listen for connections.
+
+        Args:
+            host: Address to bind.
+            port: Port to bind; 0 picks a free one.
+
+        Returns:
+            Bound port.
+        """
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context()
+        self._manager = context.Manager()
+        self._bodies = context.Queue()
+        self._router = threading.Thread(
+            target=self._route, args=(self._bodies, loop), daemon=True
+        )
+        self._router.start()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._bodies,)
+        )
+        await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _warm_up)
+            for _ in range(self.jobs)
+        ))
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.metrics = ServerMetrics()
+        port = self._server.sockets[0].getsockname()[1]
+        assert isinstance(port, int)
+        return port
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and shut the worker processes down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Workers waiting for an acknowledgement would block the shutdown.
+        for acks in self._acks.values():
+            acks.put(False)
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+        if self._bodies is not None and self._router is not None:
+            self._bodies.put(None)
+            self._router.join()
+            self._bodies.close()
+            self._bodies = None
+            self._router = None
+
+    def _route(
+            self,
+            bodies: "Queue[Any]",
+            loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Hand worker messages to their requests; runs in a thread.
+
+        Args:
+            bodies: Queue the workers send body batches to; a None
+                message stops the thread.
+            loop: Event loop the requests are served on.
+        """
+        while True:
+            message = bodies.get()
+            if message is None:
+                return
+            loop.call_soon_threadsafe(self._deliver, *message)
+
+    def _deliver(self, stream: int, kind: str, payload: Any) -> None:
+        """Queue a worker message for its request, if still waiting.
+
+        Args:
+            stream: Identifier of the request.
+            kind: Message kind (see ``_stream_body``).
+            payload: Message payload.
+        """
+        queue = self._streams.get(stream)
+        if queue is not None:
+            queue.put_nowait((kind, payload))
+
+    async def _handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection.
+
+        Args:
+            reader: Connection input.
+            writer: Connection output.
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                started = time.monotonic()
+                headers = await self._read_headers(reader)
+                if headers is None:
+                    break
+                parts = request_line.decode("latin-1").split()
+                version = parts[2] if len(parts) == 3 else "HTTP/1.0"
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" or (
+                    version == "HTTP/1.1" and connection != "close"
+                )
+                if not await self._skip_body(reader, headers):
+                    keep_alive = False
+                path, status, keep_alive = await self._answer(
+                    parts, writer, keep_alive
+                )
+                self.metrics.record(path, status,
+                                    time.monotonic() - started)
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _skip_body(
+            reader: asyncio.StreamReader,
+            headers: dict[str, str]
+    ) -> bool:
+        """Read and drop the body of a request, which is never used.
+
+        Args:
+            reader: Connection input, positioned after the headers.
+            headers: Request headers.
+
+        Returns:
+            True if the connection is ready for the next request, False
+            if the body cannot be skipped (chunked, oversized or with an
+            invalid length) and the connection must be closed after the
+            response.
+        """
+        length = headers.get("content-length", "0")
+        if "transfer-encoding" in headers or not length.isdigit() \
+                or int(length) > _MAX_BODY:
+            return False
+        await reader.readexactly(int(length))
+        return True
+
+    @staticmethod
+    async def _read_headers(
+            reader: asyncio.StreamReader
+    ) -> dict[str, str] | None:
+        """Read request headers up to the blank line.
+
+        Args:
+            reader: Connection input.
+
+        Returns:
+            Headers with lowercase names, or None if the connection ended
+            or sent an oversized line.
+        """
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if not line or len(line) > _MAX_LINE:
+                return None
+            if not line.strip():
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _answer(
+            self,
+            parts: list[str],
+            writer: asyncio.StreamWriter,
+            keep_alive: bool
+    ) -> tuple[str, int, bool]:
+        """Route one request and write its response.
+
+        Args:
+            parts: Words of the request line.
+            writer: Connection output.
+            keep_alive: Whether the connection stays open afterwards.
+
+        Returns:
+            Request path, response status, and whether the connection
+            can still be kept alive.
+        """
+        if len(parts) != 3:
+            await self._send(writer, 400, ["Malformed request line."],
+                             keep_alive)
+            return "other", 400, keep_alive
+        method, target, _ = parts
+        url = urlsplit(target)
+        if url.path not in ENDPOINTS and url.path != "/metrics":
+            await self._send(writer, 404, [f"Unknown path {url.path}."],
+                             keep_alive)
+            return url.path, 404, keep_alive
+        if method != "GET":
+            await self._send(writer, 405, ["Only GET is supported."],
+                             keep_alive)
+            return url.path, 405, keep_alive
+        if url.path == "/metrics":
+            await self._send(writer, 200, self.metrics.render(), keep_alive)
+            return url.path, 200, keep_alive
+        try:
+            config, seed = parse_query(url.query)
+        except ParsingError as e:
+            await self._send(writer, 400, [str(e)], keep_alive)
+            return url.path, 400, keep_alive
+        if not self._pattern_warned:
+            self._pattern_warned = warn_pattern_skipped([config])
+        status = await self._stream(writer, url.path, config, seed,
+                                    keep_alive)
+        return url.path, status, keep_alive and status == 200
+
+    async def _stream(
+            self,
+            writer: asyncio.StreamWriter,
+            endpoint: str,
+            config: MazeConfig,
+            seed: int,
+            keep_alive: bool
+    ) -> int:
+        """Build a maze body in a worker and write it as it arrives.
+
+        The status line is sent with the first batch, so a failure before
+        it gives a 500 response. A failure afterwards leaves the body
+        unterminated; the connection must then be closed. Each batch is
+        acknowledged once written, which lets the worker send the next
+        one (see ``_stream_body``), so a slow client holds at most
+        _WINDOW batches in memory. If the client goes away, the worker is
+        told to stop.
+
+        Args:
+            writer: Connection output.
+            endpoint: One of ENDPOINTS.
+            config: Validated maze config.
+            seed: Seed of the maze.
+            keep_alive: Whether the connection stays open afterwards.
+
+        Returns:
+            Response status, 500 if the body could not be built.
+        """
+        assert self._pool is not None and self._manager is not None
+        stream = self._next_stream
+        self._next_stream += 1
+        queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        acks: SyncQueue[bool] = self._manager.Queue()
+        self._streams[stream] = queue
+        self._acks[stream] = acks
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(self._pool, partial(
+            _stream_body, stream, acks, endpoint, config, seed
+        ))
+        finished = False
+
+        def check(job: asyncio.Future[None]) -> None:
+            # A worker that dies cannot report its own failure.
+            if not job.cancelled() and job.exception() is not None:
+                queue.put_nowait(("error", str(job.exception())))
+
+        job.add_done_callback(check)
+        try:
+            kind, payload = await queue.get()
+            if kind == "error":
+                finished = True
+                await self._send(writer, 500, [payload], keep_alive)
+                return 500
+            self._write_head(writer, 200, keep_alive, ENDPOINTS[endpoint])
+            while kind == "lines":
+                await self._write_chunk(writer, payload)
+                await asyncio.to_thread(acks.put, True)
+                kind, payload = await queue.get()
+            finished = True
+            if kind == "error":
+                return 500
+            await self._write_chunk(writer, [])
+            return 200
+        finally:
+            del self._streams[stream]
+            del self._acks[stream]
+            if not finished:
+                job.cancel()
+                acks.put(False)
+
+    @staticmethod
+    def _write_head(
+            writer: asyncio.StreamWriter,
+            status: int,
+            keep_alive: bool,
+            content_type: str
+    ) -> None:
+        """Write the status line and headers of a chunked response.
+
+        Args:
+            writer: Connection output.
+            status: HTTP status code.
+            keep_alive: Whether the connection stays open afterwards.
+            content_type: Content-Type header value.
+        """
+        headers = {
+            "Content-Type": content_type,
+            "Transfer-Encoding": "chunked",
+            "Connection": "keep-alive" if keep_alive else "close",
+        }
+        head = [f"HTTP/1.1 {status} {_REASONS[status]}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+
+    @staticmethod
+    async def _write_chunk(
+            writer: asyncio.StreamWriter,
+            lines: list[str]
+    ) -> None:
+        """Write body lines as one chunk; no lines ends the body.
+
+        Args:
+            writer: Connection output.
+            lines: Body lines, without line terminators.
+        """
+        chunk = "".join(line + "\n" for line in lines).encode("utf-8")
+        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        await writer.drain()
+
+    @classmethod
+    async def _send(
+            cls,
+            writer: asyncio.StreamWriter,
+            status: int,
+            lines: Iterable[str],
+            keep_alive: bool,
+            content_type: str = "text/plain; charset=utf-8"
+    ) -> None:
+        """Write a whole response with a chunked body, in a single chunk.
+
+        Args:
+            writer: Connection output.
+            status: HTTP status code.
+            lines: Body lines, without line terminators.
+            keep_alive: Whether the connection stays open afterwards.
+            content_type: Content-Type header value.
+        """
+        cls._write_head(writer, status, keep_alive, content_type)
+        lines = list(lines)
+        if lines:
+            await cls._write_chunk(writer, lines)
+        await cls._write_chunk(writer, [])
+
+
+async def serve_http(host: str, port: int, jobs: int = 1) -> None:
+    """Run the maze HTTP service until cancelled.
+
+    Args:
+        host: Address to bind.
+        port: Port to bind.
+        jobs: Number of worker processes.
+    """
+    server = MazeHTTPServer(jobs)
+    port = await server.start(host, port)
+    print(f"Serving mazes on http://{host}:{port}/ "
+          f"({', '.join(ENDPOINTS)}, /metrics)", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
@@ -1,19 +1,56 @@
 """Output file writer for mazes."""
 
+from collections.abc import Callable, Iterable, Sequence
 from src.a_maze_ing.algorithms.a_star import a_star
 from src.a_maze_ing.core.cell import Cell
-from src.a_maze_ing.io.rendering import render_hex
+from src.a_maze_ing.io.rendering import iter_hex_rows
+
+
+def write_output_stream(
+    output_file: str,
+    rows: Iterable[str],
+    entry: tuple[int, int],
+    exit_pos: tuple[int, int],
+    path: str | Callable[[], str] = ""
+) -> None:
+    """Write the output file from hexadecimal rows as they are produced.
+
+    Each row is written as soon as the iterable yields it, so a row-by-row
+    generator never needs the whole maze in memory to be written out.
+
+    Args:
+        output_file: Output file path.
+        rows: Hexadecimal rows, top to bottom.
+        entry: Entry coordinates.
+        exit_pos: Exit coordinates.
+        path: Path string, or a callable returning it once every row has
+            been written.
+    """
+    with open(output_file, "w", encoding="utf-8") as f:
+        for y, row in enumerate(rows):
+            if y > 0:
+                f.write("\n")
+            f.write(row)
+        if callable(path):
+            path = path()
+        f.write("\n\n")
+        f.write(f"{entry[0]},{entry[1]}\n")
+        f.write(f"{exit_pos[0]},{exit_pos[1]}\n")
+        f.write(f"{path}\n")
 
 
 def write_output_file(
     output_file: str,
-    maze: list[list[Cell]],
+    maze: Sequence[Sequence[Cell]],
     entry: tuple[int, int],
     exit_pos: tuple[int, int],
     path: str | None = None
 ) -> None:
     """Write the maze output file in the required format.
 
+    Rows are written one at a time so file-backed grids are never
+    rendered into a single in-memory string.
+
     Args:
         output_file: Output file path.
         maze: 2D maze grid.
@@ -23,9 +60,5 @@ def write_output_file(
     """
     if path is None:
         path = a_star(entry, exit_pos, maze)
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(render_hex(maze))
-        f.write("\n\n")
-        f.write(f"{entry[0]},{entry[1]}\n")
-        f.write(f"{exit_pos[0]},{exit_pos[1]}\n")
-        f.write(f"{path}\n")
+    write_output_stream(output_file, iter_hex_rows(maze), entry, exit_pos,
+                        path)
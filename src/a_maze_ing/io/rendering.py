@@ -1,6 +1,8 @@
 """ASCII and hexadecimal rendering for mazes."""
 
+from collections.abc import Iterator, Sequence
 from src.a_maze_ing.core.cell import Cell
+from src.a_maze_ing.core.grid import MazeGrid
 
 # ANSI color codes
 COLOR_GREEN = "\033[92m"
@@ -9,9 +11,10 @@ COLOR_RESET = "\033[0m"
 
 
 def render_ascii(
-    grid: list[list[Cell]],
+    grid: Sequence[Sequence[Cell]],
     entry: tuple[int, int] | None = None,
-    exit_point: tuple[int, int] | None = None
+    exit_point: tuple[int, int] | None = None,
+    color: bool = True
 ) -> str:
     """Render a maze grid as ASCII art.
 
@@ -24,6 +27,7 @@ def render_ascii(
         grid: 2D maze grid.
         entry: Optional entry coordinates.
         exit_point: Optional exit coordinates.
+        color: Whether to color the entry and exit with ANSI codes.
 
     Returns:
         Multiline ASCII representation of the maze.
@@ -34,6 +38,8 @@ def render_ascii(
     height = len(grid)
     width = len(grid[0])
     lines = []
+    start_mark = f"{COLOR_GREEN} S {COLOR_RESET}" if color else " S "
+    end_mark = f"{COLOR_RED} E {COLOR_RESET}" if color else " E "
 
     for y in range(height):
         # Top line of the row (north walls)
@@ -52,9 +58,9 @@ def render_ascii(
             mid_line += "|" if cell.west else " "
             # Cell content with color for entry/exit
             if entry and (x, y) == entry:
-                mid_line += f"{COLOR_GREEN} S {COLOR_RESET}"
+                mid_line += start_mark
             elif exit_point and (x, y) == exit_point:
-                mid_line += f"{COLOR_RED} E {COLOR_RESET}"
+                mid_line += end_mark
             else:
                 mid_line += "   "
         # Last east wall
@@ -73,7 +79,24 @@ def render_ascii(
     return "\n".join(lines)
 
 
-def render_hex(grid: list[list[Cell]]) -> str:
+def iter_hex_rows(grid: Sequence[Sequence[Cell]]) -> Iterator[str]:
+    """Yield the hexadecimal encoding of a maze grid row by row.
+
+    Args:
+        grid: 2D maze grid.
+
+    Yields:
+        One line of hexadecimal digits per grid row.
+    """
+    if isinstance(grid, MazeGrid):
+        for y in range(grid.height):
+            yield grid.hex_row(y)
+        return
+    for row in grid:
+        yield "".join(str(cell) for cell in row)
+
+
+def render_hex(grid: Sequence[Sequence[Cell]]) -> str:
     """Render a maze grid as hexadecimal values.
 
     Args:
@@ -85,8 +108,4 @@ def render_hex(grid: list[list[Cell]]) -> str:
     if not grid or not grid[0]:
         return ""
 
-    lines = []
-    for row in grid:
-        lines.append("".join(str(cell) for cell in row))
-
-    return "\n".join(lines)
+    return "\n".join(iter_hex_rows(grid))
@@ -0,0 +1,148 @@
+"""JSON-lines maze worker over standard input and output."""
+
+import json
+import random
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, TextIO
+from src.a_maze_ing.core.parsing import ParsingError
+from src.a_maze_ing.core.parsing import check_config_mandatory
+from src.a_maze_ing.core.parsing import check_pattern_overlap
+from src.a_maze_ing.core.parsing import parse_config_mapping
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.grid_utils import warn_pattern_skipped
+from src.a_maze_ing.io.rendering import iter_hex_rows
+from src.a_maze_ing.maze.batch import generate_maze
+
+# Keys a request config must contain; nothing is written to OUTPUT_FILE.
+REQUEST_KEYS = ("WIDTH", "HEIGHT", "ENTRY", "EXIT", "PERFECT")
+
+# Keys describing the local process rather than the maze, ignored.
+_IGNORED_KEYS = ("OUTPUT_FILE", "GUI", "ANIMATIONS", "STORAGE", "WORKERS")
+
+
+def parse_request(request: object) -> tuple[MazeConfig, int]:
+    """Validate a decoded request.
+
+    A request is a JSON object with a ``config`` object holding
+    configuration keys, validated by the same rules as a configuration
+    file, and an optional integer ``seed`` (default: the SEED key, or a
+    random seed).
+
+    Args:
+        request: Decoded JSON value.
+
+    Returns:
+        Maze config and seed.
+
+    Raises:
+        ParsingError: If the request or its config is invalid.
+    """
+    if not isinstance(request, dict):
+        raise ParsingError("A request must be a JSON object.")
+    values = request.get("config")
+    if not isinstance(values, dict):
+        raise ParsingError("A request must have a 'config' object.")
+    config = parse_config_mapping(values)
+    check_config_mandatory(config, REQUEST_KEYS)
+    maze_config: MazeConfig = {
+        key: value for key, value in config.items()
+        if value is not None and key not in _IGNORED_KEYS
+    }
+    check_pattern_overlap(maze_config)
+    seed = request.get("seed", config.get("SEED"))
+    if seed is None:
+        seed = random.randrange(2**32)
+    if not isinstance(seed, int) or isinstance(seed, bool):
+        raise ParsingError("The request 'seed' must be an integer.")
+    return maze_config, seed
+
+
+def solve_request(config: MazeConfig, seed: int) -> dict[str, Any]:
+    """Generate and solve one maze; runs in a worker process.
+
+    Args:
+        config: Validated maze config.
+        seed: Seed of the maze.
+
+    Returns:
+        Response fields: seed, hexadecimal rows and shortest path.
+    """
+    entry = config["ENTRY"]
+    exit_pos = config["EXIT"]
+    assert isinstance(entry, tuple)
+    assert isinstance(exit_pos, tuple)
+    maze = generate_maze(config, SplitMixRandom(seed))
+    try:
+        return {
+            "seed": seed,
+            "rows": list(iter_hex_rows(maze)),
+            "path": a_star(entry, exit_pos, maze),
+        }
+    finally:
+        maze.close()
+
+
+def serve_stdio(
+        requests: TextIO,
+        responses: TextIO,
+        jobs: int = 1,
+        max_pending: int | None = None
+) -> None:
+    """Answer JSON-lines maze requests until the input ends.
+
+    Each input line is one request (see ``parse_request``) with an
+    optional ``id`` of any JSON type. Requests are validated as they are
+    read and solved concurrently by ``jobs`` worker processes; responses
+    are written one JSON object per line, as soon as they are ready, so
+    they may come out of order and carry the request ``id``. A response
+    holds either the ``solve_request`` fields or an ``error`` message.
+    Reading pauses while ``max_pending`` requests (default ``2 * jobs``)
+    are being solved, so a fast producer cannot queue unbounded work.
+    The small-maze pattern warning is logged once per session.
+
+    Args:
+        requests: Stream the requests are read from.
+        responses: Stream the responses are written to.
+        jobs: Number of worker processes.
+        max_pending: Maximum number of requests being solved at once.
+    """
+    write_lock = threading.Lock()
+    slots = threading.BoundedSemaphore(max_pending or 2 * jobs)
+    pattern_warned = False
+
+    def respond(response: dict[str, Any]) -> None:
+        line = json.dumps(response, separators=(",", ":"))
+        with write_lock:
+            responses.write(line + "\n")
+            responses.flush()
+
+    def finish(request_id: object, future: Future[dict[str, Any]]) -> None:
+        try:
+            respond({"id": request_id, **future.result()})
+        except Exception as e:
+            respond({"id": request_id, "error": str(e)})
+        finally:
+            slots.release()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for line in requests:
+            if not line.strip():
+                continue
+            request_id = None
+            try:
+                request = json.loads(line)
+                if isinstance(request, dict):
+                    request_id = request.get("id")
+                config, seed = parse_request(request)
+            except (ParsingError, ValueError) as e:
+                respond({"id": request_id, "error": str(e)})
+                continue
+            if not pattern_warned:
+                pattern_warned = warn_pattern_skipped([config])
+            slots.acquire()
+            future = executor.submit(solve_request, config, seed)
+            future.add_done_callback(partial(finish, request_id))
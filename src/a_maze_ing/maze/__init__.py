@@ -1,5 +1,24 @@
 """Maze post-processing helpers."""
 
+from src.a_maze_ing.maze.batch import (
+    BatchResult,
+    SolveTask,
+    generate_many,
+    generate_maze,
+    solve_many,
+    write_batch
+)
 from src.a_maze_ing.maze.flaw import flaw_maze
+from src.a_maze_ing.maze.origin_shift import OriginShift, WallChange
 
-__all__ = ["flaw_maze"]
+__all__ = [
+    "BatchResult",
+    "flaw_maze",
+    "generate_many",
+    "generate_maze",
+    "OriginShift",
+    "solve_many",
+    "SolveTask",
+    "WallChange",
+    "write_batch"
+]
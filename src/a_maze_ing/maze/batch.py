@@ -0,0 +1,262 @@
+"""Batch maze generation and solving across thread and process pools."""
+
+import json
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from random import Random
+from typing import NamedTuple, TypeVar
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.seeding import derive_seed
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.grid_utils import warn_pattern_skipped
+from src.a_maze_ing.algorithms.registry import get_generator
+from src.a_maze_ing.algorithms.tiled import generate_tiled
+from src.a_maze_ing.io.output import write_output_file
+from src.a_maze_ing.maze.flaw import flaw_maze
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# A solving job: (maze, entry, exit).
+SolveTask = tuple[MazeGrid, tuple[int, int], tuple[int, int]]
+
+# Name of the summary written next to the output files of a batch.
+MANIFEST_NAME = "manifest.json"
+
+
+class BatchResult(NamedTuple):
+    """Output file written for one seed of a batch.
+
+    Attributes:
+        seed: Seed of the maze.
+        file: Output file name, relative to the batch directory.
+        path_length: Number of steps of the shortest path.
+    """
+
+    seed: int
+    file: str
+    path_length: int
+
+
+def generate_maze(config: MazeConfig, rng: Random) -> MazeGrid:
+    """Generate the maze described by a validated config.
+
+    Uses the tiled generator when TILE_SIZE is set and the ALGORITHM
+    generator otherwise, then flaws the maze when PERFECT is False.
+
+    Args:
+        config: Validated configuration dictionary.
+        rng: Random number generator.
+
+    Returns:
+        Generated maze grid.
+    """
+    if "TILE_SIZE" in config:
+        grid = generate_tiled(config, rng=rng)
+    else:
+        grid = get_generator(config.get("ALGORITHM"))(config, rng=rng)
+    if not config.get("PERFECT", True):
+        flaw_maze(grid, rng=rng)
+    return grid
+
+
+def _run_all(
+        function: Callable[[_T], _R],
+        items: Iterable[_T],
+        workers: int
+) -> list[_R]:
+    """Apply a function to every item, in a thread pool when workers > 1.
+
+    Args:
+        function: Function to apply; must not touch shared state.
+        items: Function arguments.
+        workers: Number of worker threads.
+
+    Returns:
+        Results, in item order.
+    """
+    if workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
+
+def _generate(seed: int, job: tuple[int, MazeConfig]) -> MazeGrid:
+    """Generate one maze of a batch; runs in a worker thread.
+
+    Args:
+        seed: Batch seed.
+        job: Position of the maze in the batch and its config.
+
+    Returns:
+        Generated maze grid.
+    """
+    number, config = job
+    return generate_maze(
+        config, SplitMixRandom(derive_seed(seed, "maze", number))
+    )
+
+
+def _solve(task: SolveTask) -> str:
+    """Solve one maze of a batch; runs in a worker thread.
+
+    Args:
+        task: Maze, entry and exit.
+
+    Returns:
+        Path string, empty if there is no path.
+    """
+    grid, entry, exit_pos = task
+    return a_star(entry, exit_pos, grid)
+
+
+def generate_many(
+        configs: Iterable[MazeConfig],
+        seed: int,
+        workers: int = 1
+) -> list[MazeGrid]:
+    """Generate a batch of mazes in a thread pool.
+
+    Maze number i is generated by ``generate_maze`` from its own random
+    stream, derived from seed and i, so the mazes only depend on seed and
+    their configs, not on the number of workers or on scheduling. Threads
+    run in parallel on free-threaded Python builds; elsewhere the GIL
+    serializes them. The small-maze pattern warning is logged at most
+    once per batch.
+
+    Configs must not share an ``mmap:PATH`` STORAGE file.
+
+    Args:
+        configs: Configuration dictionaries with WIDTH, HEIGHT and ENTRY
+            keys.
+        seed: Batch seed.
+        workers: Number of worker threads.
+
+    Returns:
+        Generated maze grids, in config order.
+    """
+    configs = list(configs)
+    warn_pattern_skipped(configs)
+    return _run_all(partial(_generate, seed), enumerate(configs), workers)
+
+
+def solve_many(
+        tasks: Iterable[SolveTask],
+        workers: int = 1
+) -> list[str]:
+    """Find the shortest path of a batch of mazes in a thread pool.
+
+    The mazes are only read, so the same grid may appear in several tasks.
+
+    Args:
+        tasks: (maze, entry, exit) triples, coordinates as (x, y).
+        workers: Number of worker threads.
+
+    Returns:
+        Path strings composed of N/E/S/W steps, in task order; empty when
+        a maze has no path.
+    """
+    return _run_all(_solve, tasks, workers)
+
+
+def batch_file_name(output_file: str, seed: int) -> str:
+    """Return the output file name of one seed of a batch.
+
+    Args:
+        output_file: OUTPUT_FILE config value, e.g. "maze.txt".
+        seed: Seed of the maze.
+
+    Returns:
+        File name with the seed appended to the stem, e.g. "maze_7.txt".
+    """
+    name = Path(output_file)
+    return f"{name.stem}_{seed}{name.suffix}"
+
+
+def _write_seed(config: MazeConfig, out_dir: str, seed: int) -> BatchResult:
+    """Generate, solve and write the maze of one seed; runs in a worker.
+
+    Args:
+        config: Validated configuration dictionary.
+        out_dir: Directory the output file is written to.
+        seed: Seed of the maze.
+
+    Returns:
+        Summary of the written file.
+    """
+    output_file = config["OUTPUT_FILE"]
+    entry = config["ENTRY"]
+    exit_pos = config["EXIT"]
+    assert isinstance(output_file, str)
+    assert isinstance(entry, tuple)
+    assert isinstance(exit_pos, tuple)
+    name = batch_file_name(output_file, seed)
+    maze = generate_maze(config, SplitMixRandom(seed))
+    try:
+        path = a_star(entry, exit_pos, maze)
+        write_output_file(str(Path(out_dir) / name), maze, entry, exit_pos,
+                          path)
+    finally:
+        maze.close()
+    return BatchResult(seed, name, len(path))
+
+
+def write_batch(
+        config: MazeConfig,
+        seeds: Sequence[int],
+        out_dir: str,
+        jobs: int = 1
+) -> list[BatchResult]:
+    """Write one output file per seed, fanned out to a process pool.
+
+    The maze of each seed is the one a single run with that SEED would
+    write. Seeds are sent to the workers in chunks, so the per-maze
+    overhead is a function call rather than a process start, and only the
+    small summaries travel back. A MANIFEST_NAME file listing every output
+    file is written once all of them are done. The small-maze pattern
+    warning is logged once, not per seed.
+
+    Args:
+        config: Validated configuration dictionary; STORAGE and WORKERS
+            are ignored, each maze is generated in memory by one worker.
+        seeds: Seeds to generate.
+        out_dir: Directory the files are written to; created if needed.
+        jobs: Number of worker processes.
+
+    Returns:
+        Summary of each written file, in seed order.
+    """
+    start = time.perf_counter()
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    config = {
+        key: value for key, value in config.items()
+        if key not in ("STORAGE", "WORKERS")
+    }
+    warn_pattern_skipped([config])
+    write = partial(_write_seed, config, out_dir)
+    if jobs <= 1:
+        results = [write(seed) for seed in seeds]
+    else:
+        chunksize = max(1, min(64, len(seeds) // (jobs * 8)))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(write, seeds, chunksize=chunksize))
+
+    manifest = {
+        "algorithm": config.get("ALGORITHM", "DFS"),
+        "width": config["WIDTH"],
+        "height": config["HEIGHT"],
+        "perfect": config.get("PERFECT", True),
+        "count": len(results),
+        "jobs": jobs,
+        "seconds": round(time.perf_counter() - start, 3),
+        "mazes": [result._asdict() for result in results],
+    }
+    with open(Path(out_dir) / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+        f.write("\n")
+    return results
@@ -1,9 +1,11 @@
 """Post-processing for imperfect mazes."""
 
-from collections.abc import Callable
-from src.a_maze_ing.core.cell import Cell
+from collections.abc import Callable, Sequence
+from src.a_maze_ing.core.cell import EAST, NORTH, SOUTH, WEST, Cell
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ensure_rng
 from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
-from random import choice as random_choice
+from random import Random
 from enum import Enum, auto
 
 
@@ -18,7 +20,7 @@ class CardinalPoint(Enum):
 
 def _get_neighbors(
     cell: Cell,
-    grid: list[list[Cell]]
+    grid: Sequence[Sequence[Cell]]
 ) -> dict[CardinalPoint, Cell]:
     """Return neighboring cells indexed by direction.
 
@@ -47,9 +49,10 @@ def _get_neighbors(
 
 
 def _wall_breakable_toward(
-    grid: list[list[Cell]],
+    grid: Sequence[Sequence[Cell]],
     cell: Cell,
-    direction: CardinalPoint
+    direction: CardinalPoint,
+    pattern: set[tuple[int, int]]
 ) -> bool:
     """Check if a wall can be removed toward a direction.
 
@@ -57,44 +60,45 @@ def _wall_breakable_toward(
         grid: 2D maze grid.
         cell: Cell to consider.
         direction: Direction to test.
+        pattern: Coordinates of the 42 pattern cells.
 
     Returns:
         True if the wall can be removed without breaking constraints.
     """
-    if cell.coordinates in where_is_ft_pattern(grid):
+    if cell.coordinates in pattern:
         return False
     neighbors = _get_neighbors(cell, grid)
     for direction in neighbors:
-        if neighbors[direction].coordinates in where_is_ft_pattern(grid):
+        if neighbors[direction].coordinates in pattern:
             return False
 
     match direction:
         case CardinalPoint.NORTH:
             if CardinalPoint.NORTH not in neighbors:
                 return False
-            if not neighbors[CardinalPoint.NORTH].south:
+            if not neighbors[CardinalPoint.NORTH].walls & SOUTH:
                 return False
         case CardinalPoint.SOUTH:
             if CardinalPoint.SOUTH not in neighbors:
                 return False
-            if not neighbors[CardinalPoint.SOUTH].north:
+            if not neighbors[CardinalPoint.SOUTH].walls & NORTH:
                 return False
         case CardinalPoint.EAST:
             if CardinalPoint.EAST not in neighbors:
                 return False
-            if not neighbors[CardinalPoint.EAST].west:
+            if not neighbors[CardinalPoint.EAST].walls & WEST:
                 return False
         case CardinalPoint.WEST:
             if CardinalPoint.WEST not in neighbors:
                 return False
-            if not neighbors[CardinalPoint.WEST].east:
+            if not neighbors[CardinalPoint.WEST].walls & EAST:
                 return False
 
     return True
 
 
 def _remove_walls_toward(
-    grid: list[list[Cell]],
+    grid: Sequence[Sequence[Cell]],
     cell: Cell,
     direction: CardinalPoint
 ) -> None:
@@ -112,40 +116,45 @@ def _remove_walls_toward(
     match direction:
         case CardinalPoint.NORTH:
             if y > 0:
-                cell.north = False
-                grid[y - 1][x].south = False
+                cell.walls &= ~NORTH
+                grid[y - 1][x].walls &= ~SOUTH
         case CardinalPoint.SOUTH:
             if y < height - 1:
-                cell.south = False
-                grid[y + 1][x].north = False
+                cell.walls &= ~SOUTH
+                grid[y + 1][x].walls &= ~NORTH
         case CardinalPoint.EAST:
             if x < width - 1:
-                cell.east = False
-                grid[y][x + 1].west = False
+                cell.walls &= ~EAST
+                grid[y][x + 1].walls &= ~WEST
         case CardinalPoint.WEST:
             if x > 0:
-                cell.west = False
-                grid[y][x - 1].east = False
+                cell.walls &= ~WEST
+                grid[y][x - 1].walls &= ~EAST
 
 
 def flaw_maze(
-    maze: list[list[Cell]],
-    on_step: Callable[[list[list[Cell]]], None] | None = None
+    maze: MazeGrid,
+    on_step: Callable[[MazeGrid], None] | None = None,
+    rng: Random | None = None
 ) -> None:
     """Introduce flaws by breaking additional walls.
 
     Args:
         maze: 2D maze grid to modify in-place.
         on_step: Optional callback called after each break.
+        rng: Optional random number generator; by default one is
+            seeded from the global random module.
     """
+    rng = ensure_rng(rng)
+    pattern = set(where_is_ft_pattern(maze))
     walls_to_break: int = len(maze) * len(maze[0]) // 7
     iterations_remaining: int = 1500
 
     while walls_to_break > 0 and iterations_remaining > 0:
-        rd_cell: Cell = random_choice(random_choice(maze))
-        rd_direction = random_choice(list(CardinalPoint))
+        rd_cell: Cell = rng.choice(rng.choice(maze))
+        rd_direction = rng.choice(list(CardinalPoint))
 
-        if _wall_breakable_toward(maze, rd_cell, rd_direction):
+        if _wall_breakable_toward(maze, rd_cell, rd_direction, pattern):
             _remove_walls_toward(maze, rd_cell, rd_direction)
             walls_to_break -= 1
             if on_step:
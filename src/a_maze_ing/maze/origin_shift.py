@@ -0,0 +1,123 @@
+"""Continuous mutation of perfect mazes with the origin-shift algorithm."""
+
+from collections import deque
+from random import Random
+from src.a_maze_ing.core.cell import OPPOSITE_WALLS
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import ChoiceBuffer, ensure_rng
+from src.a_maze_ing.algorithms.ft_pattern import ft_pattern_cells
+
+WallChange = tuple[int, int]
+
+
+class OriginShift:
+    """Mutate a perfect maze one O(1) step at a time.
+
+    A perfect maze is a spanning tree: rooting it at an origin cell gives
+    every other cell a parent direction. Each step moves the origin to a
+    random neighbor: the old origin now points to it, and the new origin
+    drops its own parent link. The passage towards the new origin opens
+    and the one to its old parent closes, so the maze stays perfect.
+    Cells of the 42 pattern are never entered.
+    """
+
+    def __init__(
+        self,
+        grid: MazeGrid,
+        origin: int | None = None,
+        rng: Random | None = None
+    ) -> None:
+        """Build the parent-direction field of a perfect maze.
+
+        Args:
+            grid: Perfect maze grid, mutated in place.
+            origin: Optional flat index of the initial origin; defaults to
+                the first cell outside the 42 pattern.
+            rng: Optional random number generator; by default one is
+                seeded from the global random module.
+
+        Raises:
+            ValueError: If the grid is not a perfect maze, or the origin
+                is a pattern cell.
+        """
+        self.grid = grid
+        self.choices = ChoiceBuffer(ensure_rng(rng))
+        self.blocked = bytearray(grid.size)
+        for x, y in ft_pattern_cells(grid.width, grid.height):
+            self.blocked[grid.to_index(x, y)] = 1
+        if origin is None:
+            origin = self.blocked.find(0)
+        if origin < 0 or self.blocked[origin]:
+            raise ValueError("The origin must be a free cell.")
+        self.origin = origin
+        # Wall bit towards the parent of each cell, 0 for the origin.
+        self.parents = bytearray(grid.size)
+        self._build_parents()
+
+    def _build_parents(self) -> None:
+        """Orient every passage towards the origin.
+
+        Raises:
+            ValueError: If the open walls contain a cycle or leave a free
+                cell unreachable.
+        """
+        grid = self.grid
+        parents = self.parents
+        seen = bytearray(self.blocked)
+        seen[self.origin] = 1
+        queue = deque([self.origin])
+        reached = 1
+        while queue:
+            current = queue.popleft()
+            for wall, neighbor in grid.open_neighbors(current):
+                if wall == parents[current]:
+                    continue
+                if seen[neighbor]:
+                    raise ValueError("The maze must be perfect.")
+                seen[neighbor] = 1
+                parents[neighbor] = OPPOSITE_WALLS[wall]
+                queue.append(neighbor)
+                reached += 1
+        if reached != grid.size - sum(self.blocked):
+            raise ValueError("The maze must be perfect.")
+
+    def step(self) -> list[WallChange]:
+        """Move the origin to a random neighbor.
+
+        Returns:
+            Walls toggled by the step, as (cell, wall) pairs; empty when the
+            origin moved along an existing passage.
+        """
+        grid = self.grid
+        origin = self.origin
+        candidates = [
+            (wall, neighbor) for wall, neighbor in grid.neighbors(origin)
+            if not self.blocked[neighbor]
+        ]
+        if not candidates:
+            return []
+        wall, neighbor = self.choices.choice(candidates)
+        self.parents[origin] = wall
+        old_parent = self.parents[neighbor]
+        self.parents[neighbor] = 0
+        self.origin = neighbor
+        if old_parent == OPPOSITE_WALLS[wall]:
+            return []
+        grid.open_wall(origin, wall)
+        grid.close_wall(neighbor, old_parent)
+        return [(origin, wall), (neighbor, old_parent)]
+
+    def shift(self, steps: int) -> list[WallChange]:
+        """Apply several origin-shift steps.
+
+        Args:
+            steps: Number of steps to apply.
+
+        Returns:
+            Walls toggled by the steps, in order; a wall toggled twice
+            appears twice.
+        """
+        changes = []
+        for _ in range(steps):
+            changes.extend(self.step())
+        return changes
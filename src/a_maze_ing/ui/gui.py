@@ -1,21 +1,22 @@
 """Curses-based interactive maze viewer."""
 
 import curses
-import random
 import time
 from curses import wrapper, init_pair, init_color, error
 from curses import start_color, color_pair, use_default_colors, curs_set
 from curses import can_change_color
 from curses import COLOR_BLACK, COLOR_BLUE, COLOR_CYAN, COLOR_GREEN
 from curses import COLOR_MAGENTA, COLOR_RED, COLOR_WHITE, COLOR_YELLOW
-from src.a_maze_ing.core.cell import Cell
-from src.a_maze_ing.algorithms.dfs import generate_dfs
-from src.a_maze_ing.algorithms.kruskal import generate_kruskal
-from src.a_maze_ing.algorithms.wilson import generate_wilson
+from src.a_maze_ing.core.cell import EAST, SOUTH, Cell
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.algorithms.registry import get_generator
+from src.a_maze_ing.algorithms.tiled import generate_tiled
 from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
-from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.a_star import SearchEvent, SearchView, a_star
 from src.a_maze_ing.io.output import write_output_file
 from src.a_maze_ing.maze.flaw import flaw_maze
+from src.a_maze_ing.maze.origin_shift import OriginShift, WallChange
 from typing import Callable
 from src.a_maze_ing.core.types import MazeConfig
 
@@ -26,7 +27,7 @@ class GUI:
     def __init__(
         self,
         config: MazeConfig,
-        maze: list[list[Cell]] | None = None,
+        maze: MazeGrid | None = None,
         seed: int | None = None
     ) -> None:
         """Initialize the UI and start the curses loop.
@@ -39,9 +40,14 @@ class GUI:
         self.config = config
         self.initial_maze = maze
         self.initial_seed = seed
+        self.rng = SplitMixRandom(seed)
         self.animations_enabled = bool(self.config.get("ANIMATIONS", True))
         self.animation_delay = 0.01
         self.path_animation_delay = 0.01
+        self.mutation_frame = 1 / 30
+        mutation_steps = self.config.get("MUTATION_STEPS", 4)
+        assert isinstance(mutation_steps, int)
+        self.mutation_steps = mutation_steps
         wrapper(self.__main)
 
     def __main(self, stdscr: curses.window) -> None:
@@ -155,6 +161,15 @@ class GUI:
                         entry,
                         exit_pos
                     )
+            elif key in (ord('m'), ord('M')):
+                self.__run_mutation(stdscr, maze, entry, exit_pos)
+                path, path_coords, path_edges = self.__compute_path(
+                    stdscr,
+                    maze,
+                    entry,
+                    exit_pos
+                )
+                self.__write_output_file(maze, entry, exit_pos, path)
             elif key in (ord('w'), ord('W')):
                 self.wall_color_index = (
                     self.wall_color_index + 1
@@ -215,7 +230,7 @@ class GUI:
 
     def __write_output_file(
             self,
-            maze: list[list[Cell]],
+            maze: MazeGrid,
             entry: tuple[int, int],
             exit_pos: tuple[int, int],
             path: str | None = None
@@ -242,7 +257,7 @@ class GUI:
             entry: tuple[int, int],
             exit_pos: tuple[int, int],
             seed: int | None = None
-    ) -> list[list[Cell]]:
+    ) -> MazeGrid:
         """Generate a maze, optionally with animation.
 
         Args:
@@ -255,20 +270,20 @@ class GUI:
             Generated maze grid.
         """
         if seed is not None:
-            random.seed(seed)
+            self.rng = SplitMixRandom(seed)
         if self.animations_enabled:
             return self.__generate_maze_with_animation(stdscr, entry, exit_pos)
         generator = self.__select_generator()
-        maze: list[list[Cell]] = generator(self.config)
+        maze: MazeGrid = generator(self.config, rng=self.rng)
         self.ft_pattern = set(where_is_ft_pattern(maze))
         if not bool(self.config.get("PERFECT", True)):
-            flaw_maze(maze)
+            flaw_maze(maze, rng=self.rng)
         return maze
 
     def __compute_path(
             self,
             stdscr: curses.window,
-            maze: list[list[Cell]],
+            maze: MazeGrid,
             entry: tuple[int, int],
             exit_pos: tuple[int, int]
     ) -> tuple[str, set[tuple[int, int]], dict[tuple[int, int], set[str]]]:
@@ -294,7 +309,7 @@ class GUI:
             stdscr: curses.window,
             entry: tuple[int, int],
             exit_pos: tuple[int, int]
-    ) -> list[list[Cell]]:
+    ) -> MazeGrid:
         """Generate a maze while animating carving steps.
 
         Args:
@@ -308,7 +323,7 @@ class GUI:
         self.ft_pattern = set()
         generator = self.__select_generator()
 
-        def on_step(grid: list[list[Cell]]) -> None:
+        def on_step(grid: MazeGrid) -> None:
             """Animate maze generation steps.
 
             Args:
@@ -327,25 +342,158 @@ class GUI:
             )
             time.sleep(self.animation_delay)
 
-        maze: list[list[Cell]] = generator(self.config, on_step=on_step)
+        maze: MazeGrid = generator(
+            self.config,
+            on_step=on_step,
+            rng=self.rng
+        )
         if not bool(self.config.get("PERFECT", True)):
-            flaw_maze(maze, on_step=on_step)
+            flaw_maze(maze, on_step=on_step, rng=self.rng)
         return maze
 
+    def __run_mutation(
+            self,
+            stdscr: curses.window,
+            maze: MazeGrid,
+            entry: tuple[int, int],
+            exit_pos: tuple[int, int]
+    ) -> None:
+        """Mutate the maze continuously until a key is pressed.
+
+        Each frame applies MUTATION_STEPS origin-shift steps, redraws the
+        changed walls (or the whole maze when the path is shown) and
+        sleeps for the rest of the frame budget. Imperfect mazes are left
+        untouched.
+
+        Args:
+            stdscr: Curses standard screen.
+            maze: Perfect maze grid, mutated in place.
+            entry: Entry coordinates.
+            exit_pos: Exit coordinates.
+        """
+        try:
+            engine = OriginShift(maze, maze.to_index(*entry), self.rng)
+        except ValueError:
+            return
+        stdscr.nodelay(True)
+        try:
+            while stdscr.getch() == -1:
+                frame_start = time.monotonic()
+                changes = engine.shift(self.mutation_steps)
+                if self.show_path:
+                    path = a_star(entry, exit_pos, maze)
+                    path_coords, path_edges = self.__path_to_coords_and_edges(
+                        path,
+                        entry
+                    )
+                    self.__draw_maze(
+                        stdscr,
+                        maze,
+                        entry,
+                        exit_pos,
+                        path_coords,
+                        path_edges,
+                        True
+                    )
+                else:
+                    self.__draw_changes(
+                        stdscr,
+                        maze,
+                        entry,
+                        exit_pos,
+                        changes
+                    )
+                elapsed = time.monotonic() - frame_start
+                time.sleep(max(0.0, self.mutation_frame - elapsed))
+        finally:
+            stdscr.nodelay(False)
+
+    def __draw_changes(
+            self,
+            stdscr: curses.window,
+            maze: MazeGrid,
+            entry: tuple[int, int],
+            exit_pos: tuple[int, int],
+            changes: list[WallChange]
+    ) -> None:
+        """Redraw only the cells whose walls changed.
+
+        A cell draws its own north and west walls, so a toggled south or
+        east wall is redrawn through the neighbor behind it.
+
+        Args:
+            stdscr: Curses standard screen.
+            maze: Maze grid.
+            entry: Entry coordinates.
+            exit_pos: Exit coordinates.
+            changes: Toggled walls as (cell, wall) pairs.
+        """
+        rows, cols = maze.height, maze.width
+        cells = set()
+        for index, wall in changes:
+            x, y = maze.to_coordinates(index)
+            if wall == SOUTH and y < rows - 1:
+                y += 1
+            elif wall == EAST and x < cols - 1:
+                x += 1
+            cells.add((x, y))
+        self.__draw_cells(stdscr, maze, entry, exit_pos, cells)
+
+    def __draw_cells(
+            self,
+            stdscr: curses.window,
+            maze: MazeGrid,
+            entry: tuple[int, int],
+            exit_pos: tuple[int, int],
+            cells: set[tuple[int, int]],
+            path_coords: set[tuple[int, int]] | None = None,
+            path_edges: dict[tuple[int, int], set[str]] | None = None,
+            search_frontier: set[tuple[int, int]] | None = None,
+            search_current: tuple[int, int] | None = None
+    ) -> None:
+        """Redraw a few cells over the current screen.
+
+        Args:
+            stdscr: Curses standard screen.
+            maze: Maze grid.
+            entry: Entry coordinates.
+            exit_pos: Exit coordinates.
+            cells: Coordinates of the cells to redraw.
+            path_coords: Optional coordinates belonging to the path.
+            path_edges: Optional direction edges belonging to the path.
+            search_frontier: Optional set of frontier nodes.
+            search_current: Optional current search node.
+        """
+        rows, cols = maze.height, maze.width
+        for x, y in cells:
+            self.__draw_cell_structured(
+                stdscr,
+                x,
+                y,
+                maze[y][x],
+                rows,
+                cols,
+                entry,
+                exit_pos,
+                path_coords or set(),
+                path_edges or {},
+                search_frontier or set(),
+                search_current
+            )
+        stdscr.noutrefresh()
+        curses.doupdate()
+
     def __select_generator(
         self,
-    ) -> Callable[..., list[list[Cell]]]:
+    ) -> Callable[..., MazeGrid]:
         """Select the generator implementation from config.
 
         Returns:
             Maze generator callable.
         """
-        algorithm = self.config.get("ALGORITHM", "DFS")
-        if isinstance(algorithm, str) and algorithm.upper() == "KRUSKAL":
-            return generate_kruskal
-        if isinstance(algorithm, str) and algorithm.upper() == "WILSON":
-            return generate_wilson
-        return generate_dfs
+        if "TILE_SIZE" in self.config:
+            return generate_tiled
+        return get_generator(self.config.get("ALGORITHM", "DFS"))
 
     def __path_to_coords_and_edges(
             self,
@@ -381,15 +529,41 @@ class GUI:
             edges.setdefault(end, set()).add(opposites[step])
         return coords, edges
 
+    def __nodes_to_coords_and_edges(
+            self,
+            nodes: list[tuple[int, int]]
+    ) -> tuple[set[tuple[int, int]], dict[tuple[int, int], set[str]]]:
+        """Convert a list of adjacent nodes into coordinates and edges.
+
+        Args:
+            nodes: Path nodes from the entry, entry included.
+
+        Returns:
+            Tuple of (coords, edges) for rendering.
+        """
+        steps = {(0, -1): "N", (0, 1): "S", (-1, 0): "W", (1, 0): "E"}
+        opposites = {"N": "S", "S": "N", "E": "W", "W": "E"}
+        coords = set(nodes[1:])
+        edges: dict[tuple[int, int], set[str]] = {}
+        for start, end in zip(nodes, nodes[1:]):
+            step = steps[(end[0] - start[0], end[1] - start[1])]
+            edges.setdefault(start, set()).add(step)
+            edges.setdefault(end, set()).add(opposites[step])
+        return coords, edges
+
     def __animate_search(
             self,
             stdscr: curses.window,
-            maze: list[list[Cell]],
+            maze: MazeGrid,
             entry: tuple[int, int],
             exit_pos: tuple[int, int]
     ) -> tuple[str, set[tuple[int, int]], dict[tuple[int, int], set[str]]]:
         """Animate A* search and return the final path data.
 
+        The maze is drawn once; each step then moves the shown path to
+        the expanded node and redraws only the cells whose path, frontier
+        or current marker changed.
+
         Args:
             stdscr: Curses standard screen.
             maze: 2D maze grid.
@@ -399,34 +573,50 @@ class GUI:
         Returns:
             Tuple of (path, path_coords, path_edges).
         """
-        def on_step(
-                current: tuple[int, int],
-                open_set: set[tuple[int, int]],
-                closed_set: set[tuple[int, int]],
-                path: str
-        ) -> None:
-            """Animate A* search steps.
+        view = SearchView()
+        path_coords: set[tuple[int, int]] = set()
+        path_edges: dict[tuple[int, int], set[str]] = {}
+        self.__draw_maze(
+            stdscr, maze, entry, exit_pos, set(), {}, True
+        )
+
+        def on_step(events: list[SearchEvent]) -> None:
+            """Apply A* search deltas and animate the step.
 
             Args:
-                current: Current node in the search.
-                open_set: Frontier nodes.
-                closed_set: Explored nodes.
-                path: Current best path string.
+                events: Events produced by one search expansion.
             """
-            path_coords, path_edges = self.__path_to_coords_and_edges(
-                path,
-                entry
-            )
-            self.__draw_maze(
+            previous = view.current
+            view.apply(events)
+            left, joined = view.follow_current()
+            touched = {position for _, position, _ in events}
+            if previous is not None:
+                touched.add(previous)
+            touched.update(left)
+            for node in left:
+                path_coords.discard(node)
+                path_edges.pop(node, None)
+            # Only the nodes from the one before the branch point on
+            # can gain or lose path edges.
+            path = view.path
+            anchor = len(path) - len(joined) - 1
+            segment = path[max(anchor - 1, 0):]
+            _, segment_edges = self.__nodes_to_coords_and_edges(segment)
+            for node in path[max(anchor, 0):]:
+                path_edges[node] = segment_edges.get(node, set())
+                touched.add(node)
+            path_coords.update(joined)
+            path_coords.discard(entry)
+            self.__draw_cells(
                 stdscr,
                 maze,
                 entry,
                 exit_pos,
+                touched,
                 path_coords,
                 path_edges,
-                True,
-                search_frontier=open_set,
-                search_current=current
+                view.open_set,
+                view.current
             )
             time.sleep(self.path_animation_delay)
 
@@ -437,7 +627,7 @@ class GUI:
     def __animate_path(
             self,
             stdscr: curses.window,
-            maze: list[list[Cell]],
+            maze: MazeGrid,
             entry: tuple[int, int],
             exit_pos: tuple[int, int],
             path: str
@@ -536,8 +726,8 @@ class GUI:
         """
         help_y = rows * 2 + 2
         help_text = (
-            "r: new maze  p: toggle search/path  w: wall color  "
-            "f: 42 color  q: quit"
+            "r: new maze  p: toggle search/path  m: mutate  "
+            "w: wall color  f: 42 color  q: quit"
         )
         self.__safe_add(
             stdscr,
@@ -550,7 +740,7 @@ class GUI:
     def __draw_maze(
             self,
             stdscr: curses.window,
-            maze: list[list[Cell]],
+            maze: MazeGrid,
             entry: tuple[int, int],
             exit_pos: tuple[int, int],
             path_coords: set[tuple[int, int]],
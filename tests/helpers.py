@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+
 
 def write_config(
     tmp_path: Path,
@@ -202,6 +208,32 @@ def path_is_valid(
     return (x, y) == exit_pos
 
 
+def wall_rows(grid: MazeGrid) -> list[list[int]]:
+    return [
+        [grid.walls[grid.to_index(x, y)] for x in range(grid.width)]
+        for y in range(grid.height)
+    ]
+
+
+def assert_shortest_paths(
+    grid: MazeGrid,
+    find_path: Callable[[tuple[int, int], tuple[int, int]], str],
+    seed: int,
+    queries: int = 100,
+    distance: Callable[[tuple[int, int], tuple[int, int]], int] | None = None,
+) -> None:
+    rows = wall_rows(grid)
+    rng = SplitMixRandom(seed)
+    for _ in range(queries):
+        entry = (rng.randrange(grid.width), rng.randrange(grid.height))
+        exit_pos = (rng.randrange(grid.width), rng.randrange(grid.height))
+        path = find_path(entry, exit_pos)
+        assert len(path) == len(a_star(entry, exit_pos, grid))
+        assert not path or path_is_valid(rows, entry, exit_pos, path)
+        if distance is not None and path:
+            assert distance(entry, exit_pos) == len(path)
+
+
 def has_fully_open_3x3(
         grid: list[list[int]],
         blocked: set[tuple[int, int]]
@@ -232,3 +264,15 @@ def has_fully_open_3x3(
             if fully_open:
                 return True
     return False
+
+
+def assert_perfect(grid: MazeGrid) -> set[tuple[int, int]]:
+    hex_grid = [[int(str(cell), 16) for cell in row] for row in grid]
+    pattern_positions = set(where_is_ft_pattern(grid))
+    for x, y in pattern_positions:
+        assert hex_grid[y][x] == 0xF
+    total_nodes = grid.width * grid.height - len(pattern_positions)
+    reachable = reachable_nodes(hex_grid, (0, 0), pattern_positions)
+    assert len(reachable) == total_nodes
+    assert count_open_edges(hex_grid, pattern_positions) == total_nodes - 1
+    return pattern_positions
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.maze.batch import generate_many, solve_many
+
+
+def _configs() -> list[MazeConfig]:
+    return [
+        {
+            "WIDTH": 12 + number,
+            "HEIGHT": 9,
+            "ENTRY": (0, 0),
+            "ALGORITHM": algorithm,
+            "PERFECT": number % 2 == 0,
+        }
+        for number, algorithm in enumerate(
+            ["DFS", "KRUSKAL", "WILSON", "PRIM", "ELLER", "DIVISION"] * 2
+        )
+    ]
+
+
+def test_batch_does_not_depend_on_worker_count() -> None:
+    configs = _configs()
+    serial = [bytes(grid.walls) for grid in generate_many(configs, 4)]
+    threaded = [
+        bytes(grid.walls)
+        for grid in generate_many(configs, 4, workers=4)
+    ]
+    assert serial == threaded
+    assert len(set(serial)) == len(serial)
+    assert serial != [
+        bytes(grid.walls) for grid in generate_many(configs, 5)
+    ]
+
+
+def test_solve_many_matches_a_star() -> None:
+    mazes = generate_many(_configs(), 1, workers=3)
+    tasks = [
+        (grid, (0, 0), (grid.width - 1, grid.height - 1)) for grid in mazes
+    ]
+    paths = solve_many(tasks, workers=3)
+    assert paths == [a_star(entry, exit_pos, grid)
+                     for grid, entry, exit_pos in tasks]
+    assert all(paths)
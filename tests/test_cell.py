@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from src.a_maze_ing.core.cell import EAST, NORTH, WEST, Cell, CellState
+
+
+def test_cell_walls_are_a_bitmask() -> None:
+    cell = Cell(CellState.UNVISITED, True, False, False, True, (2, 3))
+    assert cell.walls == NORTH | WEST
+    assert cell.to_hex() == str(cell) == "9"
+    assert cell.has_wall("n") and not cell.has_wall("E")
+
+    cell.set_wall("E", True)
+    cell.north = False
+    assert cell.walls == EAST | WEST
+    assert cell.east and not cell.north
+    assert str(cell) == "A"
+
+
+def test_cell_has_no_instance_dict() -> None:
+    cell = Cell(CellState.VISITED, True, True, True, True, (0, 0))
+    assert not hasattr(cell, "__dict__")
+    with pytest.raises(AttributeError):
+        cell.extra = 1  # type: ignore[attr-defined]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
 from a_maze_ing import main
 from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
-from tests.helpers import write_config
+from tests.helpers import parse_output_file, write_config
 
 
 def test_cli_no_args_returns_error(
@@ -53,3 +54,38 @@ def test_entry_overlaps_pattern_is_rejected(
 
     monkeypatch.setattr("sys.argv", ["a_maze_ing.py", str(config_path)])
     assert main() == 1
+
+
+def test_batch_mode_writes_one_file_per_seed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    single_path = tmp_path / "maze.txt"
+    config_path = write_config(
+        tmp_path,
+        width=15,
+        height=10,
+        entry=(0, 0),
+        exit_pos=(14, 9),
+        output_file=single_path,
+        perfect=False,
+        seed=41,
+        algorithm="KRUSKAL",
+    )
+    out_dir = tmp_path / "batch"
+    monkeypatch.setattr("sys.argv", [
+        "a_maze_ing.py", str(config_path), "--count", "4",
+        "--seed-start", "40", "--jobs", "2", "--out-dir", str(out_dir),
+    ])
+    assert main() == 0
+
+    manifest = json.loads((out_dir / "manifest.json").read_text())
+    assert manifest["count"] == 4
+    assert [maze["seed"] for maze in manifest["mazes"]] == [40, 41, 42, 43]
+    for maze in manifest["mazes"]:
+        _, _, _, path = parse_output_file(out_dir / maze["file"])
+        assert len(path) == maze["path_length"]
+
+    monkeypatch.setattr("sys.argv", ["a_maze_ing.py", str(config_path)])
+    assert main() == 0
+    assert (out_dir / "maze_41.txt").read_text() == single_path.read_text()
@@ -4,13 +4,16 @@ import random
 
 import pytest
 
-from src.a_maze_ing.algorithms.dfs import generate_dfs
-from src.a_maze_ing.algorithms.kruskal import generate_kruskal
-from src.a_maze_ing.algorithms.wilson import generate_wilson
+import src.a_maze_ing.algorithms.binary_tree as binary_tree
+import src.a_maze_ing.algorithms.sidewinder as sidewinder
+from src.a_maze_ing.algorithms.growing_tree import _ActiveCells
+from src.a_maze_ing.algorithms.registry import GENERATORS
 from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
+from src.a_maze_ing.core.rng import ChoiceBuffer, SplitMixRandom
 from src.a_maze_ing.core.types import MazeConfig
 from src.a_maze_ing.io.rendering import render_hex
 from tests.helpers import (
+    assert_perfect,
     count_open_edges,
     degree,
     grid_bounds,
@@ -20,7 +23,7 @@ from tests.helpers import (
 )
 
 
-@pytest.mark.parametrize("algorithm", ["DFS", "KRUSKAL", "WILSON"])
+@pytest.mark.parametrize("algorithm", sorted(GENERATORS))
 def test_reproducible_generation(algorithm: str) -> None:
     config: MazeConfig = {
         "WIDTH": 15,
@@ -29,27 +32,17 @@ def test_reproducible_generation(algorithm: str) -> None:
         "EXIT": (14, 12),
     }
     random.seed(4242)
-    if algorithm == "DFS":
-        grid_first = generate_dfs(config)
-    elif algorithm == "KRUSKAL":
-        grid_first = generate_kruskal(config)
-    else:
-        grid_first = generate_wilson(config)
+    grid_first = GENERATORS[algorithm](config)
     first = render_hex(grid_first)
 
     random.seed(4242)
-    if algorithm == "DFS":
-        grid_second = generate_dfs(config)
-    elif algorithm == "KRUSKAL":
-        grid_second = generate_kruskal(config)
-    else:
-        grid_second = generate_wilson(config)
+    grid_second = GENERATORS[algorithm](config)
     second = render_hex(grid_second)
 
     assert first == second
 
 
-@pytest.mark.parametrize("algorithm", ["DFS", "KRUSKAL", "WILSON"])
+@pytest.mark.parametrize("algorithm", sorted(GENERATORS))
 def test_maze_validity_and_structure(algorithm: str) -> None:
     config: MazeConfig = {
         "WIDTH": 19,
@@ -58,12 +51,7 @@ def test_maze_validity_and_structure(algorithm: str) -> None:
         "EXIT": (18, 16),
     }
     random.seed(1337)
-    if algorithm == "DFS":
-        grid = generate_dfs(config)
-    elif algorithm == "KRUSKAL":
-        grid = generate_kruskal(config)
-    else:
-        grid = generate_wilson(config)
+    grid = GENERATORS[algorithm](config)
 
     hex_grid = [[int(str(cell), 16) for cell in row] for row in grid]
     width, height = grid_bounds(hex_grid)
@@ -136,3 +124,87 @@ def test_maze_validity_and_structure(algorithm: str) -> None:
     assert edges == total_nodes - 1
 
     assert not has_fully_open_3x3(hex_grid, pattern_positions)
+
+
+@pytest.mark.parametrize("algorithm", ["BINARY_TREE", "SIDEWINDER"])
+def test_pure_python_fallback_is_perfect(
+    algorithm: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(binary_tree, "_numpy", None)
+    monkeypatch.setattr(sidewinder, "_numpy", None)
+    config: MazeConfig = {
+        "WIDTH": 23,
+        "HEIGHT": 15,
+        "ENTRY": (0, 0),
+        "EXIT": (22, 14),
+    }
+    random.seed(99)
+    assert_perfect(GENERATORS[algorithm](config))
+
+
+def test_dfs_leaves_no_backtrack_bits() -> None:
+    config: MazeConfig = {
+        "WIDTH": 31,
+        "HEIGHT": 21,
+        "ENTRY": (5, 3),
+        "EXIT": (30, 20),
+    }
+    random.seed(7)
+    grid = GENERATORS["DFS"](config)
+    assert max(grid.walls) <= 0xF
+
+
+@pytest.mark.parametrize("mix", ["OLDEST", "RANDOM:1,OLDEST:1"])
+def test_growing_tree_mixes_are_perfect(mix: str) -> None:
+    config: MazeConfig = {
+        "WIDTH": 21,
+        "HEIGHT": 13,
+        "ENTRY": (0, 0),
+        "EXIT": (20, 12),
+        "GROWING_TREE_MIX": mix,
+    }
+    random.seed(11)
+    assert_perfect(GENERATORS["GROWING_TREE"](config))
+
+
+def test_growing_tree_strategies_keep_insertion_order() -> None:
+    active = _ActiveCells(16, ChoiceBuffer(SplitMixRandom(5)))
+    for index in range(8):
+        active.append(index)
+
+    def picked(strategy: str) -> int:
+        return active.cells[active.pick(strategy)]
+
+    active.remove(3)
+    active.remove(5)
+    assert len(active) == 6
+    assert picked("NEWEST") == 7
+    assert picked("OLDEST") == 0
+    assert {picked("RANDOM") for _ in range(200)} == {0, 1, 2, 4, 6, 7}
+
+    active.remove(active.pick("NEWEST"))
+    assert picked("NEWEST") == 6
+    active.remove(active.pick("NEWEST"))
+    assert picked("NEWEST") == 4
+    active.remove(active.pick("OLDEST"))
+    active.remove(active.pick("OLDEST"))
+    assert picked("OLDEST") == 2
+    active.remove(active.pick("OLDEST"))
+    assert picked("OLDEST") == 4
+    active.append(9)
+    assert [picked("OLDEST"), picked("NEWEST")] == [4, 9]
+    assert len(active) == 2
+
+
+@pytest.mark.parametrize("coverage", [0, 60, 100])
+def test_hybrid_coverages_are_perfect(coverage: int) -> None:
+    config: MazeConfig = {
+        "WIDTH": 21,
+        "HEIGHT": 13,
+        "ENTRY": (0, 0),
+        "EXIT": (20, 12),
+        "HYBRID_COVERAGE": coverage,
+    }
+    random.seed(13)
+    assert_perfect(GENERATORS["ALDOUS_BRODER_WILSON"](config))
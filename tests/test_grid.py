@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+
+from src.a_maze_ing.algorithms.dfs import generate_dfs
+from src.a_maze_ing.core.cell import (
+    EAST,
+    NORTH,
+    SOUTH,
+    WEST,
+    Cell,
+    CellState,
+)
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.io.rendering import render_hex
+
+
+def test_open_wall_updates_both_cells() -> None:
+    grid = MazeGrid(3, 2)
+    index = grid.to_index(1, 0)
+    assert grid.open_wall(index, SOUTH) == grid.to_index(1, 1)
+    assert grid.open_wall(index, EAST) == grid.to_index(2, 0)
+    assert not grid[0][1].south
+    assert not grid[1][1].north
+    assert not grid[0][2].west
+    assert str(grid[0][1]) == "9"
+    assert render_hex(grid) == "F97\nFEF"
+
+    grid.close_wall(index, SOUTH)
+    assert grid.has_wall(index, SOUTH)
+    assert grid.has_wall(grid.to_index(1, 1), NORTH)
+
+
+def test_cell_views_write_through() -> None:
+    grid = MazeGrid(4, 3)
+    cell = grid[2][3]
+    assert cell.coordinates == (3, 2)
+    assert cell == grid.cell(3, 2)
+    assert cell in list(grid[2])
+
+    cell.west = False
+    cell.state = CellState.IN_MAZE
+    index = grid.to_index(3, 2)
+    assert not grid.has_wall(index, WEST)
+    assert grid.get_state(index) is CellState.IN_MAZE
+    assert grid[-1][-1].state is CellState.IN_MAZE
+
+
+def test_from_cells_round_trip() -> None:
+    random.seed(99)
+    config: dict[str, int | tuple[int, int]] = {
+        "WIDTH": 12,
+        "HEIGHT": 9,
+        "ENTRY": (0, 0),
+        "EXIT": (11, 8),
+    }
+    grid = generate_dfs(config)
+    cells = [
+        [
+            Cell(cell.state, cell.north, cell.east, cell.south,
+                 cell.west, cell.coordinates)
+            for cell in row
+        ]
+        for row in grid
+    ]
+    copy = MazeGrid.from_cells(cells)
+    assert copy.walls == grid.walls
+    assert copy.states == grid.states
+    assert render_hex(copy) == render_hex(cells)
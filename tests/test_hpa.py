@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+import src.a_maze_ing.algorithms.a_star as a_star_module
+from src.a_maze_ing.algorithms.hpa import HierarchicalPlanner
+from src.a_maze_ing.core.cell import EAST, SOUTH
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.storage import Typecode, scratch_plane
+from src.a_maze_ing.maze.batch import generate_maze
+from tests.helpers import assert_shortest_paths
+
+
+def _maze(seed: int) -> MazeGrid:
+    return generate_maze({
+        "WIDTH": 21,
+        "HEIGHT": 16,
+        "ENTRY": (0, 0),
+        "ALGORITHM": "KRUSKAL",
+        "PERFECT": False,
+    }, SplitMixRandom(seed))
+
+
+@pytest.mark.parametrize("cluster_size", [1, 4, 6, 32])
+def test_hpa_paths_are_shortest(cluster_size: int) -> None:
+    planner = HierarchicalPlanner(_maze(cluster_size), cluster_size)
+    assert planner.cluster_bounds(planner.columns * planner.rows - 1)[2:] \
+        == (21 - (planner.columns - 1) * cluster_size,
+            16 - (planner.rows - 1) * cluster_size)
+    assert_shortest_paths(planner.grid, planner.path, cluster_size)
+
+
+def test_hpa_refinement_scratch_scales_with_clusters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    grid = generate_maze({
+        "WIDTH": 120,
+        "HEIGHT": 90,
+        "ENTRY": (0, 0),
+        "ALGORITHM": "KRUSKAL",
+        "PERFECT": False,
+    }, SplitMixRandom(2))
+    planner = HierarchicalPlanner(grid, 8)
+    sizes: list[int] = []
+
+    def recording_scratch(
+        count: int,
+        typecode: Typecode = "B",
+        fill: int = 0,
+        grid: MazeGrid | None = None,
+    ) -> memoryview:
+        sizes.append(count)
+        return scratch_plane(count, typecode, fill, grid)
+
+    monkeypatch.setattr(a_star_module, "scratch_plane", recording_scratch)
+    path = planner.path((0, 0), (119, 89))
+    assert path
+    assert sizes
+    assert max(sizes) <= 8 * 8
+
+
+def test_hpa_rebuilds_only_changed_clusters() -> None:
+    planner = HierarchicalPlanner(_maze(3), 5)
+    borders = list(planner.borders)
+    links = list(planner.links)
+    for x, y, wall in ((6, 6, EAST), (4, 7, EAST), (12, 9, SOUTH)):
+        index = planner.grid.to_index(x, y)
+        if planner.grid.walls[index] & wall:
+            planner.open_wall(x, y, wall)
+        else:
+            planner.close_wall(x, y, wall)
+    rebuilt = [
+        cluster for cluster in range(len(borders))
+        if planner.borders[cluster] is not borders[cluster]
+        or planner.links[cluster] is not links[cluster]
+    ]
+    assert rebuilt == [5, 6, 7, 12]
+    assert_shortest_paths(planner.grid, planner.path, 9)
+    fresh = HierarchicalPlanner(planner.grid, 5)
+    assert fresh.borders == planner.borders
+    assert fresh.links == planner.links
+
+
+def test_hpa_rejects_empty_clusters() -> None:
+    with pytest.raises(ValueError):
+        HierarchicalPlanner(MazeGrid(3, 3), 0)
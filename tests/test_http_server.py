@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import queue
+import socket
+import urllib.error
+import urllib.request
+from urllib.parse import urlencode
+
+import pytest
+
+import src.a_maze_ing.io.http_server as http_server
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.io.http_server import (
+    MazeHTTPServer,
+    iter_body,
+    parse_query,
+)
+from src.a_maze_ing.io.rendering import iter_hex_rows
+from src.a_maze_ing.maze.batch import generate_maze
+
+QUERY = urlencode({
+    "WIDTH": 16,
+    "HEIGHT": 11,
+    "ENTRY": "0,0",
+    "EXIT": "15,10",
+    "PERFECT": "False",
+    "ALGORITHM": "KRUSKAL",
+    "seed": 12,
+})
+
+
+def _get(url: str) -> tuple[int, str, str]:
+    try:
+        with urllib.request.urlopen(url) as response:
+            return (response.status,
+                    response.headers["Transfer-Encoding"],
+                    response.read().decode())
+    except urllib.error.HTTPError as error:
+        return error.code, "", error.read().decode()
+
+
+async def _fetch_all(paths: list[str]) -> list[tuple[int, str, str]]:
+    server = MazeHTTPServer(jobs=2)
+    port = await server.start("127.0.0.1", 0)
+    serving = asyncio.create_task(server.serve_forever())
+    try:
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(_get, f"http://127.0.0.1:{port}{path}")
+            for path in paths
+        )))
+    finally:
+        serving.cancel()
+        await server.close()
+
+
+def test_endpoints_stream_mazes_and_metrics() -> None:
+    results = asyncio.run(_fetch_all([
+        f"/generate?{QUERY}",
+        f"/solve?{QUERY}",
+        f"/render?{QUERY}",
+        "/generate?WIDTH=16",
+        "/nowhere",
+    ]))
+    generated, solved, rendered, invalid, missing = results
+
+    config, seed = parse_query(QUERY)
+    maze = generate_maze(config, SplitMixRandom(seed))
+    status, encoding, body = generated
+    assert (status, encoding) == (200, "chunked")
+    rows, trailer = body.split("\n\n")
+    assert rows.split("\n") == list(iter_hex_rows(maze))
+    path = trailer.split("\n")[2]
+    assert json.loads(solved[2]) == {"seed": 12, "path": path}
+    assert rendered[0] == 200
+    assert len(rendered[2].splitlines()) == 2 * 11 + 1
+    assert " S " in rendered[2] and "\033" not in rendered[2]
+    assert invalid[0] == 400
+    assert missing[0] == 404
+
+
+def _get_twice(port: int) -> list[int]:
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    statuses = []
+    for _ in range(2):
+        connection.request("GET", f"/solve?{QUERY}")
+        response = connection.getresponse()
+        response.read()
+        statuses.append(response.status)
+    connection.close()
+    return statuses
+
+
+def test_metrics_count_requests_on_kept_alive_connections() -> None:
+    async def scenario() -> str:
+        server = MazeHTTPServer()
+        port = await server.start("127.0.0.1", 0)
+        serving = asyncio.create_task(server.serve_forever())
+        try:
+            base = f"http://127.0.0.1:{port}"
+            assert await asyncio.to_thread(_get_twice, port) == [200, 200]
+            await asyncio.to_thread(_get, f"{base}/solve?{QUERY}")
+            await asyncio.to_thread(_get, f"{base}/solve?WIDTH=x")
+            return (await asyncio.to_thread(_get, f"{base}/metrics"))[2]
+        finally:
+            serving.cancel()
+            await server.close()
+
+    metrics = asyncio.run(scenario())
+    assert 'maze_requests_total{path="/solve"} 4' in metrics
+    assert 'maze_errors_total{path="/solve"} 1' in metrics
+    assert 'maze_request_latency_seconds_count{path="/solve"} 4' in metrics
+    assert 'quantile="0.99"' in metrics
+
+
+def _exchange(port: int, request: bytes) -> bytes:
+    with socket.create_connection(("127.0.0.1", port)) as connection:
+        connection.sendall(request)
+        received = []
+        while data := connection.recv(65536):
+            received.append(data)
+    return b"".join(received)
+
+
+def _serve(requests: list[bytes]) -> list[bytes]:
+    async def scenario() -> list[bytes]:
+        server = MazeHTTPServer()
+        port = await server.start("127.0.0.1", 0)
+        serving = asyncio.create_task(server.serve_forever())
+        try:
+            return [
+                await asyncio.to_thread(_exchange, port, request)
+                for request in requests
+            ]
+        finally:
+            serving.cancel()
+            await server.close()
+
+    return asyncio.run(scenario())
+
+
+def test_request_bodies_are_skipped_or_close_the_connection() -> None:
+    drained, chunked = _serve([
+        b"POST /solve HTTP/1.1\r\nContent-Length: 5\r\n\r\nhello"
+        b"GET /solve?" + QUERY.encode() + b" HTTP/1.1\r\n"
+        b"Connection: close\r\n\r\n",
+        b"POST /solve HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5\r\nhello\r\n0\r\n\r\n",
+    ])
+    assert drained.count(b"HTTP/1.1 ") == 2
+    assert b"405 Method Not Allowed" in drained
+    assert b"200 OK" in drained
+    assert chunked.count(b"HTTP/1.1 ") == 1
+    assert b"Connection: close" in chunked
+
+
+def test_eller_rows_stream_in_chunks() -> None:
+    query = urlencode({
+        "WIDTH": 400,
+        "HEIGHT": 120,
+        "ENTRY": "0,0",
+        "EXIT": "399,119",
+        "PERFECT": "True",
+        "ALGORITHM": "ELLER",
+        "seed": 3,
+    })
+    (response,) = _serve([
+        b"GET /generate?" + query.encode() + b" HTTP/1.1\r\n"
+        b"Connection: close\r\n\r\n"
+    ])
+    head, _, chunked = response.partition(b"\r\n\r\n")
+    assert b"200 OK" in head
+    chunks = []
+    while True:
+        size, _, chunked = chunked.partition(b"\r\n")
+        length = int(size, 16)
+        if length == 0:
+            break
+        chunks.append(chunked[:length])
+        chunked = chunked[length + 2:]
+    assert len(chunks) > 1
+    body = b"".join(chunks).decode()
+
+    config, seed = parse_query(query)
+    assert body.splitlines() == list(iter_body("/generate", config, seed))
+    maze = generate_maze(config, SplitMixRandom(seed))
+    assert body.split("\n\n")[0].split("\n") == list(iter_hex_rows(maze))
+
+
+def test_worker_waits_for_acknowledgements(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    query = urlencode({
+        "WIDTH": 400,
+        "HEIGHT": 300,
+        "ENTRY": "0,0",
+        "EXIT": "399,299",
+        "PERFECT": "True",
+        "ALGORITHM": "ELLER",
+    })
+    config, seed = parse_query(query)
+    sent: queue.Queue[tuple[int, str, object]] = queue.Queue()
+    acks: queue.Queue[bool] = queue.Queue()
+    acks.put(True)
+    acks.put(False)
+    monkeypatch.setattr(http_server, "_worker_queue", sent)
+    http_server._stream_body(7, acks, "/generate", config, seed)
+    messages = [sent.get_nowait() for _ in range(sent.qsize())]
+    assert [kind for _, kind, _ in messages] == \
+        ["lines"] * (http_server._WINDOW + 1)
+    assert acks.empty()
+
+
+def test_disconnected_client_stops_the_stream() -> None:
+    query = urlencode({
+        "WIDTH": 1000,
+        "HEIGHT": 1000,
+        "ENTRY": "0,0",
+        "EXIT": "999,999",
+        "PERFECT": "True",
+        "ALGORITHM": "ELLER",
+    })
+
+    def read_head(port: int) -> bytes:
+        with socket.create_connection(("127.0.0.1", port)) as connection:
+            connection.sendall(b"GET /generate?" + query.encode()
+                               + b" HTTP/1.1\r\n\r\n")
+            return connection.recv(1024)
+
+    async def scenario() -> bytes:
+        server = MazeHTTPServer()
+        port = await server.start("127.0.0.1", 0)
+        serving = asyncio.create_task(server.serve_forever())
+        try:
+            return await asyncio.to_thread(read_head, port)
+        finally:
+            serving.cancel()
+            await asyncio.wait_for(server.close(), 30)
+
+    assert asyncio.run(scenario()).startswith(b"HTTP/1.1 200 OK")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from src.a_maze_ing.algorithms.junction_graph import (
+    JunctionGraph,
+    junction_graph,
+)
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.maze.batch import generate_maze
+from tests.helpers import assert_shortest_paths
+
+
+@pytest.mark.parametrize("algorithm", ["DFS", "KRUSKAL", "PRIM"])
+@pytest.mark.parametrize("perfect", [True, False])
+def test_junction_graph_paths_are_shortest(
+        algorithm: str,
+        perfect: bool
+) -> None:
+    grid = generate_maze({
+        "WIDTH": 19,
+        "HEIGHT": 14,
+        "ENTRY": (0, 0),
+        "ALGORITHM": algorithm,
+        "PERFECT": perfect,
+    }, SplitMixRandom(21))
+    graph = JunctionGraph(grid)
+    assert graph.compression_ratio > 1
+    assert_shortest_paths(grid, graph.path, 4, 150, graph.distance)
+
+
+def test_junction_graph_handles_rings() -> None:
+    grid = MazeGrid(4, 3)
+    # A closed 3x2 ring of corridor cells, and one isolated cell.
+    for x, y, wall in ((0, 0, 2), (1, 0, 2), (2, 0, 4), (0, 0, 4),
+                       (0, 1, 2), (1, 1, 2)):
+        grid.open_wall(grid.to_index(x, y), wall)
+    graph = junction_graph(grid)
+    assert len(graph.nodes) == 1
+    assert graph.compression_ratio == 6
+    assert graph.path((1, 0), (2, 1)) == "ES"
+    assert graph.path((0, 1), (1, 0)) == "NE"
+    assert graph.path((2, 1), (0, 0)) == "WWN"
+    assert graph.distance((0, 0), (0, 1)) == 1
+    assert graph.path((0, 0), (3, 2)) == ""
+    assert graph.distance((0, 0), (3, 2)) == -1
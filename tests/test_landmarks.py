@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from src.a_maze_ing.algorithms.a_star import (
+    SearchEvent,
+    SearchEventKind,
+    a_star,
+)
+from src.a_maze_ing.algorithms.landmarks import Landmarks, distance_typecode
+from src.a_maze_ing.core.cell import EAST
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.maze.batch import generate_maze
+from tests.helpers import bfs_distance, wall_rows
+
+
+def _maze(perfect: bool) -> MazeGrid:
+    return generate_maze({
+        "WIDTH": 30,
+        "HEIGHT": 20,
+        "ENTRY": (0, 0),
+        "ALGORITHM": "DFS",
+        "PERFECT": perfect,
+    }, SplitMixRandom(6))
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_landmark_heuristic_is_a_lower_bound(perfect: bool) -> None:
+    grid = _maze(perfect)
+    landmarks = Landmarks(grid, 4, SplitMixRandom(1))
+    rows = wall_rows(grid)
+    assert len(landmarks.cells) == 4
+    assert landmarks.nbytes == 4 * grid.size * 2
+    estimate = landmarks.heuristic((29, 19))
+    for index in range(0, grid.size, 7):
+        distance = bfs_distance(rows, grid.to_coordinates(index), (29, 19))
+        if distance is not None:
+            assert estimate(index) <= distance
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_landmarks_reduce_expansions(perfect: bool) -> None:
+    grid = _maze(perfect)
+    landmarks = Landmarks(grid, 6, SplitMixRandom(2))
+    expanded = {"manhattan": 0, "landmarks": 0}
+
+    def counter(name: str) -> Callable[[list[SearchEvent]], None]:
+        def on_step(events: list[SearchEvent]) -> None:
+            expanded[name] += sum(
+                event.kind is SearchEventKind.CLOSED for event in events
+            )
+        return on_step
+
+    rng = SplitMixRandom(3)
+    for _ in range(20):
+        entry = (rng.randrange(30), rng.randrange(20))
+        exit_pos = (rng.randrange(30), rng.randrange(20))
+        path = a_star(entry, exit_pos, grid, counter("manhattan"))
+        assert len(a_star(
+            entry, exit_pos, grid, counter("landmarks"),
+            heuristic=landmarks.heuristic(exit_pos)
+        )) == len(path)
+    assert expanded["landmarks"] < expanded["manhattan"]
+
+
+def test_landmarks_stop_when_every_cell_is_one() -> None:
+    grid = MazeGrid(3, 1)
+    grid.open_wall(0, EAST)
+    landmarks = Landmarks(grid, 5)
+    assert sorted(landmarks.cells) == [0, 1]
+    assert landmarks.heuristic((0, 0))(2) == 2
+    with pytest.raises(ValueError):
+        Landmarks(grid, 0)
+
+
+def test_distance_typecode() -> None:
+    assert distance_typecode(2**16 - 1) == "H"
+    assert distance_typecode(2**16) == "I"
+    assert distance_typecode(2**32) == "Q"
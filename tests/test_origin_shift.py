@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.a_maze_ing.algorithms.dfs import generate_dfs
+from src.a_maze_ing.core.cell import (
+    EAST,
+    NORTH,
+    OPPOSITE_WALLS,
+    SOUTH,
+    WEST,
+)
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.maze.flaw import flaw_maze
+from src.a_maze_ing.maze.origin_shift import OriginShift
+from tests.helpers import assert_perfect
+
+
+def _config() -> MazeConfig:
+    return {"WIDTH": 15, "HEIGHT": 11, "ENTRY": (0, 0), "EXIT": (14, 10)}
+
+
+def test_origin_shift_keeps_maze_perfect() -> None:
+    random.seed(8)
+    grid = generate_dfs(_config())
+    before = bytes(grid.walls)
+    engine = OriginShift(grid, grid.to_index(0, 0))
+    changes = engine.shift(2000)
+    assert changes
+    assert bytes(grid.walls) != before
+    assert_perfect(grid)
+
+
+def test_origin_shift_reports_every_toggled_wall() -> None:
+    random.seed(3)
+    grid = generate_dfs(_config())
+    replay = bytearray(grid.walls)
+    engine = OriginShift(grid)
+    offsets = {NORTH: -15, SOUTH: 15, WEST: -1, EAST: 1}
+    for index, wall in engine.shift(500):
+        replay[index] ^= wall
+        replay[index + offsets[wall]] ^= OPPOSITE_WALLS[wall]
+    assert replay == grid.walls
+
+
+def test_origin_shift_rejects_imperfect_maze() -> None:
+    random.seed(1)
+    grid = generate_dfs(_config())
+    flaw_maze(grid)
+    with pytest.raises(ValueError):
+        OriginShift(grid)
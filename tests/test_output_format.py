@@ -48,3 +48,29 @@ def test_output_file_format_and_path_validity(
     shortest = bfs_distance(grid, entry, exit_pos)
     assert shortest is not None
     assert len(path) == shortest
+
+
+def test_streamed_eller_output_is_valid(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output_path = tmp_path / "maze_output.txt"
+    config_path = write_config(
+        tmp_path,
+        width=21,
+        height=40,
+        entry=(0, 0),
+        exit_pos=(20, 39),
+        output_file=output_path,
+        perfect=True,
+        seed=77,
+        algorithm="ELLER",
+    )
+
+    monkeypatch.setattr("sys.argv", ["a_maze_ing.py", str(config_path)])
+    assert main() == 0
+
+    grid, entry, exit_pos, path = parse_output_file(output_path)
+    assert grid_bounds(grid) == (21, 40)
+    assert path_is_valid(grid, entry, exit_pos, path)
+    assert len(path) == bfs_distance(grid, entry, exit_pos)
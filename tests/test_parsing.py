@@ -105,6 +105,50 @@ def test_invalid_algorithm_is_rejected(tmp_path: Path) -> None:
         parse_config(str(config_path))
 
 
+@pytest.mark.parametrize("mix", ["NEWEST:x", "SIDEWAYS:3", "RANDOM:0"])
+def test_invalid_growing_tree_mix_is_rejected(
+    tmp_path: Path,
+    mix: str,
+) -> None:
+    config_path = _write_raw_config(
+        tmp_path,
+        [
+            "WIDTH=5",
+            "HEIGHT=5",
+            "ENTRY=0,0",
+            "EXIT=4,4",
+            "OUTPUT_FILE=maze.txt",
+            "PERFECT=True",
+            "ALGORITHM=GROWING_TREE",
+            f"GROWING_TREE_MIX={mix}",
+        ],
+    )
+    with pytest.raises(ParsingError):
+        parse_config(str(config_path))
+
+
+@pytest.mark.parametrize("coverage", ["-1", "101", "0.5"])
+def test_invalid_hybrid_coverage_is_rejected(
+    tmp_path: Path,
+    coverage: str,
+) -> None:
+    config_path = _write_raw_config(
+        tmp_path,
+        [
+            "WIDTH=5",
+            "HEIGHT=5",
+            "ENTRY=0,0",
+            "EXIT=4,4",
+            "OUTPUT_FILE=maze.txt",
+            "PERFECT=True",
+            "ALGORITHM=ALDOUS_BRODER_WILSON",
+            f"HYBRID_COVERAGE={coverage}",
+        ],
+    )
+    with pytest.raises(ParsingError):
+        parse_config(str(config_path))
+
+
 def test_entry_exit_checks(tmp_path: Path) -> None:
     config_path = _write_raw_config(
         tmp_path,
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import random
 
-from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.a_star import (
+    SearchEvent,
+    SearchEventKind,
+    SearchView,
+    a_star,
+)
 from src.a_maze_ing.algorithms.dfs import generate_dfs
-from tests.helpers import bfs_distance
+from src.a_maze_ing.core.cell import Cell
+from src.a_maze_ing.core.grid import MazeGrid
+from tests.helpers import bfs_distance, path_is_valid
 
 
 def test_a_star_matches_shortest_path() -> None:
@@ -25,3 +32,81 @@ def test_a_star_matches_shortest_path() -> None:
     shortest = bfs_distance(hex_grid, entry, exit_pos)
     assert shortest is not None
     assert len(path) == shortest
+
+
+def test_a_star_accepts_cell_lists_and_reports_no_path() -> None:
+    random.seed(5)
+    config: dict[str, int | tuple[int, int]] = {
+        "WIDTH": 10,
+        "HEIGHT": 8,
+        "ENTRY": (0, 0),
+        "EXIT": (9, 7),
+    }
+    grid = generate_dfs(config)
+    cells = [
+        [
+            Cell(cell.state, cell.north, cell.east, cell.south,
+                 cell.west, cell.coordinates)
+            for cell in row
+        ]
+        for row in grid
+    ]
+    assert a_star((0, 0), (9, 7), cells) == a_star((0, 0), (9, 7), grid)
+
+    closed = MazeGrid(4, 4)
+    assert a_star((0, 0), (3, 3), closed) == ""
+
+
+def test_a_star_events_rebuild_the_search() -> None:
+    random.seed(11)
+    config: dict[str, int | tuple[int, int]] = {
+        "WIDTH": 12,
+        "HEIGHT": 9,
+        "ENTRY": (0, 0),
+        "EXIT": (11, 8),
+    }
+    grid = generate_dfs(config)
+    hex_grid = [[int(str(cell), 16) for cell in row] for row in grid]
+    view = SearchView()
+    batches: list[list[SearchEvent]] = []
+
+    def on_step(events: list[SearchEvent]) -> None:
+        batches.append(events)
+        previous = list(view.path)
+        view.apply(events)
+        assert view.current is not None
+        assert view.current not in view.open_set
+        left, joined = view.follow_current()
+        assert view.path == view.path_to(view.current)
+        assert previous[:len(previous) - len(left)] + joined == view.path
+
+    path = a_star((0, 0), (11, 8), grid, on_step=on_step)
+    assert batches[0][0] == SearchEvent(SearchEventKind.OPENED, (0, 0))
+    assert batches[-1][-1] == SearchEvent(SearchEventKind.CLOSED, (11, 8))
+    assert view.current == (11, 8)
+    assert not view.open_set & view.closed_set
+
+    nodes = view.path_to((11, 8))
+    assert nodes[0] == (0, 0)
+    assert len(nodes) == len(path) + 1
+    for closed in view.closed_set:
+        partial = view.path_to(closed)
+        steps = "".join(
+            {(0, -1): "N", (0, 1): "S", (-1, 0): "W", (1, 0): "E"}[
+                (b[0] - a[0], b[1] - a[1])
+            ]
+            for a, b in zip(partial, partial[1:])
+        )
+        assert path_is_valid(hex_grid, (0, 0), closed, steps)
+
+
+def test_a_star_stays_in_bounds() -> None:
+    grid = MazeGrid(4, 3)
+    # U-shaped corridor (1,1) -> (1,0) -> (2,0) -> (2,1) and a direct wall.
+    for x, y, wall in ((1, 1, 1), (1, 0, 2), (2, 0, 4), (1, 1, 2)):
+        grid.open_wall(grid.to_index(x, y), wall)
+    assert a_star((1, 1), (2, 1), grid) == "E"
+    grid.close_wall(grid.to_index(1, 1), 2)
+    assert a_star((1, 1), (2, 1), grid) == "NES"
+    assert a_star((1, 1), (2, 1), grid, bounds=(1, 1, 2, 2)) == ""
+    assert a_star((1, 1), (2, 1), grid, bounds=(1, 0, 2, 2)) == "NES"
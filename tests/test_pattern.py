@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import logging
 import random
 
 import pytest
 
 from src.a_maze_ing.algorithms.dfs import generate_dfs
+from src.a_maze_ing.algorithms.division import generate_division
+from src.a_maze_ing.algorithms.ft_pattern import where_is_ft_pattern
+from src.a_maze_ing.algorithms.grid_utils import warn_pattern_skipped
+from src.a_maze_ing.core.cell import ALL_WALLS
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.rng import SplitMixRandom
 from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.maze.batch import generate_many
 
 
-def test_small_maze_prints_pattern_warning(
-    capsys: pytest.CaptureFixture[str],
+def test_small_maze_logs_pattern_warning_once(
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    import src.a_maze_ing.algorithms.ft_pattern as ft_pattern
-
-    ft_pattern._FT_PATTERN_WARNED = False
     config: MazeConfig = {
         "WIDTH": 5,
         "HEIGHT": 5,
@@ -21,6 +26,37 @@ def test_small_maze_prints_pattern_warning(
         "EXIT": (4, 4),
     }
     random.seed(123)
-    generate_dfs(config)
-    out = capsys.readouterr().out
-    assert "Maze too small" in out
+    with caplog.at_level(logging.WARNING):
+        generate_dfs(config)
+    assert not caplog.records
+
+    with caplog.at_level(logging.WARNING):
+        generate_many([config] * 3, seed=1, workers=2)
+    assert [record.levelno for record in caplog.records] == \
+        [logging.WARNING]
+    assert "Maze too small" in caplog.text
+
+    caplog.clear()
+    large: MazeConfig = {**config, "WIDTH": 9, "HEIGHT": 7}
+    with caplog.at_level(logging.WARNING):
+        assert not warn_pattern_skipped([large])
+        assert warn_pattern_skipped([large, config])
+    assert len(caplog.records) == 1
+
+
+def test_division_never_opens_pattern() -> None:
+    config: MazeConfig = {
+        "WIDTH": 23,
+        "HEIGHT": 19,
+        "ENTRY": (0, 0),
+        "EXIT": (22, 18),
+    }
+    pattern = where_is_ft_pattern([[None] * 23 for _ in range(19)])
+    assert pattern
+
+    def on_step(grid: MazeGrid) -> None:
+        for x, y in pattern:
+            assert grid.walls[grid.to_index(x, y)] == ALL_WALLS
+
+    for seed in range(10):
+        generate_division(config, on_step=on_step, rng=SplitMixRandom(seed))
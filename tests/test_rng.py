@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.a_maze_ing.algorithms.registry import GENERATORS
+from src.a_maze_ing.core.rng import ChoiceBuffer, SplitMixRandom
+from src.a_maze_ing.maze.flaw import flaw_maze
+
+
+def test_jump_matches_drawing() -> None:
+    drawn = SplitMixRandom(42)
+    for _ in range(1000):
+        drawn.getrandbits(64)
+    jumped = SplitMixRandom(42)
+    jumped.jump(1000)
+    assert [drawn.getrandbits(64) for _ in range(10)] == \
+        [jumped.getrandbits(64) for _ in range(10)]
+
+
+def test_state_and_spawned_streams_are_reproducible() -> None:
+    rng = SplitMixRandom(5)
+    rng.random()
+    state = rng.getstate()
+    first = [rng.randrange(1000) for _ in range(20)]
+    rng.setstate(state)
+    assert [rng.randrange(1000) for _ in range(20)] == first
+
+    worker = rng.spawn(3)
+    assert worker.getstate() == SplitMixRandom(5).spawn(3).getstate()
+    assert worker.getstate() != rng.spawn(4).getstate()
+
+
+@pytest.mark.parametrize("bound", [1, 2, 3, 4, 7, 256, 257, 1000, 70000])
+def test_choice_buffer_is_uniform(bound: int) -> None:
+    draws = ChoiceBuffer(SplitMixRandom(bound))
+    buckets = min(bound, 50)
+    samples = 400 * buckets
+    counts = [0] * buckets
+    sizes = [0] * buckets
+    for value in range(bound):
+        sizes[value * buckets // bound] += 1
+    for _ in range(samples):
+        value = draws.below(bound)
+        assert 0 <= value < bound
+        counts[value * buckets // bound] += 1
+    for count, size in zip(counts, sizes):
+        expected = samples * size / bound
+        assert abs(count - expected) < 5 * expected ** 0.5
+
+
+@pytest.mark.parametrize("algorithm", sorted(GENERATORS))
+def test_generators_only_use_their_rng(algorithm: str) -> None:
+    config = {"WIDTH": 15, "HEIGHT": 11, "ENTRY": (0, 0)}
+    generator = GENERATORS[algorithm]
+    mazes = []
+    for global_seed in (1, 2):
+        random.seed(global_seed)
+        rng = SplitMixRandom(9)
+        grid = generator(config, rng=rng)
+        flaw_maze(grid, rng=rng)
+        mazes.append(bytes(grid.walls))
+    assert mazes[0] == mazes[1]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from src.a_maze_ing.core.parsing import ParsingError
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.io.rendering import iter_hex_rows
+from src.a_maze_ing.io.stdio_server import parse_request, serve_stdio
+from src.a_maze_ing.maze.batch import generate_maze
+
+
+def _request(request_id: object, seed: int, **values: object) -> str:
+    config = {
+        "WIDTH": 14,
+        "HEIGHT": 10,
+        "ENTRY": [0, 0],
+        "EXIT": [13, 9],
+        "PERFECT": True,
+        **values,
+    }
+    return json.dumps({"id": request_id, "seed": seed, "config": config})
+
+
+def test_responses_are_tagged_by_request_id() -> None:
+    valid = [
+        _request(index, index, ALGORITHM=algorithm)
+        for index, algorithm in enumerate(["DFS", "prim", "ELLER", "WILSON"])
+    ]
+    lines = valid[:2] + [
+        _request("bad", 1, HYBRID_COVERAGE=101), "not json"
+    ] + valid[2:]
+    output = io.StringIO()
+    serve_stdio(io.StringIO("\n".join(lines) + "\n"), output, jobs=2,
+                max_pending=3)
+
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    by_id = {response["id"]: response for response in responses}
+    assert len(responses) == 6
+    assert "HYBRID_COVERAGE" in by_id["bad"]["error"]
+    assert "error" in by_id[None]
+    for index, line in enumerate(valid):
+        config, seed = parse_request(json.loads(line))
+        maze = generate_maze(config, SplitMixRandom(seed))
+        assert by_id[index]["rows"] == list(iter_hex_rows(maze))
+        assert by_id[index]["path"]
+
+
+def test_requests_follow_config_file_rules() -> None:
+    with pytest.raises(ParsingError):
+        parse_request(json.loads(_request(1, 1, ENTRY=[13, 9])))
+    with pytest.raises(ParsingError):
+        parse_request(json.loads(_request(1, 1, ENTRY=[4, 3])))
+    with pytest.raises(ParsingError):
+        parse_request({"config": {"WIDTH": 5}})
+    config, seed = parse_request(json.loads(_request(1, 9, OUTPUT_FILE="x")))
+    assert seed == 9
+    assert "OUTPUT_FILE" not in config
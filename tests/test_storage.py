@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from a_maze_ing import main
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.dfs import generate_dfs
+from src.a_maze_ing.algorithms.kruskal import generate_kruskal
+from src.a_maze_ing.algorithms.wilson import generate_wilson
+from src.a_maze_ing.core.grid import MazeGrid
+from src.a_maze_ing.core.parsing import ParsingError, parse_config
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.storage import (
+    MappedMazeGrid,
+    parse_storage_spec,
+    scratch_plane,
+)
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.io.rendering import render_hex
+from tests.helpers import parse_output_file, path_is_valid, write_config
+
+
+def test_parse_storage_spec() -> None:
+    assert parse_storage_spec(None) is None
+    assert parse_storage_spec("memory") is None
+    assert parse_storage_spec("mmap:/tmp/maze.grid") == "/tmp/maze.grid"
+    with pytest.raises(ValueError):
+        parse_storage_spec("mmap:")
+    with pytest.raises(ValueError):
+        parse_storage_spec("disk")
+
+
+def test_mmap_grid_matches_memory_grid(tmp_path: Path) -> None:
+    config: MazeConfig = {
+        "WIDTH": 23,
+        "HEIGHT": 17,
+        "ENTRY": (0, 0),
+        "EXIT": (22, 16),
+    }
+    random.seed(31)
+    expected = render_hex(generate_dfs(config))
+
+    grid_path = tmp_path / "maze.grid"
+    random.seed(31)
+    mapped = generate_dfs({**config, "STORAGE": f"mmap:{grid_path}"})
+    assert isinstance(mapped, MappedMazeGrid)
+    assert render_hex(mapped) == expected
+    mapped.close()
+
+    reopened = MappedMazeGrid(str(grid_path), 23, 17, create=False)
+    assert render_hex(reopened) == expected
+    reopened.close()
+
+
+def test_invalid_storage_is_rejected(tmp_path: Path) -> None:
+    config_path = write_config(
+        tmp_path,
+        width=5,
+        height=5,
+        entry=(0, 0),
+        exit_pos=(4, 4),
+        output_file=tmp_path / "out.txt",
+        perfect=True,
+        seed=1,
+    )
+    with config_path.open("a", encoding="utf-8") as f:
+        f.write("STORAGE=tape\n")
+    with pytest.raises(ParsingError):
+        parse_config(str(config_path))
+
+
+def test_cli_storage_switch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output_path = tmp_path / "maze_output.txt"
+    config_path = write_config(
+        tmp_path,
+        width=15,
+        height=11,
+        entry=(0, 0),
+        exit_pos=(14, 10),
+        output_file=output_path,
+        perfect=False,
+        seed=4242,
+    )
+    grid_path = tmp_path / "maze.grid"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["a_maze_ing.py", str(config_path), f"--storage=mmap:{grid_path}"],
+    )
+    assert main() == 0
+    assert grid_path.exists()
+    grid, entry, exit_pos, path = parse_output_file(output_path)
+    assert path_is_valid(grid, entry, exit_pos, path)
+
+
+def test_scratch_plane_follows_grid_storage(tmp_path: Path) -> None:
+    in_memory = scratch_plane(5, "i", -1)
+    assert isinstance(in_memory.obj, bytearray)
+    assert list(in_memory) == [-1] * 5
+
+    mapped_grid = MappedMazeGrid(str(tmp_path / "maze.grid"), 4, 3)
+    mapped = scratch_plane(3, "q", 7, mapped_grid)
+    assert not isinstance(mapped.obj, bytearray)
+    assert list(mapped) == [7] * 3
+    mapped[1] = -2
+    assert list(mapped) == [7, -2, 7]
+    assert list(scratch_plane(4, grid=mapped_grid)) == [0] * 4
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["maze.grid"]
+    mapped_grid.close()
+
+
+@pytest.mark.parametrize("generate", [generate_kruskal, generate_wilson])
+def test_mapped_scratch_keeps_outputs(
+    tmp_path: Path,
+    generate: Callable[..., MazeGrid],
+) -> None:
+    config: MazeConfig = {
+        "WIDTH": 19,
+        "HEIGHT": 13,
+        "ENTRY": (0, 0),
+        "EXIT": (18, 12),
+    }
+    expected_grid = generate(config, rng=SplitMixRandom(5))
+    expected_path = a_star((0, 0), (18, 12), expected_grid)
+
+    mapped_config: MazeConfig = {
+        **config,
+        "STORAGE": f"mmap:{tmp_path / 'maze.grid'}",
+    }
+    mapped = generate(mapped_config, rng=SplitMixRandom(5))
+    assert isinstance(mapped, MappedMazeGrid)
+    assert render_hex(mapped) == render_hex(expected_grid)
+    assert a_star((0, 0), (18, 12), mapped) == expected_path
+    mapped.close()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.a_maze_ing.algorithms.tiled import generate_tiled
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.io.rendering import render_hex
+from tests.helpers import assert_perfect
+
+
+@pytest.mark.parametrize("algorithm", ["DFS", "WILSON", "SIDEWINDER"])
+def test_tiled_maze_is_perfect_and_keeps_pattern(algorithm: str) -> None:
+    config: MazeConfig = {
+        "WIDTH": 37,
+        "HEIGHT": 29,
+        "ENTRY": (0, 0),
+        "EXIT": (36, 28),
+        "ALGORITHM": algorithm,
+        "TILE_SIZE": 8,
+    }
+    random.seed(2024)
+    pattern_positions = assert_perfect(generate_tiled(config))
+    assert pattern_positions
+
+
+def test_tiled_maze_does_not_depend_on_worker_count() -> None:
+    config: dict[str, int | tuple[int, int] | str | bool] = {
+        "WIDTH": 30,
+        "HEIGHT": 20,
+        "ENTRY": (0, 0),
+        "EXIT": (29, 19),
+        "ALGORITHM": "KRUSKAL",
+        "TILE_SIZE": 7,
+        "WORKERS": 1,
+    }
+    random.seed(5)
+    single = render_hex(generate_tiled(config))
+    config["WORKERS"] = 2
+    random.seed(5)
+    pooled = render_hex(generate_tiled(config))
+    assert single == pooled
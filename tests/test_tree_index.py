@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from src.a_maze_ing.algorithms.a_star import a_star
+from src.a_maze_ing.algorithms.ft_pattern import ft_pattern_cells
+from src.a_maze_ing.algorithms.tree_index import MazePaths, TreeIndex
+from src.a_maze_ing.core.rng import SplitMixRandom
+from src.a_maze_ing.core.types import MazeConfig
+from src.a_maze_ing.maze.batch import generate_maze
+from tests.helpers import assert_shortest_paths
+
+
+def _maze_config(algorithm: str, perfect: bool = True) -> MazeConfig:
+    return {
+        "WIDTH": 17,
+        "HEIGHT": 13,
+        "ENTRY": (0, 0),
+        "EXIT": (16, 12),
+        "ALGORITHM": algorithm,
+        "PERFECT": perfect,
+    }
+
+
+@pytest.mark.parametrize("algorithm", ["DFS", "KRUSKAL", "WILSON"])
+def test_tree_index_matches_a_star(algorithm: str) -> None:
+    grid = generate_maze(_maze_config(algorithm), SplitMixRandom(11))
+    index = TreeIndex(grid)
+    assert_shortest_paths(grid, index.path, 3, 200, index.distance)
+
+
+def test_tree_index_pattern_cells_are_unreachable() -> None:
+    grid = generate_maze(_maze_config("DFS"), SplitMixRandom(5))
+    index = TreeIndex(grid)
+    cell = next(iter(ft_pattern_cells(grid.width, grid.height)))
+    assert index.distance((0, 0), cell) == -1
+    assert index.path((0, 0), cell) == ""
+
+
+def test_tree_index_rejects_loops() -> None:
+    grid = generate_maze(_maze_config("DFS", False), SplitMixRandom(5))
+    with pytest.raises(ValueError):
+        TreeIndex(grid)
+
+
+def test_maze_paths_falls_back_to_junction_graph() -> None:
+    grid = generate_maze(_maze_config("KRUSKAL", False), SplitMixRandom(8))
+    paths = MazePaths(grid)
+    path = paths.path((0, 0), (16, 12))
+    assert paths.tree is None
+    assert paths.graph is not None
+    assert len(path) == len(a_star((0, 0), (16, 12), grid))
+    assert paths.distance((0, 0), (16, 12)) == len(path)
+    perfect = generate_maze(_maze_config("DFS"), SplitMixRandom(8))
+    assert MazePaths(perfect).tree is not None
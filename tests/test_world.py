@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+
+from src.a_maze_ing.algorithms.ft_pattern import ft_pattern_cells
+from src.a_maze_ing.algorithms.world import MazeWorld
+from src.a_maze_ing.core.cell import EAST, NORTH, SOUTH, WEST
+from tests.helpers import reachable_nodes
+
+
+def test_tiles_do_not_depend_on_generation_order() -> None:
+    world = MazeWorld(seed=7, tile_size=10, algorithm="KRUSKAL")
+    far = bytes(world.tile(-1000, 52).walls)
+    near = bytes(world.tile(0, 0).walls)
+
+    other = MazeWorld(seed=7, tile_size=10, algorithm="KRUSKAL")
+    random.seed(1)
+    assert bytes(other.tile(0, 0).walls) == near
+    assert bytes(other.tile(-1000, 52).walls) == far
+    assert bytes(MazeWorld(8, 10).tile(0, 0).walls) != near
+
+
+def test_neighboring_tiles_agree_on_shared_walls() -> None:
+    world = MazeWorld(seed=3, tile_size=6, cache_size=2)
+    for tile_x, tile_y in [(0, 0), (-5, 9), (40, -3)]:
+        tile = world.tile(tile_x, tile_y)
+        east = world.tile(tile_x + 1, tile_y)
+        south = world.tile(tile_x, tile_y + 1)
+        for i in range(6):
+            assert bool(tile[i][5].walls & EAST) == \
+                bool(east[i][0].walls & WEST)
+            assert bool(tile[5][i].walls & SOUTH) == \
+                bool(south[0][i].walls & NORTH)
+        assert len(world._cache) <= 2
+
+
+def test_region_is_connected_across_tiles() -> None:
+    world = MazeWorld(seed=11, tile_size=9, algorithm="WILSON")
+    region = world.region(-9, -9, 27, 27)
+    hex_grid = [[cell.walls for cell in row] for row in region]
+    blocked = {
+        (tile_x * 9 + x, tile_y * 9 + y)
+        for tile_x in range(3)
+        for tile_y in range(3)
+        for x, y in ft_pattern_cells(9, 9)
+    }
+    reachable = reachable_nodes(hex_grid, (0, 0), blocked)
+    assert len(reachable) == 27 * 27 - len(blocked)
+    assert bytes(region.walls[:9]) == bytes(world.tile(-1, -1).walls[:9])